@@ -1,12 +1,9 @@
-import logging
-import logging.config
+from __future__ import annotations
 
-from colorama import init
-
-from commitizen.cz.base import BaseCommitizen
-
-init()
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from commitizen.cz.base import BaseCommitizen
 
 LOGGING = {
     "version": 1,
@@ -24,6 +21,14 @@ LOGGING = {
     },
 }
 
-logging.config.dictConfig(LOGGING)
-
 __all__ = ["BaseCommitizen"]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP-562: importing `commitizen.cz` discovers every installed plugin,
+    # so only do it when `BaseCommitizen` is actually requested.
+    if name == "BaseCommitizen":
+        from commitizen.cz.base import BaseCommitizen
+
+        return BaseCommitizen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
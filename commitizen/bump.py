@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import os
 import re
+import shutil
+import tempfile
 from collections import OrderedDict
+from contextlib import suppress
 from glob import iglob
 from logging import getLogger
 from string import Template
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from commitizen.defaults import BUMP_MESSAGE, MAJOR, MINOR, PATCH
-from commitizen.exceptions import CurrentVersionNotFoundError
-from commitizen.git import GitCommit, smart_open
+from commitizen.exceptions import CurrentVersionNotFoundError, GitCommandError
+from commitizen.git import GitCommit, find_git_project_root, smart_open
+from commitizen.tracked_files import TrackedFiles, has_magic
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Iterable
 
     from commitizen.version_schemes import Increment, VersionProtocol
 
@@ -21,9 +25,12 @@ VERSION_TYPES = [None, PATCH, MINOR, MAJOR]
 
 logger = getLogger("commitizen")
 
+# Version files at least this big are streamed instead of being read in memory
+STREAMING_THRESHOLD = 16 * 1024 * 1024
+
 
 def find_increment(
-    commits: list[GitCommit], regex: str, increments_map: dict | OrderedDict
+    commits: Iterable[GitCommit], regex: str, increments_map: dict | OrderedDict
 ) -> Increment | None:
     if isinstance(increments_map, dict):
         increments_map = OrderedDict(increments_map)
@@ -62,6 +69,15 @@ def find_increment(
     return cast("Increment", increment)
 
 
+class VersionFileUpdate(NamedTuple):
+    """The replacement of the version in one of the `version_files`."""
+
+    path: str
+    # Occurrences of the version replaced in the file
+    matches: int
+    changed: bool
+
+
 def update_version_in_files(
     current_version: str,
     new_version: str,
@@ -69,6 +85,7 @@ def update_version_in_files(
     *,
     check_consistency: bool,
     encoding: str,
+    include_untracked: bool = True,
 ) -> list[str]:
     """Change old version to the new one in every file given.
 
@@ -78,56 +95,168 @@ def update_version_in_files(
 
     Returns the list of updated files.
     """
-    updated_files = []
-
-    for path, pattern in _resolve_files_and_regexes(version_files, current_version):
-        current_version_found = False
-        bumped_lines = []
-
-        with open(path, encoding=encoding) as version_file:
-            for line in version_file:
-                bumped_line = (
-                    line.replace(current_version, new_version)
-                    if pattern.search(line)
-                    else line
+    return [
+        update.path
+        for update in replace_version_in_files(
+            current_version,
+            new_version,
+            version_files,
+            check_consistency=check_consistency,
+            encoding=encoding,
+            include_untracked=include_untracked,
+        )
+    ]
+
+
+def replace_version_in_files(
+    current_version: str,
+    new_version: str,
+    version_files: Iterable[str],
+    *,
+    check_consistency: bool,
+    encoding: str,
+    include_untracked: bool = True,
+) -> list[VersionFileUpdate]:
+    """Change old version to the new one in every file given, reporting each file.
+
+    All the regexes given for a file are applied in a single pass over it,
+    and files whose content doesn't change are not written.
+    Files bigger than `STREAMING_THRESHOLD` are rewritten line by line into a
+    temporary file, which atomically replaces the original one.
+    """
+    updates = []
+    for path, patterns in _resolve_files_and_regexes(
+        version_files, current_version, include_untracked=include_untracked
+    ):
+        replacer = _VersionReplacer(current_version, new_version, patterns)
+        if os.path.getsize(path) >= STREAMING_THRESHOLD:
+            _stream_version_file(
+                path, replacer, check_consistency=check_consistency, encoding=encoding
+            )
+        else:
+            with open(path, encoding=encoding) as version_file:
+                bumped_lines = [replacer(line) for line in version_file]
+
+            if check_consistency:
+                replacer.check_consistency(path)
+
+            if replacer.changed:
+                # Write the file out again
+                with smart_open(path, "w", encoding=encoding) as file:
+                    file.write("".join(bumped_lines))
+        updates.append(VersionFileUpdate(path, replacer.matches, replacer.changed))
+
+    return updates
+
+
+class _VersionReplacer:
+    """Replace the version in the lines matching any of the regexes of a file."""
+
+    def __init__(
+        self, current_version: str, new_version: str, patterns: list[re.Pattern[str]]
+    ) -> None:
+        self.current_version = current_version
+        self.new_version = new_version
+        self.patterns = patterns
+        self.found = [False] * len(patterns)
+        self.matches = 0
+        self.changed = False
+
+    def __call__(self, line: str) -> str:
+        bumped_line = line
+        for i, pattern in enumerate(self.patterns):
+            if not pattern.search(bumped_line):
+                continue
+            occurrences = bumped_line.count(self.current_version)
+            if occurrences:
+                self.found[i] = True
+                self.matches += occurrences
+                bumped_line = bumped_line.replace(
+                    self.current_version, self.new_version
                 )
+        self.changed = self.changed or bumped_line != line
+        return bumped_line
 
-                current_version_found = current_version_found or bumped_line != line
-                bumped_lines.append(bumped_line)
-
-        if check_consistency and not current_version_found:
+    def check_consistency(self, path: str) -> None:
+        if not all(self.found):
             raise CurrentVersionNotFoundError(
-                f"Current version {current_version} is not found in {path}.\n"
+                f"Current version {self.current_version} is not found in {path}.\n"
                 "The version defined in commitizen configuration and the ones in "
                 "version_files are possibly inconsistent."
             )
 
-        bumped_version_file_content = "".join(bumped_lines)
 
-        # Write the file out again
-        with smart_open(path, "w", encoding=encoding) as file:
-            file.write(bumped_version_file_content)
-        updated_files.append(path)
+def _stream_version_file(
+    path: str, replacer: _VersionReplacer, *, check_consistency: bool, encoding: str
+) -> None:
+    """Replace the version in a file without holding its content in memory."""
+    # Replace the target of a symbolic link, not the link itself
+    target = os.path.realpath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target),
+        prefix=f".{os.path.basename(target)}.",
+        suffix=".tmp",
+    )
+    try:
+        with (
+            open(path, encoding=encoding) as version_file,
+            smart_open(fd, "w", encoding=encoding) as tmp_file,
+        ):
+            for line in version_file:
+                tmp_file.write(replacer(line))
+
+        if check_consistency:
+            replacer.check_consistency(path)
 
-    return updated_files
+        if replacer.changed:
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
 
 
 def _resolve_files_and_regexes(
-    patterns: Iterable[str], version: str
-) -> Generator[tuple[str, re.Pattern], None, None]:
+    patterns: Iterable[str], version: str, *, include_untracked: bool = True
+) -> list[tuple[str, list[re.Pattern[str]]]]:
     """
-    Resolve all distinct files with their regexp from a list of glob patterns with optional regexp
+    Resolve all distinct files with their regexps from a list of glob patterns with optional regexp
+
+    Glob patterns are matched against the files known to git, listed only once,
+    rather than by crawling the file system. The patterns matching none of them,
+    such as the ones of ignored or generated files, go through the file system.
     """
-    filepath_set: set[tuple[str, str]] = set()
+    filepaths_and_regexes = []
     for pattern in patterns:
         drive, tail = os.path.splitdrive(pattern)
         path, _, regex = tail.partition(":")
-        filepath = drive + path
-        regex = regex or re.escape(version)
+        filepaths_and_regexes.append((drive + path, regex or re.escape(version)))
+
+    tracked_files = None
+    if any(has_magic(filepath) for filepath, _ in filepaths_and_regexes):
+        tracked_files = _get_tracked_files(include_untracked=include_untracked)
+
+    filepath_set: set[tuple[str, str]] = set()
+    for filepath, regex in filepaths_and_regexes:
+        paths = tracked_files.glob(filepath) if tracked_files else None
+        if not paths:
+            paths = list(iglob(filepath))
+        filepath_set.update((path, regex) for path in paths)
 
-        filepath_set.update((path, regex) for path in iglob(filepath))
+    regexes_by_path: dict[str, list[re.Pattern[str]]] = {}
+    for path, regex in sorted(filepath_set):
+        regexes_by_path.setdefault(path, []).append(re.compile(regex))
+    return list(regexes_by_path.items())
 
-    return ((path, re.compile(regex)) for path, regex in sorted(filepath_set))
+
+def _get_tracked_files(*, include_untracked: bool) -> TrackedFiles | None:
+    root = find_git_project_root()
+    if root is None:
+        return None
+    try:
+        return TrackedFiles.from_git(root, include_untracked=include_untracked)
+    except GitCommandError:
+        return None
 
 
 def create_commit_message(
@@ -139,3 +268,52 @@ def create_commit_message(
         message_template = BUMP_MESSAGE
     t = Template(message_template)
     return t.safe_substitute(current_version=current_version, new_version=new_version)
+
+
+class PathTrie:
+    """Find which of a set of directories contains a file, the deepest one first.
+
+    Directories are `/` separated and relative to the root of the work tree,
+    the root itself being `""`.
+    """
+
+    def __init__(self, directories: Iterable[str]) -> None:
+        self._root: dict[str, Any] = {}
+        for directory in directories:
+            node = self._root
+            for part in _split_path(directory):
+                node = node.setdefault(part, {})
+            node[""] = directory
+
+    def find(self, filename: str) -> str | None:
+        node = self._root
+        found: str | None = node.get("")
+        for part in _split_path(filename):
+            if part not in node:
+                break
+            node = node[part]
+            found = node.get("", found)
+        return found
+
+
+def _split_path(path: str) -> list[str]:
+    return [part for part in path.split("/") if part]
+
+
+def partition_commits(
+    commits_with_filenames: Iterable[tuple[GitCommit, Iterable[str]]],
+    directories: Iterable[str],
+) -> dict[str, list[GitCommit]]:
+    """Group the commits by the directories containing the files they changed.
+
+    A file only counts for the deepest directory containing it, so a commit
+    can belong to several directories, or none.
+    """
+    trie = PathTrie(directories)
+    partitions: dict[str, list[GitCommit]] = {}
+    for commit, filenames in commits_with_filenames:
+        found = {trie.find(filename) for filename in filenames}
+        found.discard(None)
+        for directory in found:
+            partitions.setdefault(cast("str", directory), []).append(commit)
+    return partitions
@@ -90,7 +90,7 @@ def get_commit_tag(commit: GitCommit, tags: list[GitTag]) -> GitTag | None:
 
 
 def generate_tree_from_commits(
-    commits: list[GitCommit],
+    commits: Sequence[GitCommit],
     tags: list[GitTag],
     commit_parser: str,
     changelog_pattern: str,
@@ -0,0 +1,105 @@
+"""Cache of the commits already validated by `cz check`, stored in the git directory.
+
+A commit message can't change without its SHA changing, so a commit that was
+valid once stays valid as long as the validation rules are the same.
+Valid SHAs are appended to one file per set of rules, named after the hash of
+the `schema_pattern`, `allowed_prefixes` and `message_length_limit` in use
+(along with the commitizen version and the cz rule, down to the stat of the
+modules defining it), so that re-checking an already validated range only has
+to read the log.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import TYPE_CHECKING
+
+from commitizen.__version__ import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+CACHE_DIRNAME = "commitizen-check-cache"
+
+_SHA_PATTERN = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+
+def cz_fingerprint(cz_class: type) -> list[tuple[str, int, int] | tuple[str]]:
+    """Get the stat of the modules defining the cz rule and its base classes.
+
+    Upgrading or editing a plugin changes the rules without changing its name.
+    """
+    result: list[tuple[str, int, int] | tuple[str]] = []
+    for module_name in dict.fromkeys(klass.__module__ for klass in cz_class.__mro__):
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if stat is None:
+            result.append((module_name,))
+        else:
+            result.append((module_name, stat.st_size, stat.st_mtime_ns))
+    return result
+
+
+def rules_key(
+    *,
+    cz_name: str,
+    cz_modules: Iterable[Iterable[str | int]],
+    schema_pattern: str,
+    allowed_prefixes: Iterable[str],
+    max_msg_length: int | None,
+    allow_abort: bool,
+) -> str:
+    """Hash everything the validation result of a commit depends on."""
+    rules = [
+        __version__,
+        cz_name,
+        [list(module) for module in cz_modules],
+        schema_pattern,
+        list(allowed_prefixes),
+        max_msg_length,
+        allow_abort,
+    ]
+    return hashlib.sha256(json.dumps(rules).encode("utf-8")).hexdigest()
+
+
+def get_cache_path(git_dir: Path | None, key: str) -> Path | None:
+    """Get the cache location, if the project has a git directory to store it."""
+    if git_dir is None or not git_dir.is_dir():
+        return None
+    return git_dir / CACHE_DIRNAME / key
+
+
+def is_cacheable(rev: str) -> bool:
+    """Only full object names identify a commit message."""
+    return _SHA_PATTERN.fullmatch(rev) is not None
+
+
+def load(cache_path: Path) -> set[str]:
+    """Get the SHAs of the commits known to be valid."""
+    try:
+        return set(cache_path.read_text(encoding="ascii").split())
+    except (OSError, ValueError):
+        return set()
+
+
+def store(cache_path: Path, revs: Iterable[str]) -> None:
+    """Record the given commits as valid, silently giving up on any failure."""
+    content = "".join(f"{rev}\n" for rev in revs if is_cacheable(rev))
+    if not content:
+        return
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        # Appends are atomic enough for concurrent `cz check` runs: the worst
+        # case is a duplicated or ignored line, never a wrong result.
+        with cache_path.open("a", encoding="ascii") as f:
+            f.write(content)
+    except OSError:
+        pass
@@ -0,0 +1,140 @@
+"""Machine readable reports of `cz check`, written one commit at a time.
+
+Each commit is written as soon as it is validated, so that the report of a
+huge range of commits is never held in memory.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from commitizen.__version__ import __version__
+
+if TYPE_CHECKING:
+    from commitizen import git
+    from commitizen.cz.base import ValidationResult
+
+
+class Reporter:
+    """Write the validation of each commit to a stream."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def start(self) -> None:
+        """Write what comes before the first commit."""
+
+    def add(
+        self, commit: git.GitCommit, result: ValidationResult, elapsed_us: int
+    ) -> None:
+        """Write the validation of a commit."""
+        raise NotImplementedError()
+
+    def finish(self) -> None:
+        """Write what comes after the last commit."""
+
+
+class JsonReporter(Reporter):
+    """One JSON object per line (JSON Lines)."""
+
+    def add(
+        self, commit: git.GitCommit, result: ValidationResult, elapsed_us: int
+    ) -> None:
+        record = {
+            "sha": commit.rev,
+            "valid": result.is_valid,
+            "errors": [] if result.is_valid else result.errors,
+            "elapsed_us": elapsed_us,
+        }
+        self.stream.write(f"{json.dumps(record)}\n")
+
+
+class JUnitReporter(Reporter):
+    """A JUnit XML test suite with one test case per commit."""
+
+    def start(self) -> None:
+        self.stream.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<testsuites>\n"
+            '<testsuite name="cz check">\n'
+        )
+
+    def add(
+        self, commit: git.GitCommit, result: ValidationResult, elapsed_us: int
+    ) -> None:
+        testcase = (
+            f'<testcase classname="cz check" name={quoteattr(commit.rev)}'
+            f' time="{elapsed_us / 1_000_000:.6f}"'
+        )
+        if result.is_valid:
+            self.stream.write(f"{testcase}/>\n")
+            return
+        details = "\n".join((commit.message, *result.errors))
+        self.stream.write(
+            f"{testcase}>"
+            f'<failure message="commit validation failed">{escape(details)}</failure>'
+            "</testcase>\n"
+        )
+
+    def finish(self) -> None:
+        self.stream.write("</testsuite>\n</testsuites>\n")
+
+
+class SarifReporter(Reporter):
+    """A SARIF 2.1.0 log with one result per commit."""
+
+    rule_id = "commit-message"
+
+    def start(self) -> None:
+        tool = {
+            "driver": {
+                "name": "commitizen",
+                "version": __version__,
+                "informationUri": "https://commitizen-tools.github.io/commitizen/",
+                "rules": [
+                    {
+                        "id": self.rule_id,
+                        "shortDescription": {
+                            "text": "Commit messages follow the commitizen schema."
+                        },
+                    }
+                ],
+            }
+        }
+        self.stream.write(
+            '{"version": "2.1.0", '
+            '"$schema": "https://json.schemastore.org/sarif-2.1.0.json", '
+            f'"runs": [{{"tool": {json.dumps(tool)}, "results": [\n'
+        )
+        self._separator = ""
+
+    def add(
+        self, commit: git.GitCommit, result: ValidationResult, elapsed_us: int
+    ) -> None:
+        title = commit.message.partition("\n")[0]
+        text = (
+            f"Valid commit message: {title}"
+            if result.is_valid
+            else "\n".join((f"Invalid commit message: {title}", *result.errors))
+        )
+        record = {
+            "ruleId": self.rule_id,
+            "kind": "pass" if result.is_valid else "fail",
+            "level": "none" if result.is_valid else "error",
+            "message": {"text": text},
+            "properties": {"sha": commit.rev, "elapsed_us": elapsed_us},
+        }
+        self.stream.write(f"{self._separator}{json.dumps(record)}")
+        self._separator = ",\n"
+
+    def finish(self) -> None:
+        self.stream.write("\n]}]}\n")
+
+
+REPORTERS: dict[str, type[Reporter]] = {
+    "json": JsonReporter,
+    "junit": JUnitReporter,
+    "sarif": SarifReporter,
+}
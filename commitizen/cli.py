@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import argparse
 import logging
+import logging.config
+import os
 import sys
+from contextlib import contextmanager, nullcontext
 from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from types import TracebackType
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import argcomplete
 from decli import cli
 
-from commitizen import commands, config, out, version_schemes
-from commitizen.defaults import DEFAULT_SETTINGS
+from commitizen import LOGGING, cmd, commands, config, out, profiling
+from commitizen.defaults import DEFAULT_SETTINGS, KNOWN_SCHEMES
 from commitizen.exceptions import (
     CommitizenException,
     ExitCode,
@@ -23,6 +26,26 @@ from commitizen.exceptions import (
 )
 from commitizen.version_increment import VersionIncrement
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from typing import TypeAlias
+
+    from commitizen.config import BaseConfig
+
+    Command: TypeAlias = (
+        commands.Init  # init
+        | commands.Commit  # commit (c)
+        | commands.ListCz  # ls
+        | commands.Example  # example
+        | commands.Info  # info
+        | commands.Schema  # schema
+        | commands.Bump  # bump
+        | commands.Changelog  # changelog (ch)
+        | commands.Check  # check
+        | commands.Version  # version
+        | commands.Serve  # serve
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +88,24 @@ class ParseKwargs(argparse.Action):
         setattr(namespace, self.dest, kwargs)
 
 
+class LazyCommand:
+    """Defer the import of a command until the subcommand is actually run.
+
+    Importing every command eagerly would load the dependencies of all of them
+    (questionary, jinja2, tomlkit...) even for `cz check` in a commit-msg hook.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, config: BaseConfig, arguments: dict[str, Any]) -> Command:
+        command_class: type[Command] = getattr(commands, self.name)
+        return command_class(config, arguments)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"LazyCommand({self.name!r})"
+
+
 tpl_arguments = (
     {
         "name": ["--template", "-t"],
@@ -104,6 +145,21 @@ data = {
             "required": False,
             "help": "Comma-separated error codes that won't raise error, e.g., cz -nr 1,2,3 bump. See codes at https://commitizen-tools.github.io/commitizen/exit_codes/",
         },
+        {
+            "name": "--profile",
+            "action": "store_true",
+            "help": "Print the time spent in each phase of the command and the subprocesses it ran to stderr.",
+        },
+        {
+            "name": "--profile-trace",
+            "metavar": "FILE",
+            "help": "Also write the profile to FILE in the Chrome trace event format (implies --profile).",
+        },
+        {
+            "name": "--profile-memory",
+            "action": "store_true",
+            "help": "Also report the peak of the memory allocated in each phase, traced with tracemalloc (implies --profile, slows the command down).",
+        },
     ],
     "subcommands": {
         "title": "commands",
@@ -113,13 +169,13 @@ data = {
                 "name": ["init"],
                 "description": "Initialize commitizen configuration",
                 "help": "Initialize commitizen configuration.",
-                "func": commands.Init,
+                "func": LazyCommand("Init"),
             },
             {
                 "name": ["commit", "c"],
                 "description": "Create new commit",
                 "help": "Create new commit.",
-                "func": commands.Commit,
+                "func": LazyCommand("Commit"),
                 "arguments": [
                     {
                         "name": ["--retry"],
@@ -177,31 +233,31 @@ data = {
                 "name": "ls",
                 "description": "Show available Commitizens",
                 "help": "Show available Commitizens.",
-                "func": commands.ListCz,
+                "func": LazyCommand("ListCz"),
             },
             {
                 "name": "example",
                 "description": "Show commit example",
                 "help": "Show commit example.",
-                "func": commands.Example,
+                "func": LazyCommand("Example"),
             },
             {
                 "name": "info",
                 "description": "Show information about the cz",
                 "help": "Show information about the cz.",
-                "func": commands.Info,
+                "func": LazyCommand("Info"),
             },
             {
                 "name": "schema",
                 "description": "Show commit schema",
                 "help": "Show commit schema.",
-                "func": commands.Schema,
+                "func": LazyCommand("Schema"),
             },
             {
                 "name": "bump",
                 "description": "Bump semantic version based on the git log",
                 "help": "Bump semantic version based on the git log.",
-                "func": commands.Bump,
+                "func": LazyCommand("Bump"),
                 "arguments": [
                     {
                         "name": "--dry-run",
@@ -345,13 +401,13 @@ data = {
                         "name": ["--version-scheme"],
                         "help": "Choose version scheme.",
                         "default": None,
-                        "choices": version_schemes.KNOWN_SCHEMES,
+                        "choices": KNOWN_SCHEMES,
                     },
                     {
                         "name": ["--version-type"],
                         "help": "Deprecated, use `--version-scheme` instead.",
                         "default": None,
-                        "choices": version_schemes.KNOWN_SCHEMES,
+                        "choices": KNOWN_SCHEMES,
                     },
                     {
                         "name": "manual_version",
@@ -377,6 +433,16 @@ data = {
                         "help": "Bump version without eligible commits.",
                         "action": "store_true",
                     },
+                    {
+                        "name": ["--path"],
+                        "action": "append",
+                        "dest": "paths",
+                        "metavar": "PATH",
+                        "help": (
+                            "Only consider the commits changing this path "
+                            "(can be used multiple times)."
+                        ),
+                    },
                 ],
             },
             {
@@ -387,7 +453,7 @@ data = {
                 "help": (
                     "Generate changelog (note that it will overwrite existing files)."
                 ),
-                "func": commands.Changelog,
+                "func": LazyCommand("Changelog"),
                 "arguments": [
                     {
                         "name": "--dry-run",
@@ -442,7 +508,7 @@ data = {
                         "name": ["--version-scheme"],
                         "help": "Choose version scheme.",
                         "default": None,
-                        "choices": version_schemes.KNOWN_SCHEMES,
+                        "choices": KNOWN_SCHEMES,
                     },
                     {
                         "name": "--export-template",
@@ -454,13 +520,23 @@ data = {
                         "name": "--tag-format",
                         "help": "The format of the tag, wrap around simple quotes.",
                     },
+                    {
+                        "name": ["--path"],
+                        "action": "append",
+                        "dest": "paths",
+                        "metavar": "PATH",
+                        "help": (
+                            "Only include the commits changing this path "
+                            "(can be used multiple times)."
+                        ),
+                    },
                 ],
             },
             {
                 "name": ["check"],
                 "description": "Validate that a commit message matches the commitizen schema",
                 "help": "Validate that a commit message matches the commitizen schema.",
-                "func": commands.Check,
+                "func": LazyCommand("Check"),
                 "arguments": [
                     {
                         "name": "--commit-msg-file",
@@ -487,6 +563,16 @@ data = {
                         "help": "Validate the given commit message.",
                         "exclusive_group": "group1",
                     },
+                    {
+                        "name": ["--ref-updates"],
+                        "action": "store_true",
+                        "default": False,
+                        "help": (
+                            "Validate the new commits of the ref updates read from stdin, "
+                            "as given to the pre-receive or pre-push git hooks."
+                        ),
+                        "exclusive_group": "group1",
+                    },
                     {
                         "name": ["--allow-abort"],
                         "action": "store_true",
@@ -503,6 +589,43 @@ data = {
                         "type": int,
                         "help": "Restrict the length of the **first line** of the commit message; 0 for no limit.",
                     },
+                    {
+                        "name": ["--output"],
+                        "choices": ["json", "junit", "sarif"],
+                        "help": (
+                            "Write a machine readable report on stdout, one record per commit "
+                            "as it is validated (json writes JSON Lines)."
+                        ),
+                    },
+                    {
+                        "name": ["--fail-fast"],
+                        "action": "store_true",
+                        "default": False,
+                        "help": "Stop at the first invalid commit; same as --max-errors 1.",
+                        "exclusive_group": "group2",
+                    },
+                    {
+                        "name": ["--max-errors"],
+                        "type": int,
+                        "metavar": "N",
+                        "help": "Stop after N invalid commits, without reading the rest of the git log.",
+                        "exclusive_group": "group2",
+                    },
+                    {
+                        "name": ["-j", "--jobs"],
+                        "type": int,
+                        "default": 1,
+                        "help": (
+                            "Number of processes validating large sets of commits not validated before; "
+                            "0 for one per CPU."
+                        ),
+                    },
+                    {
+                        "name": ["--no-cache"],
+                        "action": "store_true",
+                        "default": False,
+                        "help": "Validate every commit of the range again, ignoring the ones cached as valid.",
+                    },
                 ],
             },
             {
@@ -513,7 +636,7 @@ data = {
                 "help": (
                     "Get the version of the installed commitizen or the current project (default: installed commitizen)."
                 ),
-                "func": commands.Version,
+                "func": LazyCommand("Version"),
                 "arguments": [
                     {
                         "name": ["-r", "--report"],
@@ -593,6 +716,23 @@ data = {
                     },
                 ],
             },
+            {
+                "name": ["serve"],
+                "description": (
+                    "Keep a warm process answering `cz check` and `cz version` for the current directory. "
+                    "Use `cz-client` instead of `cz` to query it."
+                ),
+                "help": "Keep a warm process answering `cz check` and `cz version`.",
+                "func": LazyCommand("Serve"),
+                "arguments": [
+                    {
+                        "name": ["--idle-timeout"],
+                        "type": float,
+                        "default": None,
+                        "help": "Shut down after this many seconds without any request (default: 600).",
+                    },
+                ],
+            },
         ],
     },
 }
@@ -648,25 +788,45 @@ if TYPE_CHECKING:
         debug: bool = False
         name: str | None = None
         no_raise: str | None = None  # comma-separated string, later parsed as list[int]
+        profile: bool = False
+        profile_trace: str | None = None
+        profile_memory: bool = False
         report: bool = False
         project: bool = False
         commitizen: bool = False
         verbose: bool = False
-        func: type[
-            commands.Init  # init
-            | commands.Commit  # commit (c)
-            | commands.ListCz  # ls
-            | commands.Example  # example
-            | commands.Info  # info
-            | commands.Schema  # schema
-            | commands.Bump  # bump
-            | commands.Changelog  # changelog (ch)
-            | commands.Check  # check
-            | commands.Version  # version
-        ]
+        func: LazyCommand
+
+
+@contextmanager
+def trace_commands(destination: str | None) -> Generator[None, None, None]:
+    """Write the trace of every command run to `destination` as JSON lines.
+
+    `destination` is appended to, so that the commands of several `cz`
+    invocations can be collected in the same file; `-` is the standard error.
+    """
+    if not destination:
+        yield
+        return
+    with (
+        nullcontext(sys.stderr)
+        if destination == "-"
+        else open(destination, "a", encoding="utf-8")
+    ) as stream:
+        tracer = cmd.JsonLinesTracer(stream)
+        cmd.add_tracer(tracer)
+        try:
+            yield
+        finally:
+            cmd.remove_tracer(tracer)
 
 
 def main() -> None:
+    # Not done on import, so that using commitizen as a library configures nothing
+    from colorama import init
+
+    init()
+    logging.config.dictConfig(LOGGING)
     sys.excepthook = commitizen_excepthook
 
     parser: argparse.ArgumentParser = cli(data)
@@ -706,20 +866,43 @@ def main() -> None:
         extra_args = unknown_args[1:]
         arguments["extra_cli_args"] = extra_args
 
-    conf = config.read_cfg(args.config)
     args = cast("Args", args)
-    if args.name:
-        conf.update({"name": args.name})
-    elif not conf.path:
-        conf.update({"name": DEFAULT_SETTINGS["name"]})
-
-    if args.debug:
-        logging.getLogger("commitizen").setLevel(logging.DEBUG)
-        sys.excepthook = partial(sys.excepthook, debug=True)
-    if args.no_raise:
-        sys.excepthook = partial(sys.excepthook, no_raise=parse_no_raise(args.no_raise))
-
-    args.func(conf, arguments)()  # type: ignore[arg-type]
+    profile_trace = args.profile_trace or os.environ.get("CZ_PROFILE_TRACE")
+    profile_memory = args.profile_memory or profiling.is_enabled_by_env(
+        "CZ_PROFILE_MEMORY"
+    )
+    profiler = (
+        profiling.start(memory=profile_memory)
+        if args.profile
+        or profile_trace
+        or profile_memory
+        or profiling.is_enabled_by_env()
+        else None
+    )
+    try:
+        with trace_commands(os.environ.get("CZ_TRACE_COMMANDS")):
+            with profiling.phase("config load"):
+                conf = config.read_cfg(args.config)
+            if args.name:
+                conf.update({"name": args.name})
+            elif not conf.path:
+                conf.update({"name": DEFAULT_SETTINGS["name"]})
+
+            if args.debug:
+                logging.getLogger("commitizen").setLevel(logging.DEBUG)
+                sys.excepthook = partial(sys.excepthook, debug=True)
+            if args.no_raise:
+                sys.excepthook = partial(
+                    sys.excepthook, no_raise=parse_no_raise(args.no_raise)
+                )
+
+            args.func(conf, arguments)()
+    finally:
+        if profiler is not None:
+            profiling.stop()
+            out.diagnostic(profiler.summary())
+            if profile_trace:
+                profiler.write_chrome_trace(profile_trace)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""Thin `cz` client forwarding `cz check` and `cz version` to a running `cz serve`.
+
+Commands not handled by the server, or run while no server is up, are executed
+in-process exactly as `cz` would.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from typing import TYPE_CHECKING
+
+from commitizen import serve_protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Global options taking a value, see `commitizen.cli.data`
+_GLOBAL_OPTIONS_WITH_VALUE = ("--config", "-n", "--name", "-nr", "--no-raise")
+# Options of `cz check` for which the message is not read from stdin
+_CHECK_MESSAGE_SOURCES = (
+    "--commit-msg-file",
+    "--rev-range",
+    "-d",
+    "--use-default-range",
+    "-m",
+    "--message",
+)
+
+
+def _get_subcommand(argv: Sequence[str]) -> str | None:
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _reads_stdin(argv: Sequence[str]) -> bool:
+    return (
+        not any(arg.partition("=")[0] in _CHECK_MESSAGE_SOURCES for arg in argv)
+        and not sys.stdin.isatty()
+    )
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    subcommand = _get_subcommand(argv)
+    stdin: str | None = None
+    if subcommand in serve_protocol.SERVED_COMMANDS:
+        if subcommand == "check" and _reads_stdin(argv):
+            stdin = sys.stdin.read()
+        response = serve_protocol.request(argv, stdin=stdin)
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            sys.exit(response["exit_code"])
+
+    from commitizen import cli
+
+    if stdin is not None:
+        # Already consumed while trying the server
+        sys.stdin = io.StringIO(stdin)
+    cli.main()
+
+
+if __name__ == "__main__":
+    main()
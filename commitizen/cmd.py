@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import json
 import os
+import queue
+import signal
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 import warnings
-from typing import TYPE_CHECKING, NamedTuple, overload
-
-from charset_normalizer import from_bytes
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple, TextIO, cast, overload
 
 from commitizen.exceptions import CharacterSetDecodeError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Generator, Iterator, Mapping, Sequence
+    from io import BufferedReader
 
 
 class Command(NamedTuple):
@@ -21,12 +28,107 @@ class Command(NamedTuple):
     return_code: int
 
 
+class OutputLine(NamedTuple):
+    """A line of the output of a `ShellProcess`."""
+
+    text: str
+    stderr: bool
+
+
+class CommandTrace(NamedTuple):
+    """A command run by commitizen, given to the tracers once it is done."""
+
+    cmd: str | list[str]
+    shell: bool
+    # The environment variables given to the command, minus the inherited ones
+    env: dict[str, str]
+    # `time.perf_counter_ns()` when the command was started
+    start_ns: int
+    duration_ns: int
+    return_code: int
+    # None when the output isn't captured, such as for hooks
+    stdout_size: int | None
+    stderr_size: int | None
+
+
+Tracer = Callable[[CommandTrace], None]
+
+# Seconds a `ShellProcess` past its timeout gets to exit before it is killed
+KILL_DELAY = 5.0
+
+_tracers: list[Tracer] = []
+
+
+def add_tracer(tracer: Tracer) -> None:
+    """Call `tracer` with the trace of every command run from now on."""
+    _tracers.append(tracer)
+
+
+def remove_tracer(tracer: Tracer) -> None:
+    _tracers.remove(tracer)
+
+
+class JsonLinesTracer:
+    """Write each command trace as a JSON object on its own line.
+
+    Set up by `cz` when the `CZ_TRACE_COMMANDS` environment variable is set.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def __call__(self, trace: CommandTrace) -> None:
+        record = {
+            "pid": os.getpid(),
+            "argv": trace.cmd,
+            "shell": trace.shell,
+            "env": trace.env,
+            "duration_ms": trace.duration_ns / 1_000_000,
+            "return_code": trace.return_code,
+            "stdout_bytes": trace.stdout_size,
+            "stderr_bytes": trace.stderr_size,
+        }
+        self.stream.write(f"{json.dumps(record)}\n")
+        self.stream.flush()
+
+
+def _trace(
+    cmd: str | Sequence[str],
+    *,
+    shell: bool,
+    env: Mapping[str, str] | None,
+    start_ns: int,
+    return_code: int,
+    stdout_size: int | None = None,
+    stderr_size: int | None = None,
+) -> None:
+    trace = CommandTrace(
+        cmd=cmd if isinstance(cmd, str) else list(cmd),
+        shell=shell,
+        env={
+            name: value
+            for name, value in (env or {}).items()
+            if os.environ.get(name) != value
+        },
+        start_ns=start_ns,
+        duration_ns=time.perf_counter_ns() - start_ns,
+        return_code=return_code,
+        stdout_size=stdout_size,
+        stderr_size=stderr_size,
+    )
+    for tracer in list(_tracers):
+        tracer(trace)
+
+
 def _try_decode(bytes_: bytes) -> str:
     try:
         return bytes_.decode("utf-8")
     except UnicodeDecodeError:
         pass
 
+    # Only needed for non UTF-8 output, so don't pay for the import otherwise
+    from charset_normalizer import from_bytes
+
     charset_match = from_bytes(bytes_).best()
     if charset_match is None:
         raise CharacterSetDecodeError()
@@ -41,20 +143,31 @@ def _popen(
     *,
     shell: bool,
     env: Mapping[str, str] | None = None,
+    input: str | None = None,
 ) -> Command:
-    if env is not None:
-        env = {**os.environ, **env}
-
+    start_ns = time.perf_counter_ns()
     process = subprocess.Popen(
         cmd,
         shell=shell,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         stdin=subprocess.PIPE,
-        env=env,
+        env={**os.environ, **env} if env is not None else None,
+    )
+    stdout, stderr = process.communicate(
+        input.encode("utf-8") if input is not None else None
     )
-    stdout, stderr = process.communicate()
     return_code = process.returncode
+    if _tracers:
+        _trace(
+            cmd,
+            shell=shell,
+            env=env,
+            start_ns=start_ns,
+            return_code=return_code,
+            stdout_size=len(stdout),
+            stderr_size=len(stderr),
+        )
     return Command(
         _try_decode(stdout),
         _try_decode(stderr),
@@ -69,10 +182,20 @@ def run(cmd: str, env: Mapping[str, str] | None = None) -> Command: ...
 
 
 @overload
-def run(cmd: Sequence[str], env: Mapping[str, str] | None = None) -> Command: ...
+def run(
+    cmd: Sequence[str],
+    env: Mapping[str, str] | None = None,
+    *,
+    input: str | None = None,
+) -> Command: ...
 
 
-def run(cmd: str | Sequence[str], env: Mapping[str, str] | None = None) -> Command:
+def run(
+    cmd: str | Sequence[str],
+    env: Mapping[str, str] | None = None,
+    *,
+    input: str | None = None,
+) -> Command:
     """Run a command safely without shell interpretation (shell=False).
 
     Arguments are passed directly to the OS, preventing shell-injection
@@ -80,6 +203,8 @@ def run(cmd: str | Sequence[str], env: Mapping[str, str] | None = None) -> Comma
 
     Passing a string is deprecated and will be removed in a future version.
     Use a list of arguments instead, or use run_shell() for shell features.
+
+    `input` is written to the standard input of the command.
     """
     if isinstance(cmd, str):
         warnings.warn(
@@ -88,8 +213,67 @@ def run(cmd: str | Sequence[str], env: Mapping[str, str] | None = None) -> Comma
             DeprecationWarning,
             stacklevel=2,
         )
-        return _popen(cmd, shell=True, env=env)
-    return _popen(cmd, shell=False, env=env)
+        return _popen(cmd, shell=True, env=env, input=input)
+    return _popen(cmd, shell=False, env=env, input=input)
+
+
+def stream(
+    cmd: Sequence[str],
+    env: Mapping[str, str] | None = None,
+    *,
+    separator: str = "\n",
+) -> Generator[str, None, Command]:
+    """Run a command safely without shell interpretation, yielding its output as it is produced.
+
+    The output is split on `separator`. Closing the generator before the
+    command is done terminates it instead of draining the rest of its output.
+
+    Returns:
+        The command once done, with its stderr and return code; its stdout was already yielded.
+    """
+    separator_bytes = separator.encode("utf-8")
+
+    # stderr goes to a file: a full stderr pipe would block the command
+    with tempfile.TemporaryFile() as stderr_file:
+        start_ns = time.perf_counter_ns()
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            stdin=subprocess.DEVNULL,
+            env={**os.environ, **env} if env is not None else None,
+        )
+        stdout = cast("BufferedReader", process.stdout)
+        stdout_size = 0
+        try:
+            pending = b""
+            while chunk := stdout.read1(65536):
+                stdout_size += len(chunk)
+                *records, pending = (pending + chunk).split(separator_bytes)
+                for record in records:
+                    yield _try_decode(record)
+            if pending:
+                yield _try_decode(pending)
+            return_code = process.wait()
+        finally:
+            if process.poll() is None:
+                process.terminate()
+                process.wait()
+            stdout.close()
+            if _tracers:
+                _trace(
+                    cmd,
+                    shell=False,
+                    env=env,
+                    start_ns=start_ns,
+                    return_code=process.returncode,
+                    stdout_size=stdout_size,
+                    stderr_size=os.fstat(stderr_file.fileno()).st_size,
+                )
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+    return Command("", _try_decode(stderr), b"", stderr, return_code)
 
 
 def run_shell(cmd: str, env: Mapping[str, str] | None = None) -> Command:
@@ -117,8 +301,6 @@ def run_interactive(
     Returns:
         subprocess returncode
     """
-    if env is not None:
-        env = {**os.environ, **env}
     if isinstance(cmd, str):
         warnings.warn(
             "Passing a string to cmd.run_interactive() is deprecated and will be removed in v5. "
@@ -126,8 +308,8 @@ def run_interactive(
             DeprecationWarning,
             stacklevel=2,
         )
-        return subprocess.run(cmd, shell=True, env=env).returncode
-    return subprocess.run(cmd, shell=False, env=env).returncode
+        return _run_interactive(cmd, shell=True, env=env)
+    return _run_interactive(cmd, shell=False, env=env)
 
 
 def run_interactive_shell(cmd: str, env: Mapping[str, str] | None = None) -> int:
@@ -140,6 +322,150 @@ def run_interactive_shell(cmd: str, env: Mapping[str, str] | None = None) -> int
     Returns:
         subprocess returncode
     """
-    if env is not None:
-        env = {**os.environ, **env}
-    return subprocess.run(cmd, shell=True, env=env).returncode
+    return _run_interactive(cmd, shell=True, env=env)
+
+
+def _run_interactive(
+    cmd: str | Sequence[str], *, shell: bool, env: Mapping[str, str] | None
+) -> int:
+    start_ns = time.perf_counter_ns()
+    return_code = subprocess.run(
+        cmd, shell=shell, env={**os.environ, **env} if env is not None else None
+    ).returncode
+    if _tracers:
+        _trace(cmd, shell=shell, env=env, start_ns=start_ns, return_code=return_code)
+    return return_code
+
+
+class ShellProcess:
+    """A command run via the system shell in the background.
+
+    Its stdout and stderr are read by line, in the order they are written
+    to each of them. It runs in a process group of its own, so that
+    `terminate` also stops the commands started by the shell.
+
+    Past `timeout` seconds, the command is terminated, and killed if it is
+    still running `KILL_DELAY` seconds later; `timed_out` is then true.
+
+    Never pass untrusted/user-controlled values into *cmd*, see `run_shell`.
+    """
+
+    def __init__(
+        self,
+        cmd: str,
+        env: Mapping[str, str] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        self.cmd = cmd
+        self.timed_out = False
+        self._env = env
+        self._start_ns = time.perf_counter_ns()
+        self._stdout_size = 0
+        self._stderr_size = 0
+        group_options: dict[str, Any]
+        if sys.platform == "win32":
+            group_options = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group_options = {"start_new_session": True}
+        self._process = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            env={**os.environ, **env} if env is not None else None,
+            **group_options,
+        )
+        # The lines of both streams, read by a thread each, then None once
+        # each stream is done
+        self._lines: queue.SimpleQueue[OutputLine | None] = queue.SimpleQueue()
+        self._open_streams = 2
+        for stream, is_stderr in (
+            (self._process.stdout, False),
+            (self._process.stderr, True),
+        ):
+            threading.Thread(
+                target=self._read, args=(stream, is_stderr), daemon=True
+            ).start()
+        self._timer: threading.Timer | None = None
+        if timeout is not None:
+            self._timer = threading.Timer(timeout, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def lines(self) -> Iterator[OutputLine]:
+        """Iterate over the lines of stdout and stderr, without their line ending."""
+        while self._open_streams:
+            line = self._lines.get()
+            if line is None:
+                self._open_streams -= 1
+            else:
+                yield line
+
+    def _read(self, stream: BufferedReader, is_stderr: bool) -> None:
+        with stream:
+            for line in stream:
+                if is_stderr:
+                    self._stderr_size += len(line)
+                else:
+                    self._stdout_size += len(line)
+                # Only displayed: never fail on an undecodable output
+                text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                self._lines.put(OutputLine(text, is_stderr))
+        self._lines.put(None)
+
+    def terminate(self) -> None:
+        if self._process.poll() is not None:
+            return
+        if sys.platform == "win32":
+            self._process.terminate()
+            return
+        try:
+            os.killpg(self._process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def kill(self) -> None:
+        if self._process.poll() is not None:
+            return
+        if sys.platform == "win32":
+            self._process.kill()
+            return
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _expire(self) -> None:
+        if self._process.poll() is not None:
+            return
+        self.timed_out = True
+        self.terminate()
+        try:
+            self._process.wait(KILL_DELAY)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+    def wait(self) -> int:
+        """Wait for the command to be done, reading the rest of its output.
+
+        Returns:
+            subprocess returncode
+        """
+        for _ in self.lines():
+            pass
+        return_code = self._process.wait()
+        if self._timer is not None:
+            self._timer.cancel()
+        if _tracers:
+            _trace(
+                self.cmd,
+                shell=True,
+                env=self._env,
+                start_ns=self._start_ns,
+                return_code=return_code,
+                stdout_size=self._stdout_size,
+                stderr_size=self._stderr_size,
+            )
+        return return_code
@@ -1,13 +1,20 @@
-from .bump import Bump
-from .changelog import Changelog
-from .check import Check
-from .commit import Commit
-from .example import Example
-from .info import Info
-from .init import Init
-from .list_cz import ListCz
-from .schema import Schema
-from .version import Version
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bump import Bump
+    from .changelog import Changelog
+    from .check import Check
+    from .commit import Commit
+    from .example import Example
+    from .info import Info
+    from .init import Init
+    from .list_cz import ListCz
+    from .schema import Schema
+    from .serve import Serve
+    from .version import Version
 
 __all__ = (
     "Bump",
@@ -19,5 +26,35 @@ __all__ = (
     "Init",
     "ListCz",
     "Schema",
+    "Serve",
     "Version",
 )
+
+# Commands are imported on first access so that running a single subcommand
+# doesn't pay for the dependencies (questionary, jinja2, tomlkit...) of the others.
+_COMMAND_MODULES: dict[str, str] = {
+    "Bump": ".bump",
+    "Changelog": ".changelog",
+    "Check": ".check",
+    "Commit": ".commit",
+    "Example": ".example",
+    "Info": ".info",
+    "Init": ".init",
+    "ListCz": ".list_cz",
+    "Schema": ".schema",
+    "Serve": ".serve",
+    "Version": ".version",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP-562: lazily import the command classes
+    if name not in _COMMAND_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = getattr(import_module(_COMMAND_MODULES[name], __name__), name)
+    globals()[name] = command
+    return command
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import copy
+import os
 import warnings
+from contextlib import contextmanager
 from logging import getLogger
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 import questionary
 
-from commitizen import bump, factory, git, hooks, out
+from commitizen import bump, defaults, factory, git, hooks, out, profiling
 from commitizen.changelog_formats import get_changelog_format
 from commitizen.commands.changelog import Changelog
 from commitizen.defaults import Settings
@@ -15,6 +18,7 @@ from commitizen.exceptions import (
     BumpTagFailedError,
     DryRunExit,
     ExpectedExit,
+    InvalidConfigurationError,
     InvalidManualVersion,
     NoCommitsFoundError,
     NoneIncrementExit,
@@ -33,7 +37,10 @@ from commitizen.version_schemes import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Mapping
+
     from commitizen.config import BaseConfig
+    from commitizen.providers.base_provider import VersionProvider
 
 logger = getLogger("commitizen")
 
@@ -57,6 +64,7 @@ class BumpArgs(Settings, total=False):
     local_version: bool
     manual_version: str | None
     no_verify: bool
+    paths: list[str] | None
     prerelease: Prerelease | None
     retry: bool
     yes: bool
@@ -104,6 +112,15 @@ class Bump:
         self.retry = arguments["retry"]
         self.pre_bump_hooks = self.config.settings["pre_bump_hooks"]
         self.post_bump_hooks = self.config.settings["post_bump_hooks"]
+        self.hook_jobs = self.config.settings.get("hook_jobs")
+        if self.hook_jobs is not None and (
+            not isinstance(self.hook_jobs, int) or self.hook_jobs < 1
+        ):
+            raise InvalidConfigurationError("`hook_jobs` must be a positive integer")
+        self.hook_timeout, self.hook_total_timeout = self._get_hook_timeouts()
+        # Kept apart, so that each phase only gets the timings of its own hooks
+        self.pre_bump_hook_timings: list[hooks.HookTiming] = []
+        self.post_bump_hook_timings: list[hooks.HookTiming] = []
         deprecated_version_type = arguments.get("version_type")
         if deprecated_version_type:
             warnings.warn(
@@ -127,6 +144,44 @@ class Bump:
         )
         self.extras = arguments["extras"]
 
+    def _get_hook_timeouts(self) -> tuple[float | None, float | None]:
+        """Read `hook_timeout`: the timeout of each hook, or a table of the
+        timeout of each hook and of all of them."""
+        hook_timeout = self.config.settings.get("hook_timeout")
+        if hook_timeout is None:
+            return None, None
+        if isinstance(hook_timeout, dict):
+            unknown_keys = set(hook_timeout) - {"per_hook", "total"}
+            if unknown_keys:
+                raise InvalidConfigurationError(
+                    f"Unknown `hook_timeout` keys: {', '.join(sorted(unknown_keys))}"
+                )
+            timeouts = (hook_timeout.get("per_hook"), hook_timeout.get("total"))
+        else:
+            timeouts = (hook_timeout, None)
+        for timeout in timeouts:
+            if timeout is not None and (
+                not isinstance(timeout, (int, float))
+                or isinstance(timeout, bool)
+                or timeout <= 0
+            ):
+                raise InvalidConfigurationError(
+                    "`hook_timeout` must be a positive number of seconds"
+                )
+        return timeouts
+
+    def _report_hook_timings(self, phase: str, timings: list[hooks.HookTiming]) -> None:
+        """Print the timings of the hooks of a phase, even if one of them failed."""
+        if not timings:
+            return
+        report = f"{phase} hook timings:\n" + "".join(
+            f"  {timing.hook}: {timing.seconds:.1f}s\n" for timing in timings
+        )
+        if self.changelog_to_stdout:
+            out.diagnostic(report)
+        else:
+            out.write(report)
+
     def _is_initial_tag(
         self, current_tag: git.GitTag | None, is_yes: bool = False
     ) -> bool:
@@ -144,7 +199,7 @@ class Bump:
         )
         return bool(questionary.confirm("Is this the first tag created?").ask())
 
-    def _find_increment(self, commits: list[git.GitCommit]) -> Increment | None:
+    def _find_increment(self, commits: Iterable[git.GitCommit]) -> Increment | None:
         # Update the bump map to ensure major version doesn't increment.
         # self.cz.bump_map = defaults.bump_map_major_version_zero
         bump_map = (
@@ -198,7 +253,10 @@ class Bump:
                 ) from exc
 
         if increment is None:
-            commits = git.get_commits(current_tag.name if current_tag else None)
+            commits = git.get_commit_batch(
+                current_tag.name if current_tag else None,
+                paths=self.arguments.get("paths") or (),
+            )
 
             # No commits, there is no need to create an empty tag.
             # Unless we previously had a prerelease.
@@ -240,6 +298,9 @@ class Bump:
 
     def __call__(self) -> None:
         """Steps executed to bump."""
+        if self.config.settings.get("packages"):
+            return self._bump_packages()
+
         provider = get_provider(self.config)
         current_version = self.scheme(provider.get_version())
         self._validate_arguments(current_version)
@@ -318,6 +379,7 @@ class Bump:
                 "dry_run": dry_run,
                 # governs logic for merge_prerelease
                 "during_version_bump": self.arguments["prerelease"] is None,
+                "paths": self.arguments.get("paths"),
             }
             if self.changelog_to_stdout:
                 try:
@@ -344,31 +406,48 @@ class Bump:
         if dry_run:
             raise DryRunExit()
 
-        updated_files.extend(
-            bump.update_version_in_files(
+        with profiling.phase("version files"):
+            for update in bump.replace_version_in_files(
                 str(current_version),
                 str(new_version),
                 self.bump_settings["version_files"],
                 check_consistency=self.check_consistency,
                 encoding=self.config.settings["encoding"],
-            )
-        )
+                include_untracked=self.config.settings[
+                    "version_files_include_untracked"
+                ],
+            ):
+                logger.debug(
+                    "%s: %d version occurrence(s) replaced%s",
+                    update.path,
+                    update.matches,
+                    "" if update.changed else ", unchanged",
+                )
+                updated_files.append(update.path)
 
-        provider.set_version(str(new_version))
+        with profiling.phase("provider"):
+            provider.set_version(str(new_version))
 
         if self.pre_bump_hooks:
-            hooks.run(
-                self.pre_bump_hooks,
-                _env_prefix="CZ_PRE_",
-                is_initial=is_initial,
-                current_version=str(current_version),
-                current_tag_version=current_tag_version,
-                new_version=new_version.public,
-                new_tag_version=new_tag_version,
-                message=message,
-                increment=increment,
-                changelog_file_name=changelog_file_name,
-            )
+            try:
+                hooks.run(
+                    self.pre_bump_hooks,
+                    _env_prefix="CZ_PRE_",
+                    _jobs=self.hook_jobs,
+                    _timeout=self.hook_timeout,
+                    _total_timeout=self.hook_total_timeout,
+                    _timings=self.pre_bump_hook_timings,
+                    is_initial=is_initial,
+                    current_version=str(current_version),
+                    current_tag_version=current_tag_version,
+                    new_version=new_version.public,
+                    new_tag_version=new_tag_version,
+                    message=message,
+                    increment=increment,
+                    changelog_file_name=changelog_file_name,
+                )
+            finally:
+                self._report_hook_timings("pre-bump", self.pre_bump_hook_timings)
 
         if self.arguments.get("files_only"):
             warnings.warn(
@@ -380,6 +459,350 @@ class Bump:
         if self.arguments.get("version_files_only"):
             raise ExpectedExit()
 
+        self._commit(message, updated_files)
+        self._tag(new_tag_version)
+
+        if self.post_bump_hooks:
+            try:
+                hooks.run(
+                    self.post_bump_hooks,
+                    _env_prefix="CZ_POST_",
+                    _jobs=self.hook_jobs,
+                    _timeout=self.hook_timeout,
+                    _total_timeout=self.hook_total_timeout,
+                    _timings=self.post_bump_hook_timings,
+                    was_initial=is_initial,
+                    previous_version=str(current_version),
+                    previous_tag_version=current_tag_version,
+                    current_version=new_version.public,
+                    current_tag_version=new_tag_version,
+                    message=message,
+                    increment=increment,
+                    changelog_file_name=changelog_file_name,
+                )
+            finally:
+                self._report_hook_timings("post-bump", self.post_bump_hook_timings)
+
+        # TODO: For v3 output this only as diagnostic and remove this if
+        if self.changelog_to_stdout:
+            out.diagnostic("Done!")
+        else:
+            out.success("Done!")
+
+    def _bump_packages(self) -> None:
+        """Bump every package of `packages` changed since its last tag, in one commit.
+
+        The history is read once for all packages: each commit goes to the
+        packages whose `path` contains the files it changed.
+        """
+        for value, option in (
+            (self.arguments["manual_version"], "MANUAL_VERSION"),
+            (self.arguments["get_next"], "--get-next"),
+            (self.changelog_to_stdout, "--changelog-to-stdout"),
+            (self.arguments.get("paths"), "--path"),
+        ):
+            if value:
+                raise NotAllowed(f"{option} cannot be used with packages")
+        self.changelog_flag = bool(
+            self.changelog_flag or self.config.settings.get("update_changelog_on_bump")
+        )
+
+        packages = self._get_packages()
+        tags = git.get_tags()
+        providers = []
+        current_versions = []
+        current_tags: list[git.GitTag | None] = []
+        for package in packages:
+            with _working_directory(package.directory):
+                provider = get_provider(package.config)
+                current_version = get_version_scheme(
+                    package.config.settings, self.arguments["version_scheme"]
+                )(provider.get_version())
+            self._validate_arguments(current_version)
+            rules = TagRules.from_settings(package.config.settings)
+            providers.append(provider)
+            current_versions.append(current_version)
+            current_tags.append(rules.find_tag_for(tags, current_version))
+
+        package_bumps = []
+        for package, provider, current_version, current_tag, commits in zip(
+            packages,
+            providers,
+            current_versions,
+            current_tags,
+            self._get_package_commits(packages, current_tags),
+        ):
+            rules = TagRules.from_settings(package.config.settings)
+            current_tag_version = (
+                current_tag.name
+                if current_tag
+                else rules.normalize_tag(current_version)
+            )
+            if current_tag is None and not self.arguments["yes"]:
+                out.info(f"Package '{package.name}':")
+            is_initial = self._is_initial_tag(current_tag, self.arguments["yes"])
+
+            increment = self.arguments["increment"]
+            if increment is None and commits:
+                increment = self._find_increment(commits)
+            if increment is None and self.arguments["allow_no_commit"]:
+                increment = "PATCH"
+            if increment is None and not current_version.is_prerelease:
+                continue
+            new_version = current_version.bump(
+                increment,
+                prerelease=self.arguments["prerelease"],
+                prerelease_offset=self.bump_settings["prerelease_offset"],
+                devrelease=self.arguments["devrelease"],
+                is_local_version=self.arguments["local_version"],
+                build_metadata=self.arguments["build_metadata"],
+                exact_increment=self.arguments["increment_mode"] == "exact",
+            )
+            new_tag_version = rules.normalize_tag(new_version)
+            if new_tag_version == current_tag_version:
+                continue
+            package_bumps.append(
+                _PackageBump(
+                    package=package,
+                    provider=provider,
+                    commits=commits,
+                    is_initial=is_initial,
+                    increment=increment,
+                    current_version=current_version,
+                    current_tag_version=current_tag_version,
+                    new_version=new_version,
+                    new_tag_version=new_tag_version,
+                )
+            )
+
+        if not package_bumps:
+            raise NoneIncrementExit(
+                "[NO_COMMITS_TO_BUMP]\nNo package has commits eligible to be bumped"
+            )
+
+        message_templates = [
+            self.arguments.get("bump_message")
+            or b.package.config.settings["bump_message"]
+            for b in package_bumps
+        ]
+        if any(message_templates):
+            message = "\n".join(
+                bump.create_commit_message(
+                    b.current_version, b.new_version, message_template
+                )
+                for b, message_template in zip(package_bumps, message_templates)
+            )
+        else:
+            message = "\n".join(
+                (
+                    f"bump: {', '.join(b.new_tag_version for b in package_bumps)}",
+                    "",
+                    *(
+                        f"- {b.package.name}: {b.current_version} → {b.new_version}"
+                        for b in package_bumps
+                    ),
+                )
+            )
+        for b in package_bumps:
+            information = (
+                f"{b.package.name}: version {b.current_version} → {b.new_version}\n"
+                f"tag to create: {b.new_tag_version}\n"
+            )
+            if b.increment:
+                information += f"increment detected: {b.increment}\n"
+            out.write(information)
+
+        dry_run = self.arguments["dry_run"]
+        updated_files: list[str] = []
+        changelog_file_names: dict[str, str] = {}
+        for b in package_bumps:
+            with _working_directory(b.package.directory):
+                if self.changelog_flag:
+                    changelog_cmd = Changelog(
+                        b.package.config,
+                        {
+                            "unreleased_version": b.new_tag_version,
+                            # Resolved for the package by Changelog when empty
+                            "template": self.arguments["template"] or "",
+                            "extras": self.extras,
+                            "incremental": True,
+                            "dry_run": dry_run,
+                            "during_version_bump": self.arguments["prerelease"] is None,
+                            "file_name": os.path.abspath(
+                                b.package.config.settings["changelog_file"]
+                            ),
+                            "allow_no_commit": True,
+                            "commits": b.commits,
+                        },
+                    )
+                    try:
+                        changelog_cmd()
+                    except DryRunExit:
+                        continue
+                    changelog_file_names[b.package.name] = changelog_cmd.file_name
+                    updated_files.append(changelog_cmd.file_name)
+
+                if dry_run:
+                    continue
+
+                for update in bump.replace_version_in_files(
+                    str(b.current_version),
+                    str(b.new_version),
+                    b.package.config.settings["version_files"],
+                    check_consistency=self.check_consistency,
+                    encoding=b.package.config.settings["encoding"],
+                    include_untracked=b.package.config.settings[
+                        "version_files_include_untracked"
+                    ],
+                ):
+                    updated_files.append(os.path.abspath(update.path))
+                b.provider.set_version(str(b.new_version))
+
+        # Do not perform operations over files or git.
+        if dry_run:
+            raise DryRunExit()
+
+        if self.pre_bump_hooks:
+            # A single time limit for the hooks of all the packages
+            deadline = hooks.deadline(self.hook_total_timeout)
+            try:
+                for b in package_bumps:
+                    hooks.run(
+                        self.pre_bump_hooks,
+                        _env_prefix="CZ_PRE_",
+                        _jobs=self.hook_jobs,
+                        _timeout=self.hook_timeout,
+                        _total_timeout=self.hook_total_timeout,
+                        _deadline=deadline,
+                        _timings=self.pre_bump_hook_timings,
+                        package=b.package.name,
+                        is_initial=b.is_initial,
+                        current_version=str(b.current_version),
+                        current_tag_version=b.current_tag_version,
+                        new_version=b.new_version.public,
+                        new_tag_version=b.new_tag_version,
+                        message=message,
+                        increment=b.increment,
+                        changelog_file_name=changelog_file_names.get(b.package.name),
+                    )
+            finally:
+                self._report_hook_timings("pre-bump", self.pre_bump_hook_timings)
+
+        if self.arguments.get("version_files_only"):
+            raise ExpectedExit()
+
+        self._commit(message, updated_files)
+        for b in package_bumps:
+            self._tag(b.new_tag_version)
+
+        if self.post_bump_hooks:
+            deadline = hooks.deadline(self.hook_total_timeout)
+            try:
+                for b in package_bumps:
+                    hooks.run(
+                        self.post_bump_hooks,
+                        _env_prefix="CZ_POST_",
+                        _jobs=self.hook_jobs,
+                        _timeout=self.hook_timeout,
+                        _total_timeout=self.hook_total_timeout,
+                        _deadline=deadline,
+                        _timings=self.post_bump_hook_timings,
+                        package=b.package.name,
+                        was_initial=b.is_initial,
+                        previous_version=str(b.current_version),
+                        previous_tag_version=b.current_tag_version,
+                        current_version=b.new_version.public,
+                        current_tag_version=b.new_tag_version,
+                        message=message,
+                        increment=b.increment,
+                        changelog_file_name=changelog_file_names.get(b.package.name),
+                    )
+            finally:
+                self._report_hook_timings("post-bump", self.post_bump_hook_timings)
+
+        out.success("Done!")
+
+    def _get_packages(self) -> list[_Package]:
+        git_project_root = git.find_git_project_root()
+        if git_project_root is None:
+            raise NotAGitProjectError()
+
+        packages = []
+        tag_formats: set[str] = set()
+        for settings in self.config.settings["packages"]:
+            name = settings.get("name")
+            directory = settings.get("path")
+            tag_format = settings.get("tag_format")
+            if not name or directory is None or not tag_format:
+                raise InvalidConfigurationError(
+                    "Each of the packages needs a name, a path and a tag_format."
+                )
+            if tag_format in tag_formats:
+                raise InvalidConfigurationError(
+                    f"Package '{name}' has the tag_format of another package."
+                )
+            tag_formats.add(tag_format)
+
+            path = os.path.relpath(
+                os.path.abspath(directory), git_project_root
+            ).replace(os.sep, "/")
+            if path == os.pardir or path.startswith(f"{os.pardir}/"):
+                raise InvalidConfigurationError(
+                    f"Package '{name}' is outside of the git project."
+                )
+
+            config = copy.deepcopy(self.config)
+            config.update(
+                {
+                    "changelog_file": defaults.DEFAULT_SETTINGS["changelog_file"],
+                    "version_files": [],
+                    **{k: v for k, v in settings.items() if k not in ("name", "path")},  # type: ignore[typeddict-item]
+                }
+            )
+            if config.settings["version_provider"] in (None, "commitizen"):
+                raise InvalidConfigurationError(
+                    f"Package '{name}' needs a version_provider reading its files, "
+                    "such as pep621, npm or cargo."
+                )
+            packages.append(
+                _Package(
+                    name=name,
+                    directory=directory,
+                    path="" if path == "." else path,
+                    config=config,
+                )
+            )
+        return packages
+
+    def _get_package_commits(
+        self, packages: list[_Package], current_tags: list[git.GitTag | None]
+    ) -> list[list[git.GitCommit]]:
+        """Get the commits of each package since its current tag, reading the log once."""
+        start = None
+        if all(current_tags):
+            start = git.get_merge_base(*(tag.rev for tag in current_tags if tag))
+        commits_with_filenames = git.get_commits_with_filenames(
+            start, args=["--topo-order"]
+        )
+        commits_by_path = bump.partition_commits(
+            commits_with_filenames, (package.path for package in packages)
+        )
+        parents = {commit.rev: commit.parents for commit, _ in commits_with_filenames}
+
+        package_commits = []
+        for package, tag in zip(packages, current_tags):
+            commits = commits_by_path.get(package.path, [])
+            if tag is not None:
+                if tag.rev in parents or tag.rev == start:
+                    released = _get_ancestors(tag.rev, parents)
+                else:
+                    # Not reachable from HEAD
+                    released = set(git.get_commit_batch(start, tag.rev).revs())
+                commits = [commit for commit in commits if commit.rev not in released]
+            package_commits.append(commits)
+        return package_commits
+
+    def _commit(self, message: str, updated_files: list[str]) -> None:
         # FIXME: check if any changes have been staged
         git.add(*updated_files)
         c = git.commit(message, args=self._get_commit_args())
@@ -398,8 +821,9 @@ class Bump:
                 out_func = out.diagnostic if self.git_output_to_stderr else out.write
                 out_func(msg)
 
+    def _tag(self, tag: str) -> None:
         c = git.tag(
-            new_tag_version,
+            tag,
             signed=any(
                 (
                     self.bump_settings.get("gpg_sign"),
@@ -419,28 +843,52 @@ class Bump:
         if c.return_code != 0:
             raise BumpTagFailedError(c.err)
 
-        if self.post_bump_hooks:
-            hooks.run(
-                self.post_bump_hooks,
-                _env_prefix="CZ_POST_",
-                was_initial=is_initial,
-                previous_version=str(current_version),
-                previous_tag_version=current_tag_version,
-                current_version=new_version.public,
-                current_tag_version=new_tag_version,
-                message=message,
-                increment=increment,
-                changelog_file_name=changelog_file_name,
-            )
-
-        # TODO: For v3 output this only as diagnostic and remove this if
-        if self.changelog_to_stdout:
-            out.diagnostic("Done!")
-        else:
-            out.success("Done!")
-
     def _get_commit_args(self) -> list[str]:
         commit_args = ["-a"]
         if self.no_verify:
             commit_args.append("--no-verify")
         return commit_args
+
+
+class _Package(NamedTuple):
+    name: str
+    # As configured, relative to the current directory
+    directory: str
+    # Relative to the root of the git project, "" for the root itself
+    path: str
+    config: BaseConfig
+
+
+class _PackageBump(NamedTuple):
+    package: _Package
+    provider: VersionProvider
+    commits: list[git.GitCommit]
+    is_initial: bool
+    increment: Increment | None
+    current_version: VersionProtocol
+    current_tag_version: str
+    new_version: VersionProtocol
+    new_tag_version: str
+
+
+@contextmanager
+def _working_directory(path: str) -> Generator[None, None, None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _get_ancestors(rev: str, parents: Mapping[str, list[str]]) -> set[str]:
+    """Get the commit and its ancestors, among the commits of `parents`."""
+    ancestors = set()
+    pending = [rev]
+    while pending:
+        current = pending.pop()
+        if current in ancestors or current not in parents:
+            continue
+        ancestors.add(current)
+        pending.extend(parents[current])
+    return ancestors
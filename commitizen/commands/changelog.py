@@ -5,7 +5,7 @@ from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict, cast
 
-from commitizen import changelog, defaults, factory, git, out
+from commitizen import changelog, defaults, factory, git, out, profiling
 from commitizen.changelog_formats import get_changelog_format
 from commitizen.cz.utils import strip_local_version
 from commitizen.exceptions import (
@@ -21,7 +21,7 @@ from commitizen.tags import TagRules
 from commitizen.version_schemes import get_version_scheme
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Generator, Iterable, Sequence
 
     from commitizen.config import BaseConfig
 
@@ -43,7 +43,10 @@ class ChangelogArgs(TypedDict, total=False):
     extras: dict[str, Any]
     export_template: str
     during_version_bump: bool | None
+    paths: list[str] | None
     allow_no_commit: bool | None  # Internal-only when invoked by bump.
+    # Internal-only when invoked by bump for one of the `packages`.
+    commits: Sequence[git.GitCommit] | None
 
 
 class Changelog:
@@ -127,6 +130,9 @@ class Changelog:
         self.during_version_bump: bool = arguments.get("during_version_bump") or False
         # Internal flag used when changelog is invoked from `cz bump --allow-no-commit`.
         self.allow_no_commit: bool = bool(arguments.get("allow_no_commit"))
+        # Commits already fetched by bump, used instead of the git log
+        self.commits = arguments.get("commits")
+        self.paths: list[str] = arguments.get("paths") or []
 
     def _find_incremental_rev(self, latest_version: str, tags: Iterable[GitTag]) -> str:
         """Try to find the 'start_rev'.
@@ -257,7 +263,13 @@ class Changelog:
                     changelog_meta.latest_version_position = None
                     changelog_meta.unreleased_end = latest_full_release_info.index + 1
 
-        commits = git.get_commits(start=start_rev, end=end_rev, args=["--topo-order"])
+        commits = (
+            self.commits
+            if self.commits is not None
+            else git.get_commit_batch(
+                start=start_rev, end=end_rev, args=["--topo-order"], paths=self.paths
+            )
+        )
         if (
             not self.allow_no_commit
             and not commits
@@ -265,34 +277,40 @@ class Changelog:
         ):
             raise NoCommitsFoundError("No commits found")
 
-        tree = changelog.generate_tree_from_commits(
-            commits,
-            tags,
-            commit_parser,
-            changelog_pattern,
-            self.unreleased_version,
-            change_type_map=self.change_type_map,
-            changelog_message_builder_hook=self.cz.changelog_message_builder_hook,
-            changelog_release_hook=self.cz.changelog_release_hook,
-            rules=self.tag_rules,
-            during_version_bump=self.during_version_bump,
-        )
-        if self.change_type_order:
-            tree = changelog.generate_ordered_changelog_tree(
-                tree, self.change_type_order
+        tree: Iterable[dict[str, Any]]
+        with profiling.phase("tree build"):
+            tree = changelog.generate_tree_from_commits(
+                commits,
+                tags,
+                commit_parser,
+                changelog_pattern,
+                self.unreleased_version,
+                change_type_map=self.change_type_map,
+                changelog_message_builder_hook=self.cz.changelog_message_builder_hook,
+                changelog_release_hook=self.cz.changelog_release_hook,
+                rules=self.tag_rules,
+                during_version_bump=self.during_version_bump,
             )
-
-        changelog_out = changelog.render_changelog(
-            tree,
-            self.cz.template_loader,
-            self.template,
-            **{
-                "incremental": self.incremental,  # extra variable for the template
-                **self.cz.template_extras,
-                **self.config.settings["extras"],
-                **self.extras,
-            },
-        ).lstrip("\n")
+            if self.change_type_order:
+                tree = changelog.generate_ordered_changelog_tree(
+                    tree, self.change_type_order
+                )
+            if profiling.is_active():
+                # The tree is built lazily while rendering: build it now to time it
+                tree = list(tree)
+
+        with profiling.phase("render"):
+            changelog_out = changelog.render_changelog(
+                tree,
+                self.cz.template_loader,
+                self.template,
+                **{
+                    "incremental": self.incremental,  # extra variable for the template
+                    **self.cz.template_extras,
+                    **self.config.settings["extras"],
+                    **self.extras,
+                },
+            ).lstrip("\n")
 
         # Dry_run is executed here to avoid checking and reading the files
         if self.dry_run:
@@ -301,12 +319,13 @@ class Changelog:
             out.write(changelog_out)
             raise DryRunExit()
 
-        lines = []
-        changelog_path = Path(self.file_name)
-        if self.incremental and changelog_path.is_file():
-            with changelog_path.open(
-                encoding=self.config.settings["encoding"]
-            ) as changelog_file:
-                lines = changelog_file.readlines()
+        with profiling.phase("write"):
+            lines = []
+            changelog_path = Path(self.file_name)
+            if self.incremental and changelog_path.is_file():
+                with changelog_path.open(
+                    encoding=self.config.settings["encoding"]
+                ) as changelog_file:
+                    lines = changelog_file.readlines()
 
-        self._write_changelog(changelog_out, lines, changelog_meta)
+            self._write_changelog(changelog_out, lines, changelog_meta)
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
+import itertools
 import os
-import re
 import sys
+import time
+from collections import deque
+from collections.abc import Generator
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
 
-from commitizen import factory, git, out
+from commitizen import check_cache, factory, git, out
+from commitizen.check_report import REPORTERS
+from commitizen.cz.base import BaseCommitizen, ValidationResult
 from commitizen.exceptions import (
+    CommitMessageLengthExceededError,
     InvalidCommandArgumentError,
     InvalidCommitMessageError,
     NoCommitsFoundError,
 )
 
 if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from commitizen.check_report import Reporter
     from commitizen.config import BaseConfig
 
+# Below this many uncached commits, starting processes costs more than it saves
+PARALLEL_THRESHOLD = 1000
+# Commits sent to a worker process at once
+PARALLEL_CHUNK_SIZE = 250
+
 
 class CheckArgs(TypedDict, total=False):
     commit_msg_file: str
@@ -26,6 +42,30 @@ class CheckArgs(TypedDict, total=False):
     allowed_prefixes: list[str]
     message: str
     use_default_range: bool
+    jobs: int
+    no_cache: bool
+    ref_updates: bool
+    output: str
+    fail_fast: bool
+    max_errors: int
+
+
+class CommitCheck(NamedTuple):
+    """The validation of a commit and the time it took."""
+
+    commit: git.GitCommit
+    result: ValidationResult
+    elapsed_us: int
+
+
+class RefUpdate(NamedTuple):
+    """A ref update as given to the pre-receive and pre-push git hooks."""
+
+    ref: str
+    old: str
+    new: str
+    # pre-push hooks: the ref is updated on a remote, not in this repository
+    remote: bool = False
 
 
 class Check:
@@ -51,6 +91,20 @@ class Check:
         )
 
         self.use_default_range = bool(arguments.get("use_default_range"))
+        self.jobs = arguments.get("jobs", 1)
+        self.use_cache = not arguments.get("no_cache")
+        self.output = arguments.get("output")
+        self.max_errors = (
+            1 if arguments.get("fail_fast") else arguments.get("max_errors")
+        )
+        # Whether the last validation stopped with commits left to validate
+        self.stopped_early = False
+        if self.max_errors is not None and self.max_errors < 1:
+            raise InvalidCommandArgumentError("--max-errors must be a positive integer")
+        if self.output is not None and self.output not in REPORTERS:
+            raise InvalidCommandArgumentError(
+                f"Unknown output format '{self.output}', expected one of: {', '.join(REPORTERS)}"
+            )
         self.max_msg_length = arguments.get(
             "message_length_limit", config.settings.get("message_length_limit", 0)
         )
@@ -78,7 +132,15 @@ class Check:
                 "See 'cz check -h' for more information"
             )
 
-        if num_exclusive_args_provided == 0 and not sys.stdin.isatty():
+        self.ref_updates: list[RefUpdate] | None = None
+        if arguments.get("ref_updates"):
+            if num_exclusive_args_provided:
+                raise InvalidCommandArgumentError(
+                    "--ref-updates can't be used with --rev-range, --message or --commit-msg-file! "
+                    "See 'cz check -h' for more information"
+                )
+            self.ref_updates = _parse_ref_updates(sys.stdin.read())
+        elif num_exclusive_args_provided == 0 and not sys.stdin.isatty():
             self.commit_msg = sys.stdin.read()
 
         self.config: BaseConfig = config
@@ -91,32 +153,200 @@ class Check:
             InvalidCommitMessageError: if the commit provided does not follow the conventional pattern
             NoCommitsFoundError: if no commit is found with the given range
         """
-        commits = self._get_commits()
-        if not commits:
-            raise NoCommitsFoundError(f"No commit found with range: '{self.rev_range}'")
+        commits: Iterable[git.GitCommit]
+        if self.ref_updates is not None:
+            new_commits = git.get_commits_from_revs(
+                _get_ref_updates_revs(self.ref_updates)
+            )
+            if self.output is None:
+                self._check_ref_updates(self.ref_updates, new_commits)
+                return
+            commits = new_commits
+        else:
+            commits = self._get_commits()
+
+        if self.output is not None:
+            self._report(REPORTERS[self.output](sys.stdout), commits)
+            return
 
-        pattern = re.compile(self.cz.schema_pattern())
         invalid_commits = [
-            (commit, check.errors)
-            for commit in commits
-            if not (
-                check := self.cz.validate_commit_message(
-                    commit_msg=commit.message,
-                    pattern=pattern,
-                    allow_abort=self.allow_abort,
-                    allowed_prefixes=self.allowed_prefixes,
-                    max_msg_length=self.max_msg_length,
-                    commit_hash=commit.rev,
-                )
-            ).is_valid
+            (check.commit, check.result.errors)
+            for check in self._validate_commits(commits)
+            if not check.result.is_valid
         ]
 
         if invalid_commits:
             raise InvalidCommitMessageError(
                 self.cz.format_exception_message(invalid_commits)
+                + self._get_stopped_early_message(len(invalid_commits))
             )
         out.success("Commit validation: successful!")
 
+    def _get_stopped_early_message(self, invalid: int) -> str:
+        if not self.stopped_early:
+            return ""
+        return f"\nvalidation stopped after {invalid} invalid commit(s)."
+
+    def _report(self, reporter: Reporter, commits: Iterable[git.GitCommit]) -> None:
+        """Stream the validation of every commit in a machine readable format."""
+        total = invalid = 0
+        reporter.start()
+        for check in self._validate_commits(commits):
+            reporter.add(*check)
+            total += 1
+            invalid += not check.result.is_valid
+        reporter.finish()
+        if invalid:
+            raise InvalidCommitMessageError(
+                f"commit validation: failed!\n{invalid} of {total} commits are invalid."
+                + self._get_stopped_early_message(invalid)
+            )
+
+    def _check_ref_updates(
+        self, ref_updates: list[RefUpdate], commits: list[git.GitCommit]
+    ) -> None:
+        """Validate the new commits of all the ref updates at once.
+
+        The new commits are listed by a single walk over all the updates, so a
+        commit pushed under several refs is only validated once.
+        """
+        invalid_commits = {
+            check.commit.rev: (check.commit, check.result.errors)
+            for check in self._validate_commits(commits)
+            if not check.result.is_valid
+        }
+        if invalid_commits:
+            raise InvalidCommitMessageError(
+                "\n\n".join(
+                    f'ref "{ref}":\n'
+                    + self.cz.format_exception_message(
+                        [invalid_commits[rev] for rev in revs if rev in invalid_commits]
+                    )
+                    for ref, revs in _get_revs_by_ref(ref_updates, commits).items()
+                    if not invalid_commits.keys().isdisjoint(revs)
+                )
+            )
+        out.success("Commit validation: successful!")
+
+    def _validate_commits(
+        self, commits: Iterable[git.GitCommit]
+    ) -> Iterator[CommitCheck]:
+        """Validate the commits in order, skipping the ones cached as valid.
+
+        The validation stops after `max_errors` invalid commits, closing
+        `commits` when it is a generator such as the git log reader, and
+        setting `stopped_early` if commits were left to validate.
+        """
+        pattern = self.cz.compiled_schema_pattern
+        cache_path = self._get_cache_path(pattern)
+        valid_revs = check_cache.load(cache_path) if cache_path else set()
+
+        commit_iter = iter(commits)
+        read = 0
+
+        def read_commits() -> Iterator[git.GitCommit]:
+            nonlocal read
+            for commit in commit_iter:
+                read += 1
+                yield commit
+
+        results = self._validate_messages(read_commits(), valid_revs)
+        newly_valid: list[str] = []
+        validated = errors = 0
+        self.stopped_early = False
+        try:
+            for commit, result, elapsed_us in results:
+                validated += 1
+                if not result.is_valid:
+                    errors += 1
+                elif commit.rev not in valid_revs:
+                    newly_valid.append(commit.rev)
+                yield CommitCheck(commit, result, elapsed_us)
+                if errors == self.max_errors:
+                    # Commits read ahead by the validation, or still to read
+                    self.stopped_early = (
+                        read > validated or next(commit_iter, None) is not None
+                    )
+                    return
+            if not validated and self.ref_updates is None:
+                raise NoCommitsFoundError(
+                    f"No commit found with range: '{self.rev_range}'"
+                )
+        finally:
+            results.close()
+            if isinstance(commits, Generator):
+                commits.close()
+            if cache_path:
+                check_cache.store(cache_path, newly_valid)
+
+    def _get_cache_path(self, pattern: re.Pattern[str]) -> Path | None:
+        if not self.use_cache or not (
+            self.rev_range or self.use_default_range or self.ref_updates is not None
+        ):
+            return None
+        git_location = git.find_git_location()
+        if git_location is None:
+            return None
+        cz_class = type(self.cz)
+        key = check_cache.rules_key(
+            cz_name=f"{cz_class.__module__}.{cz_class.__qualname__}",
+            cz_modules=check_cache.cz_fingerprint(cz_class),
+            schema_pattern=pattern.pattern,
+            allowed_prefixes=self.allowed_prefixes,
+            max_msg_length=self.max_msg_length,
+            allow_abort=self.allow_abort,
+        )
+        return check_cache.get_cache_path(git_location.git_dir, key)
+
+    def _validate_messages(
+        self,
+        commits: Iterable[git.GitCommit],
+        valid_revs: set[str],
+    ) -> Generator[tuple[git.GitCommit, ValidationResult, int], None, None]:
+        options = _ValidationOptions(
+            allow_abort=self.allow_abort,
+            allowed_prefixes=self.allowed_prefixes,
+            max_msg_length=self.max_msg_length,
+        )
+        # Reports list every commit instead of stopping at the first one too long
+        report_length_errors = self.output is not None
+        cached_result = ValidationResult(True, [])
+
+        jobs = self.jobs or os.cpu_count() or 1
+        if jobs > 1:
+            # Only read ahead the commits needed to know if processes pay off
+            commits = iter(commits)
+            read_ahead: list[git.GitCommit] = []
+            pending = 0
+            for commit in commits:
+                read_ahead.append(commit)
+                pending += commit.rev not in valid_revs
+                if pending == PARALLEL_THRESHOLD:
+                    break
+            commits = itertools.chain(read_ahead, commits)
+            if pending == PARALLEL_THRESHOLD:
+                yield from _validate_in_processes(
+                    self.config,
+                    options,
+                    report_length_errors,
+                    commits,
+                    valid_revs,
+                    jobs,
+                )
+                return
+
+        validate = _get_validator(self.cz, options)
+        for commit in commits:
+            if commit.rev in valid_revs:
+                yield commit, cached_result, 0
+            else:
+                yield (
+                    commit,
+                    *_validate_commit(
+                        validate, report_length_errors, commit.message, commit.rev
+                    ),
+                )
+
     def _get_commit_message(self) -> str | None:
         if self.commit_msg_file is None:
             # Get commit message from command line (--message)
@@ -127,15 +357,16 @@ class Check:
             encoding=self.config.settings["encoding"]
         )
 
-    def _get_commits(self) -> list[git.GitCommit]:
+    def _get_commits(self) -> Iterable[git.GitCommit]:
         if (msg := self._get_commit_message()) is not None:
             return [git.GitCommit(rev="", title="", body=self._filter_comments(msg))]
 
         # Get commit messages from git log (--rev-range)
-        return git.get_commits(
-            git.get_default_branch() if self.use_default_range else None,
-            self.rev_range,
-        )
+        start = git.get_default_branch() if self.use_default_range else None
+        if self.max_errors is not None:
+            # Read the log as it comes, the validation may stop early
+            return git.iter_commits(start, self.rev_range)
+        return git.get_commits(start, self.rev_range)
 
     @staticmethod
     def _filter_comments(msg: str) -> str:
@@ -167,3 +398,206 @@ class Check:
             if not line.startswith("#"):
                 lines.append(line)
         return "\n".join(lines)
+
+
+def _parse_ref_updates(text: str) -> list[RefUpdate]:
+    """Parse the `<old> <new> <ref>` lines given to pre-receive hooks.
+
+    The `<local ref> <local sha> <remote ref> <remote sha>` lines given to
+    pre-push hooks are accepted as well.
+    """
+    ref_updates = []
+    for line in text.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) == 3:
+            old, new, ref = fields
+            ref_updates.append(RefUpdate(ref, old, new))
+        elif len(fields) == 4:
+            _, new, ref, old = fields
+            ref_updates.append(RefUpdate(ref, old, new, remote=True))
+        else:
+            raise InvalidCommandArgumentError(f"Invalid ref update: '{line}'")
+    return ref_updates
+
+
+def _is_null_object(rev: str) -> bool:
+    return not rev.strip("0")
+
+
+def _get_ref_updates_revs(ref_updates: Iterable[RefUpdate]) -> list[str]:
+    """Get the revisions to walk to list the commits new to any of the refs."""
+    revs = []
+    known_refs: set[str] = set()
+    for ref_update in ref_updates:
+        if _is_null_object(ref_update.new):
+            # Deleted ref
+            continue
+        revs.append(ref_update.new)
+        if not _is_null_object(ref_update.old):
+            revs.append(f"^{ref_update.old}")
+        elif ref_update.remote:
+            # New remote ref: only what the remote is not known to have is new
+            known_refs.add("refs/remotes")
+        else:
+            # New ref: the refs are not updated yet in a pre-receive hook
+            known_refs.update(("refs/heads", "refs/tags"))
+    if known_refs:
+        revs.extend(f"^{rev}" for rev in git.get_ref_objects(*sorted(known_refs)))
+    return revs
+
+
+def _get_revs_by_ref(
+    ref_updates: Iterable[RefUpdate], commits: Iterable[git.GitCommit]
+) -> dict[str, list[str]]:
+    """Get the new commits of each ref, in log order."""
+    parents = {commit.rev: commit.parents for commit in commits}
+    revs_by_ref: dict[str, list[str]] = {}
+    attributed: set[str] = set()
+    unresolved_refs = []
+    for ref_update in ref_updates:
+        if ref_update.new not in parents:
+            # e.g. an annotated tag, whose commits are attributed below
+            if not _is_null_object(ref_update.new):
+                unresolved_refs.append(ref_update.ref)
+            continue
+        reachable: set[str] = set()
+        to_visit = [ref_update.new]
+        while to_visit:
+            rev = to_visit.pop()
+            if rev in parents and rev not in reachable:
+                reachable.add(rev)
+                to_visit.extend(parents[rev])
+        attributed |= reachable
+        revs_by_ref.setdefault(ref_update.ref, []).extend(
+            rev for rev in parents if rev in reachable
+        )
+
+    unattributed = [rev for rev in parents if rev not in attributed]
+    for ref in unresolved_refs:
+        revs_by_ref.setdefault(ref, []).extend(unattributed)
+    return revs_by_ref
+
+
+class _ValidationOptions(TypedDict):
+    allow_abort: bool
+    allowed_prefixes: list[str]
+    max_msg_length: int | None
+
+
+def _get_validator(
+    cz: BaseCommitizen, options: _ValidationOptions
+) -> Callable[[str, str], ValidationResult]:
+    """Get the function validating a commit message and its hash."""
+    if type(cz).validate_commit_message is BaseCommitizen.validate_commit_message:
+        return cz.commit_message_validator(**options)
+
+    # The rule still customizes the validation of each message
+    pattern = cz.compiled_schema_pattern
+
+    def validate(commit_msg: str, commit_hash: str) -> ValidationResult:
+        return cz.validate_commit_message(
+            commit_msg=commit_msg,
+            pattern=pattern,
+            commit_hash=commit_hash,
+            **options,
+        )
+
+    return validate
+
+
+def _validate_commit(
+    validate: Callable[[str, str], ValidationResult],
+    report_length_errors: bool,
+    commit_msg: str,
+    commit_hash: str,
+) -> tuple[ValidationResult, int]:
+    """Validate a commit message, also returning the elapsed microseconds."""
+    start = time.perf_counter_ns()
+    try:
+        result = validate(commit_msg, commit_hash)
+    except CommitMessageLengthExceededError as e:
+        if not report_length_errors:
+            raise
+        result = ValidationResult(False, [e.message])
+    return result, (time.perf_counter_ns() - start) // 1000
+
+
+def _validate_in_processes(
+    config: BaseConfig,
+    options: _ValidationOptions,
+    report_length_errors: bool,
+    commits: Iterable[git.GitCommit],
+    valid_revs: set[str],
+    jobs: int,
+) -> Generator[tuple[git.GitCommit, ValidationResult, int], None, None]:
+    """Validate the commits in worker processes, in order.
+
+    The commits are read by chunks as the validation goes, at most two
+    chunks per process ahead of the results, so that closing the generator
+    soon stops reading `commits`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(config, options, report_length_errors),
+    )
+    in_flight: deque[
+        tuple[list[git.GitCommit], Future[list[tuple[ValidationResult, int]]]]
+    ] = deque()
+    try:
+        commits = iter(commits)
+        while chunk := list(itertools.islice(commits, PARALLEL_CHUNK_SIZE)):
+            messages = [
+                (commit.message, commit.rev)
+                for commit in chunk
+                if commit.rev not in valid_revs
+            ]
+            in_flight.append((chunk, executor.submit(_validate_chunk, messages)))
+            if len(in_flight) == jobs * 2:
+                yield from _merge_chunk_results(*in_flight.popleft(), valid_revs)
+        while in_flight:
+            yield from _merge_chunk_results(*in_flight.popleft(), valid_revs)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _merge_chunk_results(
+    chunk: list[git.GitCommit],
+    future: Future[list[tuple[ValidationResult, int]]],
+    valid_revs: set[str],
+) -> Iterator[tuple[git.GitCommit, ValidationResult, int]]:
+    """Pair the commits of a chunk with their results, the cached ones included."""
+    results = iter(future.result())
+    cached_result = ValidationResult(True, [])
+    for commit in chunk:
+        if commit.rev in valid_revs:
+            yield commit, cached_result, 0
+        else:
+            yield commit, *next(results)
+
+
+_worker_state: tuple[Callable[[str, str], ValidationResult], bool]
+
+
+def _init_worker(
+    config: BaseConfig, options: _ValidationOptions, report_length_errors: bool
+) -> None:
+    global _worker_state
+    _worker_state = (
+        _get_validator(factory.committer_factory(config), options),
+        report_length_errors,
+    )
+
+
+def _validate_chunk(
+    messages: list[tuple[str, str]],
+) -> list[tuple[ValidationResult, int]]:
+    validate, report_length_errors = _worker_state
+    return [
+        _validate_commit(validate, report_length_errors, commit_msg, commit_hash)
+        for commit_msg, commit_hash in messages
+    ]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import socket
+from typing import TYPE_CHECKING, TypedDict
+
+from commitizen import daemon, out, serve_protocol
+from commitizen.exceptions import ServeError
+
+if TYPE_CHECKING:
+    from commitizen.config import BaseConfig
+
+
+class ServeArgs(TypedDict, total=False):
+    idle_timeout: float
+
+
+class Serve:
+    """Keep a warm process answering `cz check` and `cz version` for the current directory."""
+
+    def __init__(self, config: BaseConfig, arguments: ServeArgs) -> None:
+        self.config = config
+        idle_timeout = arguments.get("idle_timeout")
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None else daemon.DEFAULT_IDLE_TIMEOUT
+        )
+
+    def __call__(self) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise ServeError("cz serve requires Unix domain sockets support.")
+
+        path = serve_protocol.socket_path()
+        daemon.make_socket_dir(path.parent)
+        if path.exists():
+            if serve_protocol.request(["version"]) is not None:
+                raise ServeError(f"A server is already running on '{path}'.")
+            # Left behind by a server which didn't exit cleanly
+            path.unlink()
+
+        server = daemon.CommitizenServer(path, idle_timeout=self.idle_timeout)
+        out.info(f"Serving on '{path}'")
+        try:
+            server.serve_until_idle()
+        finally:
+            server.server_close()
+            path.unlink(missing_ok=True)
+        out.info(f"Idle for {self.idle_timeout}s, shutting down")
@@ -162,7 +162,7 @@ class Version:
         """Calculate the next version based on commits."""
         rules = TagRules.from_settings(self.config.settings)
         current_tag = rules.find_tag_for(git.get_tags(), current_version)
-        commits = git.get_commits(current_tag.name if current_tag else None)
+        commits = git.get_commit_batch(current_tag.name if current_tag else None)
 
         # No commits, there is no need to create an empty tag.
         # Unless we previously had a prerelease.
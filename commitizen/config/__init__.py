@@ -3,18 +3,26 @@ from __future__ import annotations
 from pathlib import Path
 
 from commitizen import defaults, git, out
+from commitizen.config import settings_cache
 from commitizen.config.factory import create_config
 from commitizen.exceptions import ConfigFileIsEmpty, ConfigFileNotFound
 
 from .base_config import BaseConfig
 
 
-def _resolve_config_candidates() -> list[BaseConfig]:
-    git_project_root = git.find_git_project_root()
+def _get_search_paths(git_project_root: Path | None) -> list[Path]:
     cfg_search_paths = [Path(".")]
 
     if git_project_root and cfg_search_paths[0].resolve() != git_project_root.resolve():
         cfg_search_paths.append(git_project_root)
+    return cfg_search_paths
+
+
+def _resolve_config_candidates(
+    cfg_search_paths: list[Path] | None = None,
+) -> list[BaseConfig]:
+    if cfg_search_paths is None:
+        cfg_search_paths = _get_search_paths(git.find_git_project_root())
 
     candidates: list[BaseConfig] = []
     for dir in cfg_search_paths:
@@ -31,6 +39,55 @@ def _create_config_from_path(path: Path) -> BaseConfig:
     return create_config(data=path.read_bytes(), path=path)
 
 
+def _read_cached_cfg() -> BaseConfig:
+    """Resolve the configuration, reusing the settings cached in the git directory if unchanged."""
+    git_location = git.find_git_location()
+    cfg_search_paths = _get_search_paths(
+        git_location.work_tree if git_location else None
+    )
+    cache_path = settings_cache.get_cache_path(
+        git_location.git_dir if git_location else None
+    )
+    if cache_path is None:
+        return _select_candidate(_resolve_config_candidates(cfg_search_paths))
+
+    cache_key = str(Path(".").resolve())
+    files = settings_cache.fingerprint(cfg_search_paths)
+    if cached := settings_cache.load(cache_path, cache_key, files):
+        _warn_multiple_candidates(cached.candidates)
+        if not cached.candidates:
+            return BaseConfig()
+        conf = create_config(path=cached.candidates[0])
+        conf.update(cached.settings)
+        conf._contains_commitizen_section = cached.contains_commitizen_section
+        return conf
+
+    config_candidates = _resolve_config_candidates(cfg_search_paths)
+    conf = _select_candidate(config_candidates)
+    settings_cache.store(
+        cache_path,
+        cache_key,
+        files,
+        [candidate.path for candidate in config_candidates],
+        conf.settings,
+        bool(config_candidates) and conf.contains_commitizen_section(),
+    )
+    return conf
+
+
+def _select_candidate(config_candidates: list[BaseConfig]) -> BaseConfig:
+    _warn_multiple_candidates([conf.path for conf in config_candidates])
+    return config_candidates[0] if config_candidates else BaseConfig()
+
+
+def _warn_multiple_candidates(candidate_paths: list[Path]) -> None:
+    if len(candidate_paths) > 1:
+        out.warn(
+            f"Multiple config files detected: {', '.join(str(path) for path in candidate_paths)}. "
+            f"Using config file: '{candidate_paths[0]}'."
+        )
+
+
 def read_cfg(filepath: str | None = None) -> BaseConfig:
     if filepath is not None:
         conf_path = Path(filepath)
@@ -41,11 +98,4 @@ def read_cfg(filepath: str | None = None) -> BaseConfig:
             raise ConfigFileIsEmpty()
         return conf
 
-    config_candidates = _resolve_config_candidates()
-    if len(config_candidates) > 1:
-        out.warn(
-            f"Multiple config files detected: {', '.join(str(conf.path) for conf in config_candidates)}. "
-            f"Using config file: '{config_candidates[0].path}'."
-        )
-
-    return config_candidates[0] if config_candidates else BaseConfig()
+    return _read_cached_cfg()
@@ -19,6 +19,7 @@ class BaseConfig:
     def __init__(self) -> None:
         self._settings: Settings = DEFAULT_SETTINGS.copy()
         self._path: Path | None = None
+        self._contains_commitizen_section = False
 
     def contains_commitizen_section(self) -> bool:
         """Check if the config file contains a commitizen section.
@@ -2,10 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from commitizen.config.json_config import JsonConfig
-from commitizen.config.toml_config import TomlConfig
-from commitizen.config.yaml_config import YAMLConfig
-
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -13,11 +9,18 @@ if TYPE_CHECKING:
 
 
 def create_config(*, data: bytes | str | None = None, path: Path) -> BaseConfig:
+    # Parsers are imported on demand: most projects only ever need one of them
     if "toml" in path.suffix:
+        from commitizen.config.toml_config import TomlConfig
+
         return TomlConfig(data=data or "", path=path)
     if "json" in path.suffix:
+        from commitizen.config.json_config import JsonConfig
+
         return JsonConfig(data=data or "{}", path=path)
     if "yaml" in path.suffix:
+        from commitizen.config.yaml_config import YAMLConfig
+
         return YAMLConfig(data=data or "", path=path)
 
     # Should be unreachable. See the constant CONFIG_FILES.
@@ -23,15 +23,11 @@ class JsonConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path) -> None:
         super().__init__()
         self.path = path
+        self._contains_commitizen_section = False
         self._parse_setting(data)
 
     def contains_commitizen_section(self) -> bool:
-        with self.path.open("rb") as json_file:
-            try:
-                config_doc = json.load(json_file)
-            except json.JSONDecodeError:
-                return False
-        return config_doc.get("commitizen") is not None
+        return self._contains_commitizen_section
 
     def init_empty_config_content(self) -> None:
         with smart_open(
@@ -64,6 +60,7 @@ class JsonConfig(BaseConfig):
         except json.JSONDecodeError as e:
             raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
+        self._contains_commitizen_section = doc.get("commitizen") is not None
         try:
             self.settings.update(doc["commitizen"])
         except KeyError:
@@ -0,0 +1,121 @@
+"""Persistent cache of the resolved settings, stored in the git directory.
+
+Discovering the configuration means probing every `CONFIG_FILES` candidate in
+the current directory and the git project root and parsing the ones found.
+The resolved settings are cached along with the `(path, size, mtime_ns)` of
+every probed candidate, so that an unchanged project skips all of this.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from commitizen import defaults
+from commitizen.__version__ import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from commitizen.defaults import Settings
+
+CACHE_FILENAME = "commitizen-settings-cache.json"
+# Files modified more recently than this could be modified again within the
+# same mtime tick and size without being noticed, so they are not cached.
+RACY_DELAY_NS = 1_000_000_000
+# Entries are keyed by working directory, the least recently stored ones are
+# dropped beyond this
+MAX_ENTRIES = 32
+
+Fingerprint = list[tuple[str, int, int] | tuple[str, None, None]]
+
+
+class CachedSettings(NamedTuple):
+    candidates: list[Path]
+    settings: Settings
+    contains_commitizen_section: bool
+
+
+def get_cache_path(git_dir: Path | None) -> Path | None:
+    """Get the cache location, if the project has a git directory to store it."""
+    if git_dir is None or not git_dir.is_dir():
+        return None
+    return git_dir / CACHE_FILENAME
+
+
+def fingerprint(search_paths: Iterable[Path]) -> Fingerprint:
+    """Get the stat of every configuration file candidate, existing or not."""
+    result: Fingerprint = []
+    for directory in search_paths:
+        for filename in defaults.CONFIG_FILES:
+            path = directory / filename
+            try:
+                stat = path.stat()
+            except OSError:
+                result.append((str(path), None, None))
+                continue
+            result.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return result
+
+
+def load(cache_path: Path, key: str, files: Fingerprint) -> CachedSettings | None:
+    """Get the cached config file candidates and settings, if still valid."""
+    try:
+        content = json.loads(cache_path.read_bytes())
+        entry = content["entries"][key]
+        if content.get("version") != __version__ or entry["files"] != _jsonify(files):
+            return None
+        return CachedSettings(
+            [Path(path) for path in entry["candidates"]],
+            entry["settings"],
+            entry["contains_commitizen_section"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store(
+    cache_path: Path,
+    key: str,
+    files: Fingerprint,
+    candidates: Iterable[Path],
+    settings: Settings,
+    contains_commitizen_section: bool,
+) -> None:
+    """Cache the resolved settings, silently giving up on any failure."""
+    now = time.time_ns()
+    if any(mtime is not None and now - mtime < RACY_DELAY_NS for _, _, mtime in files):
+        return
+
+    try:
+        content = json.loads(cache_path.read_bytes())
+        if content.get("version") != __version__:
+            raise ValueError("outdated cache")
+    except (OSError, ValueError):
+        content = {"version": __version__, "entries": {}}
+
+    entries = content["entries"]
+    # Reinserted so that the entries stay ordered from the least recently stored
+    entries.pop(key, None)
+    entries[key] = {
+        "files": _jsonify(files),
+        "candidates": [str(path) for path in candidates],
+        "settings": settings,
+        "contains_commitizen_section": contains_commitizen_section,
+    }
+    for stale_key in list(entries)[:-MAX_ENTRIES]:
+        del entries[stale_key]
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(content), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Not writable or settings not serializable
+        tmp_path.unlink(missing_ok=True)
+
+
+def _jsonify(files: Fingerprint) -> list[list[Any]]:
+    return [list(file) for file in files]
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from tomlkit import TOMLDocument, exceptions, parse, table
+import sys
+from typing import TYPE_CHECKING, Any
 
 from commitizen.exceptions import InvalidConfigurationError
 
 from .base_config import BaseConfig
 
 if TYPE_CHECKING:
-    import sys
     from pathlib import Path
 
     # Self is Python 3.11+ but backported in typing-extensions
@@ -23,13 +21,17 @@ class TomlConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path) -> None:
         super().__init__()
         self.path = path
+        self._contains_commitizen_section = False
         self._parse_setting(data)
 
     def contains_commitizen_section(self) -> bool:
-        config_doc = parse(self.path.read_bytes())
-        return config_doc.get("tool", {}).get("commitizen") is not None
+        return self._contains_commitizen_section
 
     def init_empty_config_content(self) -> None:
+        # tomlkit preserves the existing formatting but is much slower than tomllib,
+        # so it is only used when writing.
+        from tomlkit import TOMLDocument, parse, table
+
         config_doc = TOMLDocument()
         if self.path.is_file():
             config_doc = parse(self.path.read_bytes())
@@ -44,6 +46,8 @@ class TomlConfig(BaseConfig):
             )
 
     def set_key(self, key: str, value: object) -> Self:
+        from tomlkit import parse
+
         config_doc = parse(self.path.read_bytes())
 
         config_doc["tool"]["commitizen"][key] = value  # type: ignore[index]
@@ -60,11 +64,31 @@ class TomlConfig(BaseConfig):
         ```
         """
         try:
-            doc = parse(data)
-        except exceptions.ParseError as e:
+            doc = _load_toml(data)
+        except ValueError as e:
             raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
-        try:
-            self.settings.update(doc["tool"]["commitizen"])  # type: ignore[index,typeddict-item] # TODO: fix this
-        except exceptions.NonExistentKey:
-            pass
+        commitizen_section = doc.get("tool", {}).get("commitizen")
+        self._contains_commitizen_section = commitizen_section is not None
+        if commitizen_section is not None:
+            self.settings.update(commitizen_section)
+
+
+def _load_toml(data: bytes | str) -> dict[str, Any]:
+    """Parse TOML for read-only access, with the stdlib parser when available.
+
+    Raises:
+        ValueError: if the data is not valid TOML
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        # tomllib.TOMLDecodeError and UnicodeDecodeError are both ValueError
+        return tomllib.loads(data.decode("utf-8") if isinstance(data, bytes) else data)
+
+    from tomlkit import exceptions, parse
+
+    try:
+        return parse(data).unwrap()
+    except exceptions.ParseError as e:
+        raise ValueError(str(e)) from e
@@ -24,6 +24,7 @@ class YAMLConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path) -> None:
         super().__init__()
         self.path = path
+        self._contains_commitizen_section = False
         self._parse_setting(data)
 
     def init_empty_config_content(self) -> None:
@@ -33,9 +34,7 @@ class YAMLConfig(BaseConfig):
             yaml.dump({"commitizen": {}}, json_file, explicit_start=True)
 
     def contains_commitizen_section(self) -> bool:
-        with self.path.open("rb") as yaml_file:
-            config_doc = yaml.load(yaml_file, Loader=yaml.FullLoader)
-        return config_doc is not None and config_doc.get("commitizen") is not None
+        return self._contains_commitizen_section
 
     def _parse_setting(self, data: bytes | str) -> None:
         """We expect to have a section in cz.yaml looking like
@@ -46,10 +45,14 @@ class YAMLConfig(BaseConfig):
         ```
         """
         try:
-            doc = yaml.safe_load(data)
+            # The LibYAML based loader is much faster, when available
+            doc = yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         except yaml.YAMLError as e:
             raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
+        self._contains_commitizen_section = (
+            isinstance(doc, dict) and doc.get("commitizen") is not None
+        )
         try:
             self.settings.update(doc["commitizen"])
         except (KeyError, TypeError):
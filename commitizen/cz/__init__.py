@@ -7,6 +7,8 @@ from collections.abc import Iterable
 from importlib import metadata
 from typing import TYPE_CHECKING
 
+from commitizen import profiling
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
@@ -40,4 +42,5 @@ def discover_plugins(
     }
 
 
-registry: dict[str, type[BaseCommitizen]] = discover_plugins()
+with profiling.phase("plugin load"):
+    registry: dict[str, type[BaseCommitizen]] = discover_plugins()
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+import re
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable, Mapping
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
 
-from jinja2 import BaseLoader, PackageLoader
-from prompt_toolkit.styles import Style
-
 from commitizen.exceptions import CommitMessageLengthExceededError
 
 if TYPE_CHECKING:
-    import re
     from collections.abc import Callable, Iterable, Mapping
 
+    from jinja2 import BaseLoader
+    from prompt_toolkit.styles import Style
+
     from commitizen import git
     from commitizen.config.base_config import BaseConfig
     from commitizen.question import CzQuestion
@@ -30,11 +31,85 @@ class ChangelogReleaseHook(Protocol):
     ) -> dict[str, Any]: ...
 
 
+# The validators kept by `validate_commit_message`, one per set of arguments
+VALIDATORS_CACHE_SIZE = 16
+
+
 class ValidationResult(NamedTuple):
     is_valid: bool
     errors: list
 
 
+class CommitMessageValidator:
+    """Validate commit messages against a compiled schema pattern.
+
+    Everything that doesn't depend on the message is prepared once, so that
+    validating a long range of commits only pays for the checks themselves.
+    Plugins can subclass it and return it from
+    `BaseCommitizen.commit_message_validator` to customize the validation.
+    """
+
+    def __init__(
+        self,
+        pattern: re.Pattern[str] | str,
+        *,
+        allow_abort: bool = False,
+        allowed_prefixes: Iterable[str] = (),
+        max_msg_length: int | None = None,
+    ) -> None:
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.allow_abort = allow_abort
+        self.allowed_prefixes = tuple(allowed_prefixes)
+        self.max_msg_length = max_msg_length or 0
+        self._pattern_error = f"pattern: {self.pattern.pattern}"
+
+    def __call__(self, commit_msg: str, commit_hash: str = "") -> ValidationResult:
+        if not commit_msg:
+            return ValidationResult(
+                self.allow_abort,
+                [] if self.allow_abort else ["commit message is empty"],
+            )
+
+        if self.allowed_prefixes and commit_msg.startswith(self.allowed_prefixes):
+            return ValidationResult(True, [])
+
+        if self.max_msg_length > 0:
+            self.check_length(commit_msg, commit_hash)
+
+        return ValidationResult(
+            self.pattern.match(commit_msg) is not None, [self._pattern_error]
+        )
+
+    def check_length(self, commit_msg: str, commit_hash: str) -> None:
+        """Check the length of the first line, without copying the rest of the message."""
+        end = commit_msg.find("\n")
+        msg_len = len((commit_msg if end == -1 else commit_msg[:end]).strip())
+        if msg_len > self.max_msg_length:
+            # TODO: capitalize the first letter of the error message for consistency in v5
+            raise CommitMessageLengthExceededError(
+                f"commit validation: failed!\n"
+                f"commit message length exceeds the limit.\n"
+                f'commit "{commit_hash}": "{commit_msg}"\n'
+                f"message length limit: {self.max_msg_length} (actual: {msg_len})"
+            )
+
+
+class _DefaultTemplateLoader:
+    """The loader of the templates of commitizen, created on first access.
+
+    jinja2 is slow to import and only needed to render changelogs.
+    """
+
+    _loader: BaseLoader | None = None
+
+    def __get__(self, instance: object, owner: type | None = None) -> BaseLoader:
+        if self._loader is None:
+            from jinja2 import PackageLoader
+
+            self._loader = PackageLoader("commitizen", "templates")
+        return self._loader
+
+
 class BaseCommitizen(metaclass=ABCMeta):
     bump_pattern: str | None = None
     bump_map: dict[str, str] | None = None
@@ -70,9 +145,18 @@ class BaseCommitizen(metaclass=ABCMeta):
     changelog_release_hook: ChangelogReleaseHook | None = None
 
     # Plugins can override templates and provide extra template data
-    template_loader: BaseLoader = PackageLoader("commitizen", "templates")
+    if TYPE_CHECKING:
+        template_loader: BaseLoader
+    else:
+        template_loader = _DefaultTemplateLoader()
     template_extras: dict[str, Any] = {}
 
+    # The arguments and validator of the last `validate_commit_message` call
+    _last_commit_message_validator: (
+        tuple[re.Pattern[str], bool, int | None, list[str], CommitMessageValidator]
+        | None
+    ) = None
+
     def __init__(self, config: BaseConfig) -> None:
         self.config = config
         if not self.config.settings.get("style"):
@@ -88,6 +172,9 @@ class BaseCommitizen(metaclass=ABCMeta):
 
     @property
     def style(self) -> Style:
+        # prompt_toolkit is slow to import and only needed by interactive commands
+        from prompt_toolkit.styles import Style
+
         return Style(
             [
                 *BaseCommitizen.default_style_config,
@@ -111,6 +198,26 @@ class BaseCommitizen(metaclass=ABCMeta):
     def info(self) -> str:
         """Information about the standardized commit message."""
 
+    @cached_property
+    def compiled_schema_pattern(self) -> re.Pattern[str]:
+        """The compiled `schema_pattern`, compiled once per instance."""
+        return re.compile(self.schema_pattern())
+
+    def commit_message_validator(
+        self,
+        *,
+        allow_abort: bool,
+        allowed_prefixes: list[str],
+        max_msg_length: int | None,
+    ) -> CommitMessageValidator:
+        """Get a validator of commit messages, to be reused across commits."""
+        return CommitMessageValidator(
+            self.compiled_schema_pattern,
+            allow_abort=allow_abort,
+            allowed_prefixes=allowed_prefixes,
+            max_msg_length=max_msg_length,
+        )
+
     def validate_commit_message(
         self,
         *,
@@ -121,30 +228,57 @@ class BaseCommitizen(metaclass=ABCMeta):
         max_msg_length: int | None,
         commit_hash: str,
     ) -> ValidationResult:
-        """Validate commit message against the pattern."""
-        if not commit_msg:
-            return ValidationResult(
-                allow_abort, [] if allow_abort else ["commit message is empty"]
-            )
+        """Validate commit message against the pattern.
 
-        if any(map(commit_msg.startswith, allowed_prefixes)):
-            return ValidationResult(True, [])
+        The validators are kept per set of arguments, but calling a
+        `commit_message_validator` directly remains cheaper for many messages.
+        """
+        # Most callers validate many messages with the same arguments
+        last = self._last_commit_message_validator
+        if (
+            last is not None
+            and last[0] is pattern
+            and last[1] is allow_abort
+            and last[2] == max_msg_length
+            and last[3] == allowed_prefixes
+        ):
+            return last[4](commit_msg, commit_hash)
 
-        if max_msg_length is not None and max_msg_length > 0:
-            msg_len = len(commit_msg.partition("\n")[0].strip())
-            if msg_len > max_msg_length:
-                # TODO: capitalize the first letter of the error message for consistency in v5
-                raise CommitMessageLengthExceededError(
-                    f"commit validation: failed!\n"
-                    f"commit message length exceeds the limit.\n"
-                    f'commit "{commit_hash}": "{commit_msg}"\n'
-                    f"message length limit: {max_msg_length} (actual: {msg_len})"
+        # Hashing a pattern hashes its whole source, its id is enough: the
+        # cached validator keeps the pattern alive
+        key = (id(pattern), allow_abort, tuple(allowed_prefixes), max_msg_length)
+        validators = self._commit_message_validators
+        if (validator := validators.get(key)) is None:
+            if len(validators) >= VALIDATORS_CACHE_SIZE:
+                validators.clear()
+            if pattern is self.compiled_schema_pattern:
+                validator = self.commit_message_validator(
+                    allow_abort=allow_abort,
+                    allowed_prefixes=allowed_prefixes,
+                    max_msg_length=max_msg_length,
                 )
-
-        return ValidationResult(
-            bool(pattern.match(commit_msg)),
-            [f"pattern: {pattern.pattern}"],
+            else:
+                validator = CommitMessageValidator(
+                    pattern,
+                    allow_abort=allow_abort,
+                    allowed_prefixes=allowed_prefixes,
+                    max_msg_length=max_msg_length,
+                )
+            validators[key] = validator
+        self._last_commit_message_validator = (
+            pattern,
+            allow_abort,
+            max_msg_length,
+            list(allowed_prefixes),
+            validator,
         )
+        return validator(commit_msg, commit_hash)
+
+    @cached_property
+    def _commit_message_validators(
+        self,
+    ) -> dict[tuple[int, bool, tuple[str, ...], int | None], CommitMessageValidator]:
+        return {}
 
     def format_exception_message(
         self, invalid_commits: list[tuple[git.GitCommit, list]]
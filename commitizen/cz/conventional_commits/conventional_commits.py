@@ -12,6 +12,30 @@ if TYPE_CHECKING:
 
 __all__ = ["ConventionalCommitsCz"]
 
+_CHANGE_TYPES = (
+    "build",
+    "bump",
+    "chore",
+    "ci",
+    "docs",
+    "feat",
+    "fix",
+    "perf",
+    "refactor",
+    "revert",
+    "style",
+    "test",
+)
+_SCHEMA_PATTERN = (
+    r"(?s)"  # To explicitly make . match new line
+    r"(" + "|".join(_CHANGE_TYPES) + r")"  # type
+    r"(\(\S+\))?"  # scope
+    r"!?"
+    r": "
+    r"([^\n\r]+)"  # subject
+    r"((\n\n.*)|(\s*))?$"
+)
+
 
 def _parse_scope(text: str) -> str:
     return "-".join(text.strip().split())
@@ -189,29 +213,7 @@ class ConventionalCommitsCz(BaseCommitizen):
         )
 
     def schema_pattern(self) -> str:
-        change_types = (
-            "build",
-            "bump",
-            "chore",
-            "ci",
-            "docs",
-            "feat",
-            "fix",
-            "perf",
-            "refactor",
-            "revert",
-            "style",
-            "test",
-        )
-        return (
-            r"(?s)"  # To explicitly make . match new line
-            r"(" + "|".join(change_types) + r")"  # type
-            r"(\(\S+\))?"  # scope
-            r"!?"
-            r": "
-            r"([^\n\r]+)"  # subject
-            r"((\n\n.*)|(\s*))?$"
-        )
+        return _SCHEMA_PATTERN
 
     def info(self) -> str:
         filepath = Path(__file__).parent / "conventional_commits_info.txt"
@@ -7,16 +7,8 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
-    from jinja2 import Template
-
     from commitizen.config import BaseConfig
     from commitizen.question import CzQuestion
-else:
-    try:
-        from jinja2 import Template
-    except ImportError:
-        from string import Template
-
 
 from commitizen import defaults
 from commitizen.cz.base import BaseCommitizen
@@ -82,6 +74,15 @@ class CustomizeCommitsCz(BaseCommitizen):
         return self.custom_settings.get("questions", [{}])  # type: ignore[return-value]
 
     def message(self, answers: Mapping[str, Any]) -> str:
+        # jinja2 is slow to import and only needed to create commits
+        if TYPE_CHECKING:
+            from jinja2 import Template
+        else:
+            try:
+                from jinja2 import Template
+            except ImportError:
+                from string import Template
+
         message_template = Template(self.custom_settings.get("message_template", ""))
         if getattr(Template, "substitute", None):
             return message_template.substitute(**answers)  # type: ignore[attr-defined,no-any-return] # pragma: no cover # TODO: check if we can fix this
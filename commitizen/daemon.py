@@ -0,0 +1,293 @@
+"""A warm commitizen process answering `cz check` and `cz version` over a Unix socket.
+
+Git hooks start a new `cz` process for every commit, paying for the interpreter,
+the imports, the config discovery and the plugin resolution each time.
+`cz serve` keeps all of this loaded for one directory and `cz-client` forwards
+the command line to it, falling back to running the command in-process when no
+server is reachable.
+
+The client side of the socket protocol is in `commitizen.serve_protocol`.
+This module only imports the standard library at import time: everything
+else is imported by the server when it starts.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import json
+import os
+import socketserver
+import sys
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from commitizen.serve_protocol import (
+    FORWARDED_ENV_PREFIX,
+    SERVED_COMMANDS,
+    Response,
+    forwarded_env,
+    is_private_dir,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+    from commitizen.config import BaseConfig
+    from commitizen.git import GitTag
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+# Tag listings kept by a `TagIndex`, one per set of arguments and refs
+TAG_INDEX_SIZE = 8
+
+
+def make_socket_dir(path: Path) -> None:
+    """Create the directory of the sockets, checking it is private.
+
+    Raises:
+        ServeError: if the directory exists but isn't private to the current user.
+    """
+    from commitizen.exceptions import ServeError
+
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not is_private_dir(path):
+        raise ServeError(
+            f"Refusing to serve from '{path}': "
+            "it must be a directory only the current user can access."
+        )
+
+
+class _Terminal(io.StringIO):
+    """Stand-in for the stdin of a client attached to a terminal."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: CommitizenServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        payload = json.loads(line)
+        response = self.server.dispatch(
+            payload["argv"], payload.get("stdin"), payload.get("env", {})
+        )
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class CommitizenServer(socketserver.UnixStreamServer):
+    """Serve `cz check` and `cz version` for the current directory.
+
+    The configuration is kept in memory and reloaded whenever one of the
+    candidate configuration files changes on disk, and the tags in a
+    `TagIndex`.
+    The server stops after `idle_timeout` seconds without any request.
+    """
+
+    def __init__(
+        self, path: str | Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ) -> None:
+        # Imported here to keep the client free of any non stdlib dependency
+        from commitizen import cli, git
+
+        make_socket_dir(Path(path).parent)
+        self.parser = cli.cli(cli.data)
+        self.timeout = idle_timeout
+        self.idle = False
+        git_project_root = git.find_git_project_root()
+        self.search_paths = [Path(".")]
+        if git_project_root and Path(".").resolve() != git_project_root.resolve():
+            self.search_paths.append(git_project_root)
+        self._config: BaseConfig | None = None
+        self._config_key: tuple[Any, ...] | None = None
+        self.tag_index = TagIndex(git.get_tags)
+        super().__init__(str(path), _RequestHandler)
+        os.chmod(path, 0o600)
+
+    def serve_until_idle(self) -> None:
+        while not self.idle:
+            self.handle_request()
+
+    def handle_timeout(self) -> None:
+        self.idle = True
+
+    def read_cfg(self, filepath: str | None = None) -> BaseConfig:
+        """Get a copy of the configuration, re-reading it only if it changed on disk."""
+        from commitizen import config, defaults
+
+        watched: Iterable[Path] = (
+            [Path(filepath)]
+            if filepath is not None
+            else (
+                directory / filename
+                for directory in self.search_paths
+                for filename in defaults.CONFIG_FILES
+            )
+        )
+        key = (filepath, *_stat_fingerprint(watched))
+        if self._config is None or key != self._config_key:
+            self._config = config.read_cfg(filepath)
+            self._config_key = key
+        # commands are free to update their configuration
+        return copy.deepcopy(self._config)
+
+    def dispatch(
+        self, argv: Sequence[str], stdin: str | None, env: Mapping[str, str]
+    ) -> Response:
+        """Run the given `cz` command line, capturing its output and exit code.
+
+        It runs with the `GIT_*` variables of `env` instead of the ones of
+        the server.
+        """
+        from commitizen import git
+        from commitizen.cli import parse_no_raise
+        from commitizen.defaults import DEFAULT_SETTINGS
+        from commitizen.exceptions import (
+            CommitizenException,
+            ExitCode,
+            NoCommandFoundError,
+        )
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code: int = ExitCode.EXPECTED_EXIT
+        no_raise: list[int] = []
+        original_stdin = sys.stdin
+        sys.stdin = _Terminal() if stdin is None else io.StringIO(stdin)
+        try:
+            with (
+                _client_env(env),
+                _replaced(git, "get_tags", self.tag_index),
+                redirect_stdout(stdout),
+                redirect_stderr(stderr),
+            ):
+                try:
+                    args = self.parser.parse_args(argv)
+                    if args.no_raise:
+                        no_raise = parse_no_raise(args.no_raise)
+                    if args.func.name.lower() not in SERVED_COMMANDS:
+                        raise NoCommandFoundError()
+                    conf = self.read_cfg(args.config)
+                    if args.name:
+                        conf.update({"name": args.name})
+                    elif not conf.path:
+                        conf.update({"name": DEFAULT_SETTINGS["name"]})
+                    args.func(conf, vars(args))()
+                except CommitizenException as e:
+                    if e.message:
+                        e.output_method(e.message)
+                    if e.exit_code not in no_raise:
+                        exit_code = e.exit_code
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else 1
+        finally:
+            sys.stdin = original_stdin
+        return Response(
+            exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue()
+        )
+
+
+class TagIndex:
+    """The tags of the repository, listed again only when its refs change.
+
+    The refs are fingerprinted with the stat of `packed-refs` and of the
+    loose tags, and with `HEAD` for the tags reachable from it, which is
+    much cheaper than running `git tag` for every `cz version`.
+    """
+
+    def __init__(self, get_tags: Callable[..., list[GitTag]]) -> None:
+        self.get_tags = get_tags
+        self._tags: dict[tuple[Any, ...], list[GitTag]] = {}
+
+    def __call__(
+        self, dateformat: str = "%Y-%m-%d", reachable_only: bool = False
+    ) -> list[GitTag]:
+        from commitizen import git
+
+        location = git.find_git_location()
+        if location is None:
+            return self.get_tags(dateformat=dateformat, reachable_only=reachable_only)
+        key = (
+            dateformat,
+            reachable_only,
+            location.git_dir,
+            *_refs_fingerprint(location.git_dir, reachable_only),
+        )
+        if key not in self._tags:
+            if len(self._tags) == TAG_INDEX_SIZE:
+                self._tags.clear()
+            self._tags[key] = self.get_tags(
+                dateformat=dateformat, reachable_only=reachable_only
+            )
+        return list(self._tags[key])
+
+
+def _refs_fingerprint(git_dir: Path, with_head: bool) -> list[object]:
+    common_dir = git_dir
+    if (commondir_file := git_dir / "commondir").is_file():
+        common_dir = git_dir / commondir_file.read_text().strip()
+    fingerprint: list[object] = [
+        *_stat_fingerprint(
+            [common_dir / "packed-refs", *_walk(common_dir / "refs" / "tags")]
+        )
+    ]
+    # The reftable backend keeps all the refs there
+    fingerprint += _stat_fingerprint(_walk(common_dir / "reftable"))
+    if with_head:
+        head = _read(git_dir / "HEAD")
+        fingerprint.append(head)
+        if head.startswith("ref: "):
+            fingerprint.append(_read(common_dir / head[5:].strip()))
+    return fingerprint
+
+
+def _walk(directory: Path) -> list[Path]:
+    return [Path(root, name) for root, _, names in os.walk(directory) for name in names]
+
+
+def _read(path: Path) -> str:
+    try:
+        return path.read_text()
+    except OSError:
+        return ""
+
+
+@contextmanager
+def _client_env(env: Mapping[str, str]) -> Iterator[None]:
+    """Replace the `GIT_*` environment variables by the ones of the client."""
+    server_env = forwarded_env(os.environ)
+    for name in server_env:
+        del os.environ[name]
+    os.environ.update(forwarded_env(env))
+    try:
+        yield
+    finally:
+        for name in [
+            name for name in os.environ if name.startswith(FORWARDED_ENV_PREFIX)
+        ]:
+            del os.environ[name]
+        os.environ.update(server_env)
+
+
+@contextmanager
+def _replaced(module: object, name: str, value: object) -> Iterator[None]:
+    original = getattr(module, name)
+    setattr(module, name, value)
+    try:
+        yield
+    finally:
+        setattr(module, name, original)
+
+
+def _stat_fingerprint(paths: Iterable[Path]) -> list[tuple[str, int, int]]:
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        fingerprint.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return fingerprint
@@ -3,6 +3,7 @@ from __future__ import annotations
 import warnings
 from collections import OrderedDict
 from collections.abc import Iterable, MutableMapping, Sequence
+from importlib import metadata
 from typing import TYPE_CHECKING, Any, TypedDict
 
 if TYPE_CHECKING:
@@ -29,6 +30,21 @@ class CzSettings(TypedDict, total=False):
     change_type_map: dict[str, str] | None
 
 
+class PackageSettings(TypedDict, total=False):
+    name: str
+    path: str
+    tag_format: str
+    changelog_file: str
+    version_files: list[str]
+    version_provider: str | None
+    version_scheme: str | None
+
+
+class HookTimeoutSettings(TypedDict, total=False):
+    per_hook: float
+    total: float
+
+
 class Settings(TypedDict, total=False):
     allow_abort: bool
     allowed_prefixes: list[str]
@@ -45,13 +61,16 @@ class Settings(TypedDict, total=False):
     encoding: str
     extras: dict[str, Any]
     gpg_sign: bool
+    hook_jobs: int | None
+    hook_timeout: float | HookTimeoutSettings | None
     ignored_tag_formats: Sequence[str]
     legacy_tag_formats: Sequence[str]
     major_version_zero: bool
     message_length_limit: int
     name: str
-    post_bump_hooks: list[str] | None
-    pre_bump_hooks: list[str] | None
+    packages: list[PackageSettings]
+    post_bump_hooks: list[str | list[str]] | None
+    pre_bump_hooks: list[str | list[str]] | None
     prerelease_offset: int
     retry_after_failure: bool
     style: list[tuple[str, str]]
@@ -60,6 +79,7 @@ class Settings(TypedDict, total=False):
     update_changelog_on_bump: bool
     use_shortcuts: bool
     version_files: list[str]
+    version_files_include_untracked: bool
     version_provider: str | None
     version_scheme: str | None
     version_type: str | None
@@ -82,6 +102,7 @@ DEFAULT_SETTINGS: Settings = {
     "name": "cz_conventional_commits",
     "version": None,
     "version_files": [],
+    "version_files_include_untracked": True,
     "version_provider": "commitizen",
     "version_scheme": None,
     "tag_format": "$version",  # example v$version
@@ -147,6 +168,11 @@ BUMP_MAP_MAJOR_VERSION_ZERO = OrderedDict(
 CHANGE_TYPE_ORDER = ["BREAKING CHANGE", "Feat", "Fix", "Refactor", "Perf"]
 BUMP_MESSAGE = "bump: version $current_version → $new_version"
 
+# Here rather than in `commitizen.version_schemes`, which imports `packaging`,
+# so that the CLI can list the schemes without it
+SCHEMES_ENTRYPOINT = "commitizen.scheme"
+KNOWN_SCHEMES = [ep.name for ep in metadata.entry_points(group=SCHEMES_ENTRYPOINT)]
+
 
 def get_tag_regexes(
     version_regex: str,
@@ -40,6 +40,7 @@ class ExitCode(IntEnum):
     CONFIG_FILE_NOT_FOUND = 30
     CONFIG_FILE_IS_EMPTY = 31
     COMMIT_MESSAGE_LENGTH_LIMIT_EXCEEDED = 32
+    SERVE_FAILED = 33
 
     @classmethod
     def from_str(cls, value: str) -> ExitCode:
@@ -284,4 +285,10 @@ class CommitMessageLengthExceededError(CommitizenException):
     message = "Length of commit message exceeds the given limit."
 
 
+class ServeError(CommitizenException):
+    """The commitizen server cannot be started"""
+
+    exit_code = ExitCode.SERVE_FAILED
+
+
 # When adding / updating a new exit code, please update the documentation of the exit codes in docs/exit_codes.md
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import os
+import re
+import weakref
+from array import array
+from collections.abc import Sequence
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, overload
 
-from commitizen import cmd, out
+from commitizen import cmd, out, profiling
 from commitizen.exceptions import GitCommandError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Generator, Iterable, Iterator
 
 
 class EOLType(Enum):
@@ -46,6 +50,8 @@ class EOLType(Enum):
 
 
 class GitObject:
+    __slots__ = ("rev",)
+
     rev: str
     name: str
     date: str
@@ -58,6 +64,19 @@ class GitObject:
 
 
 class GitCommit(GitObject):
+    # With a `__dict__`, only created once an attribute outside of the slots is
+    # set, such as by a `changelog_message_builder_hook` of a plugin
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_body",
+        "_message",
+        "_title",
+        "author",
+        "author_email",
+        "parents",
+    )
+
     def __init__(
         self,
         rev: str,
@@ -68,15 +87,42 @@ class GitCommit(GitObject):
         parents: list[str] | None = None,
     ) -> None:
         self.rev = rev.strip()
-        self.title = title.strip()
-        self.body = body.strip()
+        self._title = title.strip()
+        self._body = body.strip()
+        self._message: str | None = None
         self.author = author.strip()
         self.author_email = author_email.strip()
         self.parents = parents or []
 
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @title.setter
+    def title(self, value: str) -> None:
+        self._title = value
+        self._message = None
+
+    @property
+    def body(self) -> str:
+        return self._body
+
+    @body.setter
+    def body(self, value: str) -> None:
+        self._body = value
+        self._message = None
+
     @property
     def message(self) -> str:
-        return f"{self.title}\n\n{self.body}".strip()
+        # Read several times per commit by the changelog, bump and check
+        if self._message is None:
+            self._message = (
+                f"{self._title}\n\n{self._body}".strip()
+                if self._body
+                # Without a copy when the title is already stripped
+                else self._title.strip()
+            )
+        return self._message
 
     @classmethod
     def from_rev_and_commit(cls, rev_and_commit: str) -> GitCommit:
@@ -139,6 +185,9 @@ class GitCommit(GitObject):
 
 
 class GitTag(GitObject):
+    # With a `__dict__` for the attributes set by a `changelog_release_hook`
+    __slots__ = ("__dict__", "_date", "name")
+
     def __init__(self, name: str, rev: str, date: str) -> None:
         self.rev = rev.strip()
         self.name = name.strip()
@@ -164,6 +213,123 @@ class GitTag(GitObject):
         return cls(name=name, rev=obj, date=date)
 
 
+class CommitBatch(Sequence[GitCommit]):
+    """The commits of a `git log` output, as offsets into this output.
+
+    The log is the only copy of the fields of the commits: a `GitCommit` is
+    created when an item is read, so iterating a batch holds one commit at a
+    time instead of a list of all of them and of their fields.
+    Reading an item again gives the same `GitCommit`, with its cached message
+    and the attributes set on it, as long as it is referenced elsewhere.
+    """
+
+    __slots__ = ("_commits", "_log", "_offsets")
+
+    def __init__(
+        self,
+        log: str,
+        offsets: array[int],
+        _commits: dict[int, weakref.ref[GitCommit]] | None = None,
+    ) -> None:
+        self._log = log
+        # Start and end of each entry of the log
+        self._offsets = offsets
+        # Weak references to the commits created, by the start of their entry,
+        # shared with the slices. Lighter than a `WeakValueDictionary`, which
+        # makes iterating a batch twice as slow.
+        self._commits = {} if _commits is None else _commits
+
+    @classmethod
+    def from_log(cls, log: str, delimiter: str) -> CommitBatch:
+        """Index the entries of a log in the format of `_get_log_command`."""
+        offsets = array("q")
+        separator = f"{delimiter}\n"
+        start = 0
+        while start < len(log):
+            end = log.find(separator, start)
+            if end == -1:
+                end = len(log)
+            if end > start:
+                offsets.extend((start, end))
+            start = end + len(separator)
+        return cls(log, offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) // 2
+
+    @overload
+    def __getitem__(self, index: int) -> GitCommit: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CommitBatch: ...
+
+    def __getitem__(self, index: int | slice) -> GitCommit | CommitBatch:
+        if isinstance(index, slice):
+            offsets = array("q")
+            for i in range(*index.indices(len(self))):
+                offsets.extend(self._offsets[i * 2 : i * 2 + 2])
+            return CommitBatch(self._log, offsets, self._commits)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("commit index out of range")
+        return self._create_commit(
+            self._offsets[index * 2], self._offsets[index * 2 + 1]
+        )
+
+    def __iter__(self) -> Iterator[GitCommit]:
+        # `_create_commit` inlined, since this is the hot path of the pipelines
+        offsets, commits, parse_commit = (
+            self._offsets,
+            self._commits,
+            self._parse_commit,
+        )
+        for i in range(0, len(offsets), 2):
+            start = offsets[i]
+            commit_ref = commits.get(start)
+            if commit_ref is None or (commit := commit_ref()) is None:
+                commit = parse_commit(start, offsets[i + 1])
+                commits[start] = weakref.ref(commit)
+            yield commit
+
+    def _create_commit(self, start: int, end: int) -> GitCommit:
+        commit_ref = self._commits.get(start)
+        if commit_ref is None or (commit := commit_ref()) is None:
+            commit = self._parse_commit(start, end)
+            self._commits[start] = weakref.ref(commit)
+        return commit
+
+    def _parse_commit(self, start: int, end: int) -> GitCommit:
+        try:
+            rev, parents, title, author, author_email, *body = self._log[
+                start:end
+            ].split("\n", 5)
+        except ValueError:
+            raise ValueError(
+                f"Invalid git log entry: {self._log[start:end]!r}"
+            ) from None
+        return GitCommit(
+            rev=rev,
+            title=title,
+            # Line endings normalized like `GitCommit.from_rev_and_commit` does
+            body="\n".join(body[0].splitlines()) if body and body[0] else "",
+            author=author,
+            author_email=author_email,
+            parents=parents.split(),
+        )
+
+    def revs(self) -> Iterator[str]:
+        """Iterate over the revs of the commits, without creating them."""
+        log, offsets = self._log, self._offsets
+        for i in range(0, len(offsets), 2):
+            start = offsets[i]
+            yield log[start : log.find("\n", start, offsets[i + 1])].strip()
+
+    def __repr__(self) -> str:
+        return f"<CommitBatch of {len(self)} commits>"
+
+
 def tag(
     tag: str, annotated: bool = False, signed: bool = False, msg: str | None = None
 ) -> cmd.Command:
@@ -209,16 +375,153 @@ def get_commits(
     end: str | None = None,
     *,
     args: Sequence[str] = (),
+    paths: Sequence[str] = (),
 ) -> list[GitCommit]:
-    """Get the commits between start and end."""
+    """Get the commits between start and end.
+
+    :param paths: only get the commits changing these paths (git pathspecs)
+    """
+    return list(get_commit_batch(start, end, args=args, paths=paths))
+
+
+@profiling.phase("log fetch")
+def get_commit_batch(
+    start: str | None = None,
+    end: str | None = None,
+    *,
+    args: Sequence[str] = (),
+    paths: Sequence[str] = (),
+) -> CommitBatch:
+    """Like `get_commits`, without creating all the commits at once.
+
+    :param paths: only get the commits changing these paths (git pathspecs)
+    """
     if end is None:
         end = "HEAD"
-    git_log_entries = _get_log_as_str_list(start, end, args)
-    return [
-        GitCommit.from_rev_and_commit(rev_and_commit)
-        for rev_and_commit in git_log_entries
-        if rev_and_commit
-    ]
+    return _get_log_batch(start, end, args, paths=paths)
+
+
+def iter_commits(
+    start: str | None = None,
+    end: str | None = None,
+    *,
+    args: Sequence[str] = (),
+    paths: Sequence[str] = (),
+) -> Generator[GitCommit, None, None]:
+    """Get the commits between start and end, parsing the log as git writes it.
+
+    Closing the generator early terminates git instead of reading the rest of the log.
+    """
+    if end is None:
+        end = "HEAD"
+    cmd_args, delimiter = _get_log_command(start, end, args, paths)
+    log = cmd.stream(cmd_args, separator=f"{delimiter}\n")
+    try:
+        while True:
+            try:
+                rev_and_commit = next(log)
+            except StopIteration as e:
+                c: cmd.Command = e.value
+                break
+            if rev_and_commit:
+                yield GitCommit.from_rev_and_commit(rev_and_commit)
+    finally:
+        log.close()
+    if c.return_code != 0:
+        raise GitCommandError(c.err)
+
+
+def get_commits_from_revs(
+    revs: Iterable[str], *, args: Sequence[str] = ()
+) -> list[GitCommit]:
+    """Get the commits reachable from any of the given revisions, in a single walk.
+
+    The revisions are read by `git log --stdin`, so `^<rev>` excludes the
+    commits reachable from `<rev>`.
+    """
+    input = "".join(f"{rev}\n" for rev in revs)
+    if not input:
+        return []
+    return list(_get_log_batch(None, "", [*args, "--stdin"], input=input))
+
+
+@profiling.phase("log fetch")
+def get_commits_with_filenames(
+    start: str | None = None,
+    end: str | None = None,
+    *,
+    args: Sequence[str] = (),
+    paths: Sequence[str] = (),
+) -> list[tuple[GitCommit, list[str]]]:
+    """Get the commits between start and end, with the files each of them changed.
+
+    Like `git log --name-only`, merge commits have no files.
+    """
+    if end is None:
+        end = "HEAD"
+    start_delimiter = "----------commit-start----------"
+    end_delimiter = "----------commit-end----------"
+    c = cmd.run(
+        [
+            "git",
+            "-c",
+            "log.showSignature=False",
+            "-c",
+            "core.quotePath=false",
+            "log",
+            "--name-only",
+            f"--pretty=format:{start_delimiter}%H%n%P%n%s%n%an%n%ae%n%b{end_delimiter}",
+            *args,
+            f"{start}..{end}" if start else end,
+            *_get_pathspec_args(paths),
+        ]
+    )
+    if c.return_code != 0:
+        raise GitCommandError(c.err)
+
+    commits = []
+    for entry in c.out.split(start_delimiter):
+        if not entry:
+            continue
+        rev_and_commit, _, filenames = entry.partition(end_delimiter)
+        commits.append(
+            (
+                GitCommit.from_rev_and_commit(rev_and_commit),
+                [filename for filename in filenames.split("\n") if filename],
+            )
+        )
+    return commits
+
+
+def get_merge_base(*revs: str) -> str | None:
+    """Get the best common ancestor of all the given commits, if any."""
+    c = cmd.run(["git", "merge-base", "--octopus", *revs])
+    if c.return_code != 0:
+        return None
+    return c.out.strip() or None
+
+
+def get_ref_objects(*patterns: str) -> list[str]:
+    """Get the object names the refs matching the given patterns point to."""
+    c = cmd.run(["git", "for-each-ref", "--format=%(objectname)", *patterns])
+    if c.return_code != 0:
+        raise GitCommandError(c.err)
+    return c.out.split()
+
+
+def get_tracked_files(*, include_untracked: bool = False) -> list[str]:
+    """Get the files of the work tree known to git, relative to its root.
+
+    :param include_untracked: also list the untracked files that are not ignored
+    """
+    args = ["git", "ls-files", "-z", "--full-name"]
+    if include_untracked:
+        args.extend(("--cached", "--others", "--exclude-standard"))
+    # List the whole work tree, even from one of its subdirectories
+    c = cmd.run([*args, ":/"])
+    if c.return_code != 0:
+        raise GitCommandError(c.err)
+    return [os.fsdecode(path) for path in c.stdout.split(b"\0") if path]
 
 
 def get_filenames_in_commit(git_reference: str = "") -> list[str]:
@@ -237,6 +540,7 @@ def get_filenames_in_commit(git_reference: str = "") -> list[str]:
     raise GitCommandError(c.err)
 
 
+@profiling.phase("tag fetch")
 def get_tags(
     dateformat: str = "%Y-%m-%d", reachable_only: bool = False
 ) -> list[GitTag]:
@@ -298,11 +602,113 @@ def get_tag_names() -> list[str]:
     return [tag for raw in c.out.split("\n") if (tag := raw.strip())]
 
 
-def find_git_project_root() -> Path | None:
-    c = cmd.run(["git", "rev-parse", "--show-toplevel"])
-    if c.err:
+class GitLocation(NamedTuple):
+    """Where the git work tree and the git directory of a repository are."""
+
+    work_tree: Path
+    git_dir: Path
+
+
+class _UnsupportedGitLayout(Exception):
+    """The repository layout needs git itself to be resolved."""
+
+
+_GIT_CONFIG_UNSUPPORTED_PATTERN = re.compile(
+    r"^\s*(worktree\s*=|bare\s*=\s*true)", re.IGNORECASE | re.MULTILINE
+)
+
+
+def find_git_location() -> GitLocation | None:
+    """Find the git work tree and git directory the current directory belongs to.
+
+    The file system is walked up from the current directory, like git does,
+    honoring `GIT_DIR`, `GIT_WORK_TREE`, `GIT_CEILING_DIRECTORIES` and
+    `GIT_DISCOVERY_ACROSS_FILESYSTEM`. git is only spawned for the layouts
+    this walk can't resolve on its own (e.g. `core.worktree`, foreign ownership).
+
+    Returns:
+        None if the current directory is not inside a git work tree.
+    """
+    try:
+        return _discover_git_location()
+    except _UnsupportedGitLayout:
+        pass
+    c = cmd.run(["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"])
+    if c.err or c.return_code != 0:
         return None
-    return Path(c.out.strip())
+    work_tree, git_dir = c.out.strip().split("\n")
+    return GitLocation(Path(work_tree), Path(git_dir))
+
+
+def _discover_git_location() -> GitLocation | None:
+    git_dir_env = os.environ.get("GIT_DIR")
+    work_tree_env = os.environ.get("GIT_WORK_TREE")
+    if git_dir_env or work_tree_env:
+        if not git_dir_env or not work_tree_env:
+            raise _UnsupportedGitLayout()
+        return GitLocation(Path(work_tree_env).resolve(), Path(git_dir_env).resolve())
+
+    ceilings = {
+        Path(ceiling).resolve()
+        for ceiling in os.environ.get("GIT_CEILING_DIRECTORIES", "").split(os.pathsep)
+        if ceiling and os.path.isabs(ceiling)
+    }
+    across_filesystems = os.environ.get(
+        "GIT_DISCOVERY_ACROSS_FILESYSTEM", ""
+    ).lower() in ("1", "true", "yes", "on")
+
+    directory = Path.cwd()
+    device = directory.stat().st_dev
+    while True:
+        dot_git = directory / ".git"
+        if dot_git.is_file():
+            return GitLocation(directory, _read_git_file(dot_git))
+        if _is_git_dir(dot_git):
+            _check_supported_git_dir(dot_git)
+            return GitLocation(directory, dot_git)
+        if _is_git_dir(directory):
+            # Inside a bare repository or a `.git` directory: there is no work tree
+            return None
+
+        parent = directory.parent
+        if parent == directory or parent in ceilings:
+            return None
+        if not across_filesystems and parent.stat().st_dev != device:
+            return None
+        directory = parent
+
+
+def _is_git_dir(path: Path) -> bool:
+    return (path / "HEAD").is_file() and (path / "refs").is_dir()
+
+
+def _read_git_file(path: Path) -> Path:
+    """Resolve a `gitdir: <path>` file, as used by worktrees and submodules."""
+    prefix = "gitdir: "
+    content = path.read_text(encoding="utf-8").strip()
+    if not content.startswith(prefix):
+        raise _UnsupportedGitLayout()
+    git_dir = (path.parent / content[len(prefix) :]).resolve()
+    if not (git_dir / "HEAD").is_file():
+        raise _UnsupportedGitLayout()
+    return git_dir
+
+
+def _check_supported_git_dir(git_dir: Path) -> None:
+    if hasattr(os, "getuid") and git_dir.stat().st_uid != os.getuid():
+        # Let git apply its `safe.directory` rules
+        raise _UnsupportedGitLayout()
+    try:
+        git_config = (git_dir / "config").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        raise _UnsupportedGitLayout()
+    if _GIT_CONFIG_UNSUPPORTED_PATTERN.search(git_config):
+        raise _UnsupportedGitLayout()
+
+
+def find_git_project_root() -> Path | None:
+    location = find_git_location()
+    return location.work_tree if location else None
 
 
 def is_staging_clean() -> bool:
@@ -312,8 +718,12 @@ def is_staging_clean() -> bool:
 
 
 def is_git_project() -> bool:
-    c = cmd.run(["git", "rev-parse", "--is-inside-work-tree"])
-    return c.out.strip() == "true"
+    try:
+        location = _discover_git_location()
+    except _UnsupportedGitLayout:
+        c = cmd.run(["git", "rev-parse", "--is-inside-work-tree"])
+        return c.out.strip() == "true"
+    return location is not None and Path.cwd().is_relative_to(location.work_tree)
 
 
 def get_core_editor() -> str | None:
@@ -328,8 +738,10 @@ def smart_open(*args, **kwargs):  # type: ignore[no-untyped-def,unused-ignore] #
     return open(*args, newline=EOLType.for_open(), **kwargs)
 
 
-def _get_log_as_str_list(start: str | None, end: str, args: Sequence[str]) -> list[str]:
-    """Get string representation of each log entry"""
+def _get_log_command(
+    start: str | None, end: str, args: Sequence[str], paths: Sequence[str] = ()
+) -> tuple[list[str], str]:
+    """Get the git log command and the delimiter following each of its entries."""
     delimiter = "----------commit-delimiter----------"
     log_format: str = "%H%n%P%n%s%n%an%n%ae%n%b"
     command_range = f"{start}..{end}" if start else end
@@ -344,11 +756,30 @@ def _get_log_as_str_list(start: str | None, end: str, args: Sequence[str]) -> li
         cmd_args.extend(args)
     if command_range:
         cmd_args.append(command_range)
+    cmd_args.extend(_get_pathspec_args(paths))
+    return cmd_args, delimiter
 
-    c = cmd.run(cmd_args)
+
+def _get_pathspec_args(paths: Sequence[str]) -> list[str]:
+    # `--` so that a path is never mistaken for a revision
+    return ["--", *paths] if paths else []
+
+
+def _get_log_batch(
+    start: str | None,
+    end: str,
+    args: Sequence[str],
+    *,
+    input: str | None = None,
+    paths: Sequence[str] = (),
+) -> CommitBatch:
+    """Get the log entries, indexed in a batch"""
+    cmd_args, delimiter = _get_log_command(start, end, args, paths)
+    c = cmd.run(cmd_args) if input is None else cmd.run(cmd_args, input=input)
     if c.return_code != 0:
         raise GitCommandError(c.err)
-    return c.out.split(f"{delimiter}\n")
+    with profiling.phase("log parse"):
+        return CommitBatch.from_log(c.out, delimiter)
 
 
 def get_default_branch() -> str:
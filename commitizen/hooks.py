@@ -1,35 +1,210 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
 
-from commitizen import cmd, out
+from commitizen import cmd, out, profiling
 from commitizen.exceptions import RunHookError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
 
 
-def run(hooks: str | list[str], _env_prefix: str = "CZ_", **env: object) -> None:
+class HookTiming(NamedTuple):
+    hook: str
+    # Wall time of the hook
+    seconds: float
+
+
+class _TimeLimit(NamedTuple):
+    timeout: float | None
+    total_timeout: float | None
+    # `time.monotonic()` past which no hook may run, from `total_timeout`
+    deadline: float | None
+
+    def for_hook(self) -> tuple[float, str] | None:
+        """The seconds a hook starting now may run, and why it fails past them."""
+        limit = None
+        if self.timeout is not None:
+            limit = (self.timeout, f"timed out after {self.timeout:g}s")
+        if self.deadline is not None:
+            remaining = max(self.deadline - time.monotonic(), 0)
+            if limit is None or remaining < limit[0]:
+                limit = (
+                    remaining,
+                    f"timed out, the hooks exceeding their total time limit"
+                    f" of {self.total_timeout:g}s",
+                )
+        return limit
+
+
+def deadline(total_timeout: float | None) -> float | None:
+    """The `time.monotonic()` past which no hook may run, `total_timeout` from now."""
+    return time.monotonic() + total_timeout if total_timeout is not None else None
+
+
+def run(
+    hooks: str | Sequence[str | Sequence[str]],
+    _env_prefix: str = "CZ_",
+    _jobs: int | None = None,
+    _timeout: float | None = None,
+    _total_timeout: float | None = None,
+    _deadline: float | None = None,
+    _timings: list[HookTiming] | None = None,
+    **env: object,
+) -> None:
+    """Run the hooks in order.
+
+    A hook given as a list of commands is a group: its commands run
+    concurrently, at most `_jobs` at a time (default: the number of CPUs),
+    and the next hooks only run once all of them succeeded.
+
+    A hook running for more than `_timeout` seconds, or past `_total_timeout`
+    seconds after the first one started, is terminated along with the
+    processes it started, and fails. Several runs share the same total time
+    limit when given the same `_deadline`, from `deadline(_total_timeout)`.
+
+    The wall time of each hook is appended to `_timings`. The timings found
+    there are given to the hooks as JSON, in the `HOOK_TIMINGS` variable.
+    """
     if isinstance(hooks, str):
         hooks = [hooks]
+    timings = _timings if _timings is not None else []
+    time_limit = _TimeLimit(
+        _timeout,
+        _total_timeout,
+        _deadline if _deadline is not None else deadline(_total_timeout),
+    )
 
+    hook_env = _format_env(_env_prefix, env)
     for hook in hooks:
-        out.info(f"Running hook '{hook}'")
+        # Only the variables of the hooks: cmd adds them to `os.environ`
+        entry_env = {
+            **hook_env,
+            f"{_env_prefix}HOOK_TIMINGS": _format_timings(timings),
+        }
+        if isinstance(hook, str):
+            _run_hook(hook, entry_env, time_limit, timings)
+        else:
+            _run_group(hook, entry_env, _jobs, time_limit, timings)
+
+
+def _run_hook(
+    hook: str,
+    env: Mapping[str, str],
+    time_limit: _TimeLimit,
+    timings: list[HookTiming],
+) -> None:
+    out.info(f"Running hook '{hook}'")
+
+    limit = time_limit.for_hook()
+    timed_out = False
+    start = time.perf_counter()
+    with profiling.phase(f"hook: {hook}"):
+        if limit is None:
+            return_code = cmd.run_interactive(hook, env=env)
+        else:
+            # Not interactive, so that it can be terminated along with the
+            # processes it started
+            process = cmd.ShellProcess(hook, env=env, timeout=limit[0])
+            try:
+                for line in process.lines():
+                    (out.diagnostic if line.stderr else out.write)(line.text)
+                return_code = process.wait()
+            except BaseException:
+                process.terminate()
+                raise
+            timed_out = process.timed_out
+    timings.append(HookTiming(hook, time.perf_counter() - start))
+
+    if limit is not None and timed_out:
+        raise RunHookError(f"Running hook '{hook}' {limit[1]}")
+    if return_code != 0:
+        raise RunHookError(f"Running hook '{hook}' failed")
+
+
+def _run_group(
+    hooks: Sequence[str],
+    env: Mapping[str, str],
+    jobs: int | None,
+    time_limit: _TimeLimit,
+    timings: list[HookTiming],
+) -> None:
+    """Run the hooks concurrently, stopping all of them on the first failure.
+
+    Their output is printed line by line, prefixed with the hook.
+    """
+    lock = threading.Lock()
+    running: list[cmd.ShellProcess] = []
+    # The error of the first hook failing
+    errors: list[str] = []
+
+    def stop_all() -> None:
+        for process in running:
+            process.terminate()
+
+    def run_one(hook: str) -> None:
+        with lock:
+            if errors:
+                return
+            out.info(f"Running hook '{hook}'")
+            limit = time_limit.for_hook()
+            start = time.perf_counter()
+            process = cmd.ShellProcess(
+                hook, env=env, timeout=limit[0] if limit is not None else None
+            )
+            running.append(process)
+
+        with profiling.phase(f"hook: {hook}"):
+            for line in process.lines():
+                with lock:
+                    (out.diagnostic if line.stderr else out.write)(
+                        f"[{hook}] {line.text}"
+                    )
+            return_code = process.wait()
+
+        with lock:
+            timings.append(HookTiming(hook, time.perf_counter() - start))
+            running.remove(process)
+            if return_code != 0 and not errors:
+                errors.append(
+                    f"Running hook '{hook}' {limit[1]}"
+                    if limit is not None and process.timed_out
+                    else f"Running hook '{hook}' failed"
+                )
+                stop_all()
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        try:
+            for _ in executor.map(run_one, hooks):
+                pass
+        except BaseException:
+            # Such as a KeyboardInterrupt, which the hooks don't get
+            # since they don't run in the process group of the terminal
+            with lock:
+                errors.append("")
+                stop_all()
+            raise
+
+    if errors:
+        raise RunHookError(errors[0])
 
-        return_code = cmd.run_interactive(hook, env=_format_env(_env_prefix, env))
 
-        if return_code != 0:
-            raise RunHookError(f"Running hook '{hook}' failed")
+def _format_timings(timings: Sequence[HookTiming]) -> str:
+    return json.dumps(
+        [{"hook": hook, "seconds": round(seconds, 3)} for hook, seconds in timings]
+    )
 
 
 def _format_env(prefix: str, env: Mapping[str, object]) -> dict[str, str]:
     """_format_env() prefixes all given environment variables with the given
-    prefix so it can be passed directly to cmd.run()."""
-    penv = dict(os.environ)
-    for name, value in env.items():
-        name = prefix + name.upper()
-        value = str(value) if value is not None else ""
-        penv[name] = value
-
-    return penv
+    prefix so it can be passed directly to cmd.run(), which adds them to
+    the environment of the current process."""
+    return {
+        prefix + name.upper(): str(value) if value is not None else ""
+        for name, value in env.items()
+    }
@@ -0,0 +1,266 @@
+"""Time the phases of a `cz` command and count the subprocesses it runs.
+
+Enabled with `cz --profile` or the `CZ_PROFILE` environment variable.
+When no profiler is active, `phase` does nothing, so the instrumented code
+pays close to nothing for it. Subprocesses are recorded by a tracer of
+`commitizen.cmd`.
+
+With `cz --profile-memory`, the peak of the memory allocated by each phase
+is also traced with `tracemalloc`, which slows the command down noticeably.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+from commitizen import cmd
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+PHASE = "phase"
+SUBPROCESS = "subprocess"
+
+
+class Event(NamedTuple):
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    # Peak of the memory allocated during the phase, when tracing the memory
+    memory_peak: int | None = None
+
+
+class Profiler:
+    """Record the time spent in named phases and the subprocesses run by each."""
+
+    def __init__(self, *, memory: bool = False) -> None:
+        self.start_ns = time.perf_counter_ns()
+        self.events: list[Event] = []
+        # Subprocesses run while each phase is the innermost open one
+        self.subprocess_counts: Counter[str] = Counter()
+        self._open_phases = threading.local()
+
+        self.memory = memory
+        # Peak of the memory allocated since the start, set by `close`
+        self.memory_peak: int | None = None
+        self._owns_tracemalloc = memory and not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+        # [traced memory at the start, peak seen before the last reset] of
+        # the whole profile and of each open phase, in every thread
+        self._memory_frames: list[list[int]] = []
+        if memory:
+            self._memory_frames.append(self._open_memory_frame())
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        stack: list[str] = self._open_phases.__dict__.setdefault("stack", [])
+        stack.append(name)
+        memory_frame = self._open_memory_frame() if self.memory else None
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration_ns = time.perf_counter_ns() - start_ns
+            self.events.append(
+                Event(
+                    name,
+                    PHASE,
+                    start_ns - self.start_ns,
+                    duration_ns,
+                    threading.get_ident(),
+                    self._close_memory_frame(memory_frame)
+                    if memory_frame is not None
+                    else None,
+                )
+            )
+            stack.pop()
+
+    def _open_memory_frame(self) -> list[int]:
+        current, peak = tracemalloc.get_traced_memory()
+        # The peak is global: keep the one of the open frames before resetting it
+        for frame in self._memory_frames:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+        self._memory_frames.append(frame)
+        return frame
+
+    def _close_memory_frame(self, frame: list[int]) -> int:
+        """Get the peak of the memory allocated since the frame was opened."""
+        self._memory_frames.remove(frame)
+        start, peak = frame
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        for open_frame in self._memory_frames:
+            open_frame[1] = max(open_frame[1], peak)
+        return peak - start
+
+    def close(self) -> None:
+        """Stop tracing the memory, keeping the peak of the whole profile."""
+        if self._memory_frames:
+            self.memory_peak = self._close_memory_frame(self._memory_frames[0])
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def add_subprocess(self, trace: cmd.CommandTrace) -> None:
+        """Record a subprocess, as a tracer of `commitizen.cmd`."""
+        if stack := self._open_phases.__dict__.get("stack"):
+            self.subprocess_counts[stack[-1]] += 1
+        self.events.append(
+            Event(
+                _get_subprocess_name(trace.cmd),
+                SUBPROCESS,
+                trace.start_ns - self.start_ns,
+                trace.duration_ns,
+                threading.get_ident(),
+            )
+        )
+
+    def summary(self) -> str:
+        """A table of the phases in order of first appearance, then of the subprocesses."""
+        # [calls, time, highest peak of memory] of each phase and subprocess
+        totals: dict[tuple[str, str], list[int]] = {}
+        for event in sorted(self.events, key=lambda event: event.start_ns):
+            total = totals.setdefault((event.category, event.name), [0, 0, 0])
+            total[0] += 1
+            total[1] += event.duration_ns
+            total[2] = max(total[2], event.memory_peak or 0)
+
+        rows: list[tuple[str, ...]] = [("phase", "calls", "time (ms)", "subprocesses")]
+        for category in (PHASE, SUBPROCESS):
+            rows.extend(
+                (
+                    name if category == PHASE else f"$ {name}",
+                    str(calls),
+                    f"{duration_ns / 1_000_000:.1f}",
+                    str(self.subprocess_counts[name]) if category == PHASE else "",
+                    _format_kib(memory_peak) if category == PHASE else "",
+                )
+                for (event_category, name), (calls, duration_ns, memory_peak) in (
+                    totals.items()
+                )
+                if event_category == category
+            )
+        subprocesses = sum(1 for event in self.events if event.category == SUBPROCESS)
+        elapsed_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
+        memory_peak = self.memory_peak
+        if memory_peak is None and self._memory_frames:
+            start, peak = self._memory_frames[0]
+            memory_peak = max(peak, tracemalloc.get_traced_memory()[1]) - start
+        rows.append(
+            (
+                "total",
+                "",
+                f"{elapsed_ms:.1f}",
+                str(subprocesses),
+                _format_kib(memory_peak or 0),
+            )
+        )
+        if self.memory:
+            rows[0] = (*rows[0], "peak memory (KiB)")
+        else:
+            rows = [row[:4] for row in rows]
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                (cell.ljust(width) if i == 0 else cell.rjust(width))
+                for i, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write the events in the Chrome trace event format.
+
+        The file can be opened with https://ui.perfetto.dev or chrome://tracing.
+        """
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": event.start_ns / 1000,
+                "dur": event.duration_ns / 1000,
+                "pid": pid,
+                "tid": event.thread_id,
+                **(
+                    {"args": {"memory_peak": event.memory_peak}}
+                    if event.memory_peak is not None
+                    else {}
+                ),
+            }
+            for event in self.events
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+_profiler: Profiler | None = None
+
+
+def start(*, memory: bool = False) -> Profiler:
+    global _profiler
+    if _profiler is not None:
+        stop()
+    _profiler = Profiler(memory=memory)
+    cmd.add_tracer(_profiler.add_subprocess)
+    return _profiler
+
+
+def stop() -> None:
+    global _profiler
+    if _profiler is not None:
+        cmd.remove_tracer(_profiler.add_subprocess)
+        _profiler.close()
+    _profiler = None
+
+
+def is_active() -> bool:
+    return _profiler is not None
+
+
+def is_enabled_by_env(variable: str = "CZ_PROFILE") -> bool:
+    return os.environ.get(variable, "").lower() not in ("", "0", "false", "no")
+
+
+@contextmanager
+def phase(name: str) -> Generator[None, None, None]:
+    """Time a phase of the command, when profiling."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name):
+        yield
+
+
+def _format_kib(size: int) -> str:
+    return f"{size / 1024:,.0f}"
+
+
+def _get_subprocess_name(command: str | Sequence[str]) -> str:
+    argv = command.split() if isinstance(command, str) else list(command)
+    if not argv:
+        return ""
+    program = os.path.basename(argv[0])
+    if program != "git":
+        return program
+    # The git subcommand, after the global options such as `-c key=value`
+    arguments = iter(argv[1:])
+    for argument in arguments:
+        if argument in ("-c", "-C"):
+            next(arguments, None)
+        elif not argument.startswith("-"):
+            return f"git {argument}"
+    return program
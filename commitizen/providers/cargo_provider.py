@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import fnmatch
-import glob
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -9,6 +7,11 @@ from tomlkit import TOMLDocument, dumps, parse
 from tomlkit.exceptions import NonExistentKey
 
 from commitizen.providers.base_provider import TomlProvider
+from commitizen.providers.cargo_workspace import (
+    get_members_inheriting_version,
+    read_manifest,
+)
+from commitizen.providers.lock_files import set_toml_package_versions
 
 if TYPE_CHECKING:
     from tomlkit.items import AoT
@@ -43,62 +46,34 @@ class CargoProvider(TomlProvider):
             self.set_lock_version(version)
 
     def set_lock_version(self, version: str) -> None:
-        cargo_toml_content = parse(self.file.read_text(encoding=self._get_encoding()))
-        cargo_lock_content = parse(
-            self.lock_file.read_text(encoding=self._get_encoding())
+        cargo_toml_content = read_manifest(self.file, self._get_encoding())
+        cargo_package_name = cargo_toml_content.get("package", {}).get("name")
+        if cargo_package_name is not None:
+            package_names = [cargo_package_name]
+            first_only = True
+        else:
+            package_names = get_members_inheriting_version(
+                cargo_toml_content.get("workspace", {}), self._get_encoding()
+            )
+            first_only = False
+
+        lock_content = self.lock_file.read_text(encoding=self._get_encoding())
+        patched_lock_content = set_toml_package_versions(
+            lock_content, package_names, version, first_only=first_only
         )
-        packages = cargo_lock_content["package"]
-
-        if TYPE_CHECKING:
-            assert isinstance(packages, AoT)
-
-        try:
-            cargo_package_name = cargo_toml_content["package"]["name"]  # type: ignore[index]
-            if TYPE_CHECKING:
-                assert isinstance(cargo_package_name, str)
-            for i, package in enumerate(packages):
-                if package["name"] == cargo_package_name:
-                    cargo_lock_content["package"][i]["version"] = version  # type: ignore[index]
-                    break
-        except NonExistentKey:
-            workspace = cargo_toml_content.get("workspace", {})
+        if patched_lock_content is None:
+            cargo_lock_content = parse(lock_content)
+            packages = cargo_lock_content["package"]
             if TYPE_CHECKING:
-                assert isinstance(workspace, dict)
-            workspace_members = workspace.get("members", [])
-            excluded_workspace_members = workspace.get("exclude", [])
-            members_inheriting: list[str] = []
-
-            for member in workspace_members:
-                for path in glob.glob(member, recursive=True):
-                    if any(
-                        fnmatch.fnmatch(path, pattern)
-                        for pattern in excluded_workspace_members
-                    ):
-                        continue
-
-                    cargo_file = Path(path) / "Cargo.toml"
-                    package_content = parse(
-                        cargo_file.read_text(encoding=self._get_encoding())
-                    ).get("package", {})
-                    if TYPE_CHECKING:
-                        assert isinstance(package_content, dict)
-                    version_field = package_content.get("version")
-                    if (
-                        isinstance(version_field, dict)
-                        and version_field.get("workspace") is True
-                    ):
-                        package_name = package_content["name"]
-                        if TYPE_CHECKING:
-                            assert isinstance(package_name, str)
-                        members_inheriting.append(package_name)
-
+                assert isinstance(packages, AoT)
             for i, package in enumerate(packages):
-                if package["name"] in members_inheriting:
+                if package["name"] in package_names:
                     cargo_lock_content["package"][i]["version"] = version  # type: ignore[index]
+                    if first_only:
+                        break
+            patched_lock_content = dumps(cargo_lock_content)
 
-        self.lock_file.write_text(
-            dumps(cargo_lock_content), encoding=self._get_encoding()
-        )
+        self.lock_file.write_text(patched_lock_content, encoding=self._get_encoding())
 
 
 def _try_get_workspace(document: TOMLDocument) -> dict:
@@ -0,0 +1,123 @@
+"""Members of a Cargo workspace and whether they inherit the workspace version.
+
+Resolving them means reading the `Cargo.toml` of every member, which
+dominates the bump of large workspaces. Member manifests are read-only here,
+so they are parsed with the stdlib TOML parser when available, concurrently,
+and cached by path along with their `(mtime_ns, size)`: an unchanged member is
+never parsed twice by the same process.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+# Below this many manifests to parse, a thread pool costs more than it saves
+PARALLEL_THRESHOLD = 8
+
+
+class WorkspaceMember(NamedTuple):
+    name: str
+    path: str
+    inherits_version: bool
+
+
+_members_cache: dict[str, tuple[tuple[int, int], WorkspaceMember | None]] = {}
+
+
+def read_manifest(path: str | Path, encoding: str) -> dict[str, Any]:
+    """Parse a `Cargo.toml` for read-only access."""
+    content = Path(path).read_text(encoding=encoding)
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        return tomllib.loads(content)
+
+    from tomlkit import parse
+
+    return parse(content).unwrap()
+
+
+def get_members(workspace: Mapping[str, Any], encoding: str) -> list[WorkspaceMember]:
+    """Get the packages of the `members` of a `[workspace]` table, minus `exclude`."""
+    manifests = [
+        os.path.join(path, "Cargo.toml")
+        for path in _get_member_paths(
+            workspace.get("members", []), workspace.get("exclude", [])
+        )
+    ]
+
+    stats: dict[str, tuple[int, int]] = {}
+    for manifest in manifests:
+        try:
+            stat = os.stat(manifest)
+        except OSError:
+            continue
+        stats[manifest] = (stat.st_mtime_ns, stat.st_size)
+
+    outdated = [
+        manifest
+        for manifest, stat in stats.items()
+        if _members_cache.get(os.path.abspath(manifest), (None,))[0] != stat
+    ]
+    if len(outdated) < PARALLEL_THRESHOLD:
+        parsed = [_read_member(manifest, encoding) for manifest in outdated]
+    else:
+        with ThreadPoolExecutor() as executor:
+            parsed = list(
+                executor.map(_read_member, outdated, [encoding] * len(outdated))
+            )
+    for manifest, member in zip(outdated, parsed):
+        _members_cache[os.path.abspath(manifest)] = (stats[manifest], member)
+
+    return [
+        member
+        for manifest in stats
+        if (member := _members_cache[os.path.abspath(manifest)][1]) is not None
+    ]
+
+
+def get_members_inheriting_version(
+    workspace: Mapping[str, Any], encoding: str
+) -> list[str]:
+    """Get the names of the members with `version.workspace = true`."""
+    return [
+        member.name
+        for member in get_members(workspace, encoding)
+        if member.inherits_version
+    ]
+
+
+def _get_member_paths(members: Iterable[str], exclude: Iterable[str]) -> list[str]:
+    excluded = re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in exclude)
+    )
+    paths: dict[str, None] = {}
+    for member in members:
+        for path in glob.glob(member, recursive=True):
+            if excluded.pattern and excluded.match(os.path.normcase(path)):
+                continue
+            paths[path] = None
+    return list(paths)
+
+
+def _read_member(manifest: str, encoding: str) -> WorkspaceMember | None:
+    package = read_manifest(manifest, encoding).get("package", {})
+    name = package.get("name")
+    if not isinstance(name, str):
+        return None
+    version = package.get("version")
+    return WorkspaceMember(
+        name=name,
+        path=os.path.dirname(manifest),
+        inherits_version=isinstance(version, dict) and version.get("workspace") is True,
+    )
@@ -0,0 +1,104 @@
+"""Set the version of a package in a lock file without parsing the whole file.
+
+Lock files can weigh tens of megabytes while only one or a few versions of
+them change on a bump: parsing and re-serializing them entirely is slow.
+These functions locate the version values with a scanner and only rewrite
+them, leaving the rest of the file untouched.
+They return None when the file isn't laid out the way they expect, in which
+case the caller should fall back to a full parse.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+# Lock files are generated: tables headers always start their line
+_TOML_HEADER = re.compile(r"^\[", re.MULTILINE)
+_TOML_PACKAGE_HEADER = re.compile(r"\[\[[ \t]*package[ \t]*\]\][ \t]*(?:#.*)?$", re.M)
+_TOML_STRING_FIELD = (
+    r"^[ \t]*{key}[ \t]*=[ \t]*(?P<quote>[\"'])(?P<value>[^\"'\\\n]*)(?P=quote)"
+)
+_TOML_NAME = re.compile(_TOML_STRING_FIELD.format(key="name"), re.MULTILINE)
+_TOML_VERSION = re.compile(_TOML_STRING_FIELD.format(key="version"), re.MULTILINE)
+
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]|[^\s{}\[\]:,"]+')
+
+
+def set_toml_package_versions(
+    content: str, names: Collection[str], version: str, *, first_only: bool = False
+) -> str | None:
+    """Set the version of the `[[package]]` entries with the given names.
+
+    :param first_only: only set the version of the first entry found
+    """
+    headers = [match.start() for match in _TOML_HEADER.finditer(content)]
+    spans = []
+    for start, end in zip(headers, [*headers[1:], len(content)]):
+        if not _TOML_PACKAGE_HEADER.match(content, start, end):
+            continue
+        name = _TOML_NAME.search(content, start, end)
+        if name is None:
+            return None
+        if name["value"] not in names:
+            continue
+        version_field = _TOML_VERSION.search(content, start, end)
+        if version_field is None:
+            return None
+        spans.append(version_field.span("value"))
+        if first_only:
+            break
+    return _replace_spans(content, spans, version)
+
+
+def set_json_versions(
+    content: str, paths: Collection[tuple[str, ...]], version: str
+) -> str | None:
+    """Set the string values found at the given key paths of a JSON document.
+
+    The document is only scanned up to the last of these values.
+    """
+    spans: dict[tuple[str | None, ...], tuple[int, int]] = {}
+    # Key read at each nesting level, None in arrays
+    keys: list[str | None] = []
+    in_object: list[bool] = []
+    expecting_key = False
+    for match in _JSON_TOKEN.finditer(content):
+        token = match.group()
+        if token in "{[":
+            keys.append(None)
+            in_object.append(token == "{")
+            expecting_key = token == "{"
+        elif token in "}]":
+            keys.pop()
+            in_object.pop()
+        elif token == ",":
+            expecting_key = bool(in_object) and in_object[-1]
+        elif token == ":":
+            continue
+        elif expecting_key:
+            keys[-1] = json.loads(token)
+            expecting_key = False
+        elif token[0] == '"' and None not in keys:
+            path = tuple(keys)
+            if path in paths and path not in spans:
+                spans[path] = match.span()
+                if len(spans) == len(paths):
+                    break
+    if len(spans) != len(paths):
+        return None
+    return _replace_spans(content, spans.values(), json.dumps(version))
+
+
+def _replace_spans(content: str, spans: Iterable[tuple[int, int]], value: str) -> str:
+    pieces: list[str] = []
+    last = 0
+    for start, end in sorted(spans):
+        pieces.extend((content[last:start], value))
+        last = end
+    pieces.append(content[last:])
+    return "".join(pieces)
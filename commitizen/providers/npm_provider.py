@@ -5,10 +5,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from commitizen.providers.base_provider import JsonProvider
+from commitizen.providers.lock_files import set_json_versions
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+# Where `set_lock_version` and `set_shrinkwrap_version` set the version
+LOCK_VERSION_PATHS = (("version",), ("packages", "", "version"))
+
 
 class NpmProvider(JsonProvider):
     """
@@ -51,26 +55,26 @@ class NpmProvider(JsonProvider):
             encoding=self._get_encoding(),
         )
         if self.lock_file.is_file():
-            lock_document = self.set_lock_version(
-                json.loads(self.lock_file.read_text(encoding=self._get_encoding())),
-                version,
-            )
-            self.lock_file.write_text(
-                json.dumps(lock_document, indent=self.indent) + "\n",
-                encoding=self._get_encoding(),
-            )
+            self._set_lock_file_version(self.lock_file, "set_lock_version", version)
         if self.shrinkwrap_file.is_file():
-            shrinkwrap_document = self.set_shrinkwrap_version(
-                json.loads(
-                    self.shrinkwrap_file.read_text(encoding=self._get_encoding())
-                ),
-                version,
-            )
-            self.shrinkwrap_file.write_text(
-                json.dumps(shrinkwrap_document, indent=self.indent) + "\n",
-                encoding=self._get_encoding(),
+            self._set_lock_file_version(
+                self.shrinkwrap_file, "set_shrinkwrap_version", version
             )
 
+    def _set_lock_file_version(self, path: Path, method: str, version: str) -> None:
+        """Set the version of a lock file with the given `set_*_version` method.
+
+        Only the version values are rewritten, unless the method is overridden.
+        """
+        content = path.read_text(encoding=self._get_encoding())
+        patched_content = None
+        if getattr(type(self), method) is getattr(NpmProvider, method):
+            patched_content = set_json_versions(content, LOCK_VERSION_PATHS, version)
+        if patched_content is None:
+            document = getattr(self, method)(json.loads(content), version)
+            patched_content = json.dumps(document, indent=self.indent) + "\n"
+        path.write_text(patched_content, encoding=self._get_encoding())
+
     def get_package_version(self, document: Mapping[str, str]) -> str:
         return document["version"]
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from commitizen.git import get_tags
+from commitizen import git
 from commitizen.providers.base_provider import VersionProvider
 from commitizen.tags import TagRules
 
@@ -16,7 +16,7 @@ class ScmProvider(VersionProvider):
 
     def get_version(self) -> str:
         rules = TagRules.from_settings(self.config.settings)
-        tags = get_tags(reachable_only=True)
+        tags = git.get_tags(reachable_only=True)
         version_tags = rules.get_version_tags(tags)
         version = max((rules.extract_version(t) for t in version_tags), default=None)
         return str(version) if version is not None else "0.0.0"
@@ -7,6 +7,7 @@ import tomlkit.items
 from packaging.utils import canonicalize_name
 
 from commitizen.providers.base_provider import TomlProvider
+from commitizen.providers.lock_files import set_toml_package_versions
 
 
 class UvProvider(TomlProvider):
@@ -32,15 +33,16 @@ class UvProvider(TomlProvider):
         project_name = pyproject_toml_content["project"]["name"]  # type: ignore[index]
         normalized_project_name = canonicalize_name(str(project_name))
 
-        document = tomlkit.parse(
-            self.lock_file.read_text(encoding=self._get_encoding())
-        )
-
-        packages: tomlkit.items.AoT = document["package"]  # type: ignore[assignment]
-        for i, package in enumerate(packages):
-            if package["name"] == normalized_project_name:
-                document["package"][i]["version"] = version  # type: ignore[index]
-                break
-        self.lock_file.write_text(
-            tomlkit.dumps(document), encoding=self._get_encoding()
+        lock_content = self.lock_file.read_text(encoding=self._get_encoding())
+        patched_lock_content = set_toml_package_versions(
+            lock_content, [normalized_project_name], version, first_only=True
         )
+        if patched_lock_content is None:
+            document = tomlkit.parse(lock_content)
+            packages: tomlkit.items.AoT = document["package"]  # type: ignore[assignment]
+            for i, package in enumerate(packages):
+                if package["name"] == normalized_project_name:
+                    document["package"][i]["version"] = version  # type: ignore[index]
+                    break
+            patched_lock_content = tomlkit.dumps(document)
+        self.lock_file.write_text(patched_lock_content, encoding=self._get_encoding())
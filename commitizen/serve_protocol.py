@@ -0,0 +1,130 @@
+"""The socket protocol between `cz serve` and `cz-client`.
+
+`cz-client` runs for every commit in the git hooks, so this module only
+imports the standard library: answering from a warm server has to stay
+cheaper than starting `cz`.
+
+A request is a JSON object on a single line, with the command line, the
+standard input (null when it is a terminal) and the `GIT_*` environment
+variables of the client. The server answers with a JSON `Response` and
+closes the connection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+SERVED_COMMANDS = ("check", "version")
+# The environment variables of the client the commands run with, such as
+# `GIT_DIR` in a worktree or `GIT_QUARANTINE_PATH` in a pre-receive hook
+FORWARDED_ENV_PREFIX = "GIT_"
+
+
+class Response(TypedDict):
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def socket_dir() -> Path:
+    """Get the directory of the sockets of the current user.
+
+    It is in `$XDG_RUNTIME_DIR` when set, in a directory of the temporary
+    directory dedicated to the user otherwise.
+    """
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir, "commitizen")
+    # Only needed without XDG_RUNTIME_DIR, and not cheap to import
+    import tempfile
+
+    return Path(tempfile.gettempdir(), f"cz-serve-{os.getuid()}")
+
+
+def socket_path(cwd: str | Path | None = None) -> Path:
+    """Get the socket path of the server dedicated to the given directory."""
+    directory = os.path.realpath(cwd or os.getcwd())
+    digest = hashlib.sha1(directory.encode("utf-8")).hexdigest()[:16]
+    return socket_dir() / f"{digest}.sock"
+
+
+def is_private_dir(path: Path) -> bool:
+    """Whether `path` is a directory only the current user can access.
+
+    Otherwise another user could create the socket first and answer the
+    requests, reporting every commit message as valid for example.
+    """
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def forwarded_env(env: Mapping[str, str]) -> dict[str, str]:
+    return {
+        name: value
+        for name, value in env.items()
+        if name.startswith(FORWARDED_ENV_PREFIX)
+    }
+
+
+def request(
+    argv: Sequence[str],
+    stdin: str | None = None,
+    cwd: str | Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> Response | None:
+    """Run a `cz` command line on the server of the given directory.
+
+    The command runs with the `GIT_*` variables of `env` (default: the
+    environment of the current process).
+
+    Returns:
+        The server response, or None if no server is reachable.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path(cwd)
+    if not is_private_dir(path.parent):
+        return None
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+
+    payload = json.dumps(
+        {
+            "argv": list(argv),
+            "stdin": stdin,
+            "env": forwarded_env(os.environ if env is None else env),
+        }
+    ).encode("utf-8")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            sock.sendall(payload + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    if not chunks:
+        return None
+    response: Response = json.loads(b"".join(chunks))
+    return response
@@ -0,0 +1,110 @@
+"""Resolve glob patterns against the files known to git instead of the file system.
+
+Globbing `version_files` with `glob.iglob` lists every directory a pattern
+goes through, including ignored ones such as `node_modules` or build outputs.
+`TrackedFiles` lists the work tree once with `git ls-files` and matches the
+patterns in memory, with the same semantics as the (non-recursive)
+`glob.iglob`: wildcards don't match `/` and don't match a leading `.`.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+
+from commitizen import git
+
+_MAGIC_PATTERN = re.compile(r"[*?[]")
+
+
+def has_magic(pattern: str) -> bool:
+    return _MAGIC_PATTERN.search(pattern) is not None
+
+
+def translate(pattern: str) -> str:
+    """Translate a glob pattern relative to a directory into a regex.
+
+    Each path component is matched separately, like `glob.iglob` does.
+    """
+    return "/".join(_translate_component(part) for part in pattern.split("/"))
+
+
+def _translate_component(part: str) -> str:
+    # Hidden files are only matched by components starting with a dot
+    result = [] if part.startswith(".") or not has_magic(part) else [r"(?!\.)"]
+    i, n = 0, len(part)
+    while i < n:
+        c = part[i]
+        i += 1
+        if c == "*":
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and part[j] in "!^":
+                j += 1
+            if j < n and part[j] == "]":
+                j += 1
+            j = part.find("]", j)
+            if j == -1:
+                result.append(re.escape(c))
+                continue
+            chars = re.sub(r"([\[&~|])", r"\\\1", part[i:j].replace("\\", "\\\\"))
+            i = j + 1
+            if chars[0] == "!":
+                chars = f"^{chars[1:]}"
+            elif chars[0] == "^":
+                chars = f"\\{chars}"
+            result.append(f"[{chars}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+class TrackedFiles:
+    """The files of a git work tree, listed once."""
+
+    def __init__(self, root: str | os.PathLike[str], files: list[str]) -> None:
+        self.root = os.path.realpath(root)
+        self.files = files
+
+    @classmethod
+    def from_git(
+        cls, root: str | os.PathLike[str], *, include_untracked: bool = False
+    ) -> TrackedFiles:
+        return cls(root, git.get_tracked_files(include_untracked=include_untracked))
+
+    def glob(self, pattern: str) -> list[str] | None:
+        """Get the files matching a glob pattern, formatted like `glob.iglob` does.
+
+        Like `glob.iglob`, only the files found in the work tree are returned:
+        a file deleted but not staged yet is still listed by git.
+
+        Returns:
+            None if the pattern goes outside of the work tree.
+        """
+        parts = pattern.replace(os.sep, "/").split("/")
+        magic_index = next(
+            (i for i, part in enumerate(parts) if has_magic(part)), len(parts)
+        )
+        if magic_index == len(parts):
+            return [pattern] if os.path.lexists(pattern) else []
+
+        prefix_parts = parts[:magic_index]
+        prefix = "/".join(prefix_parts) or ("/" if prefix_parts else "")
+        directory = os.path.relpath(
+            os.path.normpath(os.path.join(os.path.realpath("."), prefix)), self.root
+        ).replace(os.sep, "/")
+        if directory == os.pardir or directory.startswith(f"{os.pardir}/"):
+            return None
+        directory_prefix = "" if directory == "." else f"{directory}/"
+
+        regex = re.compile(translate("/".join(parts[magic_index:])))
+        matches = (
+            os.path.join(prefix, remainder) if prefix else remainder
+            for path in self.files
+            if path.startswith(directory_prefix)
+            and regex.fullmatch(remainder := path[len(directory_prefix) :])
+        )
+        return [match for match in matches if os.path.lexists(match)]
@@ -18,7 +18,9 @@ from typing import (
 from packaging.version import InvalidVersion  # noqa: F401 (expose the common exception)
 from packaging.version import Version as _BaseVersion
 
+from commitizen.defaults import KNOWN_SCHEMES as KNOWN_SCHEMES
 from commitizen.defaults import MAJOR, MINOR, PATCH, Settings
+from commitizen.defaults import SCHEMES_ENTRYPOINT as SCHEMES_ENTRYPOINT
 from commitizen.exceptions import VersionSchemeUnknown
 
 if TYPE_CHECKING:
@@ -387,12 +389,6 @@ class SemVer2(SemVer):
 
 DEFAULT_SCHEME: VersionScheme = Pep440
 
-SCHEMES_ENTRYPOINT = "commitizen.scheme"
-"""Schemes entrypoints group"""
-
-KNOWN_SCHEMES = [ep.name for ep in metadata.entry_points(group=SCHEMES_ENTRYPOINT)]
-"""All known registered version schemes"""
-
 
 def get_version_scheme(settings: Settings, name: str | None = None) -> VersionScheme:
     """
@@ -0,0 +1,239 @@
+"""Benchmark `cz` commands end to end on large synthetic repositories.
+
+Each scenario runs `cz` in a fresh process, reporting its wall time, its
+peak RSS (where `os.wait4` is available, not on Windows) and the number of subprocesses it ran (read from the trace of
+`CZ_TRACE_COMMANDS`). The repository is restored after each run of the
+scenarios changing it.
+
+    python -m tests.benchmarks.large_repo --commits 100000 --tags 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+from tests.benchmarks.repo_generator import MESSAGE_SIZES, RepoSpec, generate_repo
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    args: tuple[str, ...]
+    # `cz` commands run before the scenario, not measured
+    setup: tuple[tuple[str, ...], ...] = ()
+
+
+SCENARIOS = [
+    Scenario("check --rev-range", ("check", "--rev-range", "HEAD")),
+    Scenario("bump --dry-run", ("bump", "--yes", "--dry-run")),
+    Scenario(
+        "bump --changelog",
+        ("bump", "--yes", "--changelog"),
+        setup=(("changelog",),),
+    ),
+    Scenario("changelog", ("changelog",)),
+    Scenario(
+        "changelog --incremental",
+        ("changelog", "--incremental"),
+        setup=(("changelog",),),
+    ),
+    Scenario("version --project", ("version", "--project")),
+]
+
+
+class Measure(NamedTuple):
+    seconds: float
+    # None where the RSS of a child process can't be read, such as on Windows
+    max_rss_kib: int | None
+    subprocesses: int
+
+
+def run_cz(
+    repo: Path, args: tuple[str, ...], trace_file: Path | None = None
+) -> tuple[Measure, int]:
+    """Run `cz` in `repo` and measure it.
+
+    Returns:
+        The measure and the exit code of `cz`.
+    """
+    env = {
+        "GIT_AUTHOR_NAME": "Bench",
+        "GIT_AUTHOR_EMAIL": "bench@example.com",
+        "GIT_COMMITTER_NAME": "Bench",
+        "GIT_COMMITTER_EMAIL": "bench@example.com",
+        **os.environ,
+        "CZ_TRACE_COMMANDS": str(trace_file) if trace_file else "",
+    }
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "commitizen", *args],
+        cwd=repo,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    max_rss_kib = None
+    if hasattr(os, "wait4"):
+        # Unlike `resource.getrusage(RUSAGE_CHILDREN)`, only measures this process
+        _, status, rusage = os.wait4(process.pid, 0)
+        seconds = time.perf_counter() - start
+        exit_code = os.waitstatus_to_exitcode(status)
+        # Already reaped by wait4, which Popen must not try again
+        process.returncode = exit_code
+        # ru_maxrss is in bytes on macOS, in KiB elsewhere
+        max_rss_kib = rusage.ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+    else:
+        exit_code = process.wait()
+        seconds = time.perf_counter() - start
+
+    subprocesses = 0
+    if trace_file is not None and trace_file.exists():
+        with trace_file.open(encoding="utf-8") as f:
+            subprocesses = sum(1 for _ in f)
+        trace_file.unlink()
+    return Measure(seconds, max_rss_kib, subprocesses), exit_code
+
+
+def run_scenario(repo: Path, scenario: Scenario, repeat: int) -> Measure:
+    """Run a scenario `repeat` times, keeping the best time and the worst RSS."""
+    measures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_file = Path(tmp, "commands.jsonl")
+        for _ in range(repeat):
+            head = _git(repo, "rev-parse", "HEAD")
+            tags = set(_git(repo, "tag").splitlines())
+            try:
+                for args in scenario.setup:
+                    run_cz(repo, args)
+                measure, exit_code = run_cz(repo, scenario.args, trace_file)
+            finally:
+                _restore(repo, head, tags)
+            if exit_code != 0:
+                raise RuntimeError(
+                    f"cz {' '.join(scenario.args)} exited with {exit_code}"
+                )
+            measures.append(measure)
+    rss = [m.max_rss_kib for m in measures if m.max_rss_kib is not None]
+    return Measure(
+        min(m.seconds for m in measures),
+        max(rss) if rss else None,
+        max(m.subprocesses for m in measures),
+    )
+
+
+def run_benchmarks(
+    repo: Path, scenarios: list[Scenario], repeat: int = 3
+) -> dict[str, Measure]:
+    return {
+        scenario.name: run_scenario(repo, scenario, repeat) for scenario in scenarios
+    }
+
+
+def format_report(spec: RepoSpec, measures: dict[str, Measure]) -> str:
+    lines = [
+        f"{spec.commits:,} commits, {spec.tags:,} tags ({', '.join(spec.tag_formats)}),"
+        f" {spec.message_sizes} messages",
+        f"{'scenario':<26} {'time (s)':>9} {'peak RSS (MiB)':>15} {'subprocesses':>13}",
+    ]
+    lines.extend(
+        f"{name:<26} {m.seconds:>9.3f} {_format_mib(m.max_rss_kib):>15} {m.subprocesses:>13}"
+        for name, m in measures.items()
+    )
+    return "\n".join(lines)
+
+
+def _format_mib(size_kib: int | None) -> str:
+    return f"{size_kib / 1024:.1f}" if size_kib is not None else "-"
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _restore(repo: Path, head: str, tags: set[str]) -> None:
+    _git(repo, "reset", "--quiet", "--hard", head.strip())
+    _git(repo, "clean", "--quiet", "--force")
+    if created := set(_git(repo, "tag").splitlines()) - tags:
+        _git(repo, "tag", "--delete", *created)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--commits", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument(
+        "--tag-format",
+        action="append",
+        dest="tag_formats",
+        help="Format of the tags, can be repeated to mix formats (default: v$version)",
+    )
+    parser.add_argument("--message-sizes", choices=list(MESSAGE_SIZES), default="mixed")
+    parser.add_argument("--untagged-commits", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Only run this scenario, can be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Keep the generated repositories in this directory to reuse them",
+    )
+    parser.add_argument("--json", type=Path, help="Also write the results to a file")
+    args = parser.parse_args(argv)
+
+    spec = RepoSpec(
+        commits=args.commits,
+        tags=args.tags,
+        tag_formats=tuple(args.tag_formats or ("v$version",)),
+        message_sizes=args.message_sizes,
+        untagged_commits=args.untagged_commits,
+        seed=args.seed,
+    )
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.scenarios or scenario.name in args.scenarios
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(args.cache_dir or tmp, spec.name)
+        if not (repo / ".git").is_dir():
+            print(f"Generating {repo}...", file=sys.stderr)
+            start = time.perf_counter()
+            generate_repo(repo, spec)
+            print(f"Generated in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        measures = run_benchmarks(repo, scenarios, args.repeat)
+
+    print(format_report(spec, measures))
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "repo": spec.name,
+                    "scenarios": {
+                        name: measure._asdict() for name, measure in measures.items()
+                    },
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
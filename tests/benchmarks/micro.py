@@ -0,0 +1,395 @@
+"""Micro-benchmarks of the pure-Python hot paths, on deterministic in-memory inputs.
+
+Times are recorded in units of a calibration workload measured
+alongside each benchmark, so that a baseline recorded on one machine
+stays meaningful on another one. With `--compare`, the benchmarks
+slower than the baseline are run again before being reported, so that
+a noisy moment of the machine isn't taken for a regression.
+
+    python -m tests.benchmarks.micro            # print the timings
+    python -m tests.benchmarks.micro --compare  # also fail on regressions
+    python -m tests.benchmarks.micro --save     # update the baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import re
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from commitizen import bump, changelog
+from commitizen.changelog_formats.markdown import Markdown
+from commitizen.config import BaseConfig
+from commitizen.cz.conventional_commits import ConventionalCommitsCz
+from commitizen.exceptions import CommitMessageLengthExceededError
+from commitizen.git import CommitBatch, GitCommit, GitTag
+from commitizen.tags import TagRules
+from tests.benchmarks.repo_generator import (
+    BODY_LINE,
+    CHANGE_TYPES,
+    MESSAGE_SIZES,
+    SCOPES,
+    SUBJECTS,
+    tag_version,
+)
+from tests.benchmarks.validation import generate_corpus
+
+BASELINE = Path(__file__).with_name("micro_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 9
+# Times a benchmark slower than the threshold is run again before being
+# reported as a regression, keeping its best time
+RETRIES = 2
+
+COMMITS = 1_000
+# One tag every TAG_INTERVAL commits
+TAG_INTERVAL = 20
+
+Benchmark = Callable[[], Callable[[], object]]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a function preparing the inputs and returning what to time."""
+
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+class Inputs(NamedTuple):
+    config: BaseConfig
+    cz: ConventionalCommitsCz
+    rules: TagRules
+    log_entries: list[str]
+    commits: list[GitCommit]
+    tags: list[GitTag]
+
+
+def _make_inputs(seed: int = 0) -> Inputs:
+    rng = random.Random(seed)
+    config = BaseConfig()
+    config.settings.update(
+        {"tag_format": "v$version", "legacy_tag_formats": ["$version"]}
+    )
+    sizes, weights = zip(*MESSAGE_SIZES["mixed"])
+
+    log_entries = []
+    for number in range(COMMITS, 0, -1):
+        body = "\n".join([BODY_LINE] * rng.choices(sizes, weights)[0])
+        log_entries.append(
+            f"{number:040x}\n{number - 1:040x}\n"
+            f"{rng.choice(CHANGE_TYPES)}{rng.choice(SCOPES)}: {rng.choice(SUBJECTS)}\n"
+            f"Bench\nbench@example.com\n{body}"
+        )
+    commits = [GitCommit.from_rev_and_commit(entry) for entry in log_entries]
+
+    # Newest first, like `git.get_tags`; the older half uses the legacy format
+    tag_count = COMMITS // TAG_INTERVAL
+    tags = [
+        GitTag(
+            f"{'v' if index >= tag_count // 2 else ''}{tag_version(index)}",
+            f"{(index + 1) * TAG_INTERVAL:040x}",
+            "2020-01-01",
+        )
+        for index in reversed(range(tag_count))
+    ]
+    return Inputs(
+        config,
+        ConventionalCommitsCz(config),
+        TagRules.from_settings(config.settings),
+        log_entries,
+        commits,
+        tags,
+    )
+
+
+_inputs: Inputs | None = None
+
+
+def get_inputs() -> Inputs:
+    global _inputs
+    if _inputs is None:
+        _inputs = _make_inputs()
+    return _inputs
+
+
+def _build_tree(inputs: Inputs) -> list[dict[str, Any]]:
+    return list(
+        changelog.generate_tree_from_commits(
+            inputs.commits,
+            inputs.tags,
+            inputs.cz.commit_parser,
+            inputs.cz.changelog_pattern,
+            rules=inputs.rules,
+        )
+    )
+
+
+def _render(inputs: Inputs, tree: list[dict[str, Any]]) -> str:
+    return changelog.render_changelog(
+        tree, inputs.cz.template_loader, Markdown(inputs.config).template
+    )
+
+
+@benchmark("GitCommit.from_rev_and_commit")
+def bench_from_rev_and_commit() -> Callable[[], object]:
+    entries = get_inputs().log_entries
+    return lambda: [GitCommit.from_rev_and_commit(entry) for entry in entries]
+
+
+@benchmark("CommitBatch.from_log")
+def bench_commit_batch() -> Callable[[], object]:
+    delimiter = "----------commit-delimiter----------"
+    log = "".join(f"{entry}{delimiter}\n" for entry in get_inputs().log_entries)
+    # Indexing the log, then creating each commit in turn
+    return lambda: list(CommitBatch.from_log(log, delimiter))
+
+
+@benchmark("TagRules.is_version_tag")
+def bench_is_version_tag() -> Callable[[], object]:
+    inputs = get_inputs()
+    tags = [*inputs.tags, GitTag("latest", "0" * 40, "2020-01-01")]
+    return lambda: [inputs.rules.is_version_tag(tag) for tag in tags]
+
+
+@benchmark("TagRules.extract_version")
+def bench_extract_version() -> Callable[[], object]:
+    inputs = get_inputs()
+    return lambda: [inputs.rules.extract_version(tag) for tag in inputs.tags]
+
+
+@benchmark("TagRules.search_version")
+def bench_search_version() -> Callable[[], object]:
+    inputs = get_inputs()
+    titles = [f"## {tag.name} ({tag.date})" for tag in inputs.tags]
+    return lambda: [inputs.rules.search_version(title) for title in titles]
+
+
+@benchmark("bump.find_increment")
+def bench_find_increment() -> Callable[[], object]:
+    inputs = get_inputs()
+    return lambda: bump.find_increment(
+        inputs.commits, inputs.cz.bump_pattern, inputs.cz.bump_map
+    )
+
+
+@benchmark("changelog.generate_tree_from_commits")
+def bench_generate_tree_from_commits() -> Callable[[], object]:
+    inputs = get_inputs()
+    return lambda: _build_tree(inputs)
+
+
+@benchmark("changelog.generate_ordered_changelog_tree")
+def bench_generate_ordered_changelog_tree() -> Callable[[], object]:
+    tree = _build_tree(get_inputs())
+    order = ["BREAKING CHANGE", "feat", "fix", "refactor", "perf"]
+    return lambda: list(changelog.generate_ordered_changelog_tree(tree, order))
+
+
+@benchmark("changelog.incremental_build")
+def bench_incremental_build() -> Callable[[], object]:
+    inputs = get_inputs()
+    tree = _build_tree(inputs)
+    lines = _render(inputs, tree).splitlines(keepends=True)
+    metadata = Markdown(inputs.config).get_metadata_from_file(
+        io.StringIO("".join(lines))
+    )
+    new_content = _render(inputs, tree[:1])
+    return lambda: changelog.incremental_build(new_content, lines, metadata)
+
+
+@benchmark("BaseFormat.get_metadata_from_file")
+def bench_get_metadata_from_file() -> Callable[[], object]:
+    inputs = get_inputs()
+    content = _render(inputs, _build_tree(inputs))
+    changelog_format = Markdown(inputs.config)
+    return lambda: changelog_format.get_metadata_from_file(io.StringIO(content))
+
+
+@benchmark("BaseCommitizen.commit_message_validator")
+def bench_commit_message_validator() -> Callable[[], object]:
+    corpus = generate_corpus(COMMITS)
+    validator = get_inputs().cz.commit_message_validator(
+        allow_abort=False,
+        allowed_prefixes=["Merge", "Revert", "Pull request", "fixup!", "squash!"],
+        max_msg_length=72,
+    )
+
+    def validate_corpus() -> None:
+        for commit_msg in corpus:
+            try:
+                validator(commit_msg)
+            except CommitMessageLengthExceededError:
+                pass
+
+    return validate_corpus
+
+
+_CALIBRATION_LINE = re.compile(
+    r"^(?P<type>\w+)(?:\((?P<scope>\w+)\))?: (?P<subject>.+)$"
+)
+
+
+def calibrate() -> None:
+    """A fixed workload of regex, dict and string operations, the unit of the timings."""
+    counts: dict[str, int] = {}
+    for number in range(500):
+        match = _CALIBRATION_LINE.match(
+            f"{CHANGE_TYPES[number % 8]}(cli): subject {number}"
+        )
+        if match:
+            key = match.group("type")
+            counts[key] = counts.get(key, 0) + len(match.group("subject").upper())
+    "\n".join(sorted(counts, key=counts.__getitem__))
+
+
+def measure(func: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> float:
+    """Get the median time of a call, in calibration units.
+
+    Each timing of `func` is divided by a timing of the calibration taken
+    right before it, so that the frequency changes of the CPU and the other
+    processes slowing the run down cancel out.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    calibration_timer = timeit.Timer(calibrate)
+    calibration_number, _ = calibration_timer.autorange()
+    ratios = []
+    for _ in range(repeat):
+        calibration = calibration_timer.timeit(calibration_number) / calibration_number
+        ratios.append(timer.timeit(number) / number / calibration)
+    return statistics.median(ratios)
+
+
+def run(names: list[str] | None = None, repeat: int = DEFAULT_REPEAT) -> dict[str, Any]:
+    """Time the benchmarks, in calibration units."""
+    calibration_timer = timeit.Timer(calibrate)
+    number, _ = calibration_timer.autorange()
+    calibration = statistics.median(
+        calibration_timer.repeat(repeat=repeat, number=number)
+    )
+    return {
+        "calibration": calibration / number,
+        "benchmarks": {
+            name: measure(BENCHMARKS[name](), repeat) for name in names or BENCHMARKS
+        },
+    }
+
+
+class Comparison(NamedTuple):
+    name: str
+    # Times in seconds on the current machine
+    expected: float | None
+    actual: float
+
+    @property
+    def change(self) -> float | None:
+        if self.expected is None:
+            return None
+        return self.actual / self.expected - 1
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> list[Comparison]:
+    unit = results["calibration"]
+    return [
+        Comparison(
+            name,
+            baseline["benchmarks"][name] * unit
+            if name in baseline["benchmarks"]
+            else None,
+            units * unit,
+        )
+        for name, units in results["benchmarks"].items()
+    ]
+
+
+def _is_regression(comparison: Comparison, threshold: float) -> bool:
+    return comparison.change is not None and comparison.change > threshold
+
+
+def format_comparisons(comparisons: list[Comparison], threshold: float) -> str:
+    lines = [f"{'benchmark':<42} {'baseline (µs)':>14} {'now (µs)':>10} {'change':>8}"]
+    for c in comparisons:
+        expected = f"{c.expected * 1e6:.1f}" if c.expected is not None else "-"
+        change = f"{c.change:+.1%}" if c.change is not None else "new"
+        flag = "  REGRESSION" if _is_regression(c, threshold) else ""
+        lines.append(
+            f"{c.name:<42} {expected:>14} {c.actual * 1e6:>10.1f} {change:>8}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Exit with 1 if a benchmark is slower than the baseline by more than the threshold",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Relative slowdown considered a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--save", action="store_true", help="Update the baseline file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        dest="benchmarks",
+        choices=list(BENCHMARKS),
+        help="Only run this benchmark, can be repeated (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.benchmarks, args.repeat)
+    baseline = (
+        json.loads(args.baseline.read_text())
+        if args.baseline.exists()
+        else {"benchmarks": {}}
+    )
+    comparisons = compare(results, baseline)
+    for _ in range(RETRIES if args.compare else 0):
+        slower = [c.name for c in comparisons if _is_regression(c, args.threshold)]
+        if not slower:
+            break
+        retried = run(slower, args.repeat)["benchmarks"]
+        for name, units in retried.items():
+            results["benchmarks"][name] = min(results["benchmarks"][name], units)
+        comparisons = compare(results, baseline)
+    print(format_comparisons(comparisons, args.threshold))
+
+    if args.save:
+        # The benchmarks not run keep their baseline
+        saved = {
+            "calibration": results["calibration"],
+            "benchmarks": {
+                **baseline["benchmarks"],
+                # Rounded to keep the diffs of the baseline readable
+                **{
+                    name: float(f"{units:.4g}")
+                    for name, units in results["benchmarks"].items()
+                },
+            },
+        }
+        args.baseline.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+    if args.compare and any(_is_regression(c, args.threshold) for c in comparisons):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Generate large synthetic git repositories with `git fast-import`.
+
+Committing through git porcelain takes milliseconds per commit; streaming
+the history to `git fast-import` builds a million commits in about a
+minute. The generated history is deterministic for a given `RepoSpec`.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+from dataclasses import dataclass
+from string import Template
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+CHANGE_TYPES = ["feat", "fix", "fix", "fix", "refactor", "docs", "perf", "chore"]
+SCOPES = ["", "", "(cli)", "(git)", "(changelog)", "(bump)", "(config)"]
+SUBJECTS = [
+    "add support for monorepos",
+    "handle empty commit bodies",
+    "speed up the validation of long ranges",
+    "read the version from the lock file",
+    "typo",
+]
+BODY_LINE = "Explain what the change does and why it was needed, wrapped at 72."
+
+# Probability of each number of body lines, per distribution
+MESSAGE_SIZES: dict[str, list[tuple[int, float]]] = {
+    "short": [(0, 1.0)],
+    "mixed": [(0, 0.6), (2, 0.25), (8, 0.1), (60, 0.05)],
+    "long": [(8, 0.5), (60, 0.4), (400, 0.1)],
+}
+
+AUTHOR = "Bench <bench@example.com>"
+EPOCH = 1_600_000_000
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    commits: int = 10_000
+    tags: int = 100
+    # Formats of the tags, used in turn; the last one is the current `tag_format`
+    tag_formats: tuple[str, ...] = ("v$version",)
+    message_sizes: str = "mixed"
+    # Commits after the last tag, to bump and to add to an incremental changelog
+    untagged_commits: int = 50
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        formats = "+".join(f.replace("$", "") for f in self.tag_formats)
+        return (
+            f"c{self.commits}-t{self.tags}-{formats}-{self.message_sizes}"
+            f"-u{self.untagged_commits}-s{self.seed}"
+        )
+
+
+def tag_version(index: int) -> str:
+    """Version of the `index`th tag: 0.0.1, 0.0.2, ... 0.0.9, 0.1.0..."""
+    index += 1
+    return f"{index // 100}.{index // 10 % 10}.{index % 10}"
+
+
+def tag_name(spec: RepoSpec, index: int) -> str:
+    # Older tags use the first formats, so the latest tags use `tag_format`
+    format_index = index * len(spec.tag_formats) // max(spec.tags, 1)
+    return Template(spec.tag_formats[format_index]).substitute(
+        version=tag_version(index)
+    )
+
+
+def generate_repo(path: Path, spec: RepoSpec) -> None:
+    """Create a git repository at `path` with the history described by `spec`."""
+    if spec.tags and spec.commits - spec.untagged_commits < spec.tags:
+        raise ValueError("Not enough commits to tag")
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "--quiet", str(path)], check=True)
+    subprocess.run(
+        ["git", "symbolic-ref", "HEAD", "refs/heads/master"], cwd=path, check=True
+    )
+
+    process = subprocess.Popen(
+        ["git", "fast-import", "--quiet", "--done"], cwd=path, stdin=subprocess.PIPE
+    )
+    assert process.stdin is not None
+    try:
+        _write_stream(process.stdin, spec)
+    finally:
+        process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError("git fast-import failed")
+    subprocess.run(["git", "reset", "--quiet", "--hard"], cwd=path, check=True)
+
+
+def _write_stream(stream: IO[bytes], spec: RepoSpec) -> None:
+    rng = random.Random(spec.seed)
+    tagged_commits = spec.commits - spec.untagged_commits
+    tag_marks = {
+        (index + 1) * tagged_commits // spec.tags: index for index in range(spec.tags)
+    }
+    sizes, weights = zip(*MESSAGE_SIZES[spec.message_sizes])
+
+    chunks: list[bytes] = [_data_command("blob", _pyproject(spec), mark=1)]
+    for mark in range(2, spec.commits + 2):
+        number = mark - 1
+        body_lines = rng.choices(sizes, weights)[0]
+        message = (
+            f"{rng.choice(CHANGE_TYPES)}{rng.choice(SCOPES)}: "
+            f"{rng.choice(SUBJECTS)} #{number}"
+        )
+        if body_lines:
+            message += "\n\n" + "\n".join([BODY_LINE] * body_lines)
+        date = f"{EPOCH + number * 60} +0000"
+        commit = [
+            b"commit refs/heads/master\n",
+            f"mark :{mark}\n".encode(),
+            f"author {AUTHOR} {date}\n".encode(),
+            f"committer {AUTHOR} {date}\n".encode(),
+            _data(message),
+        ]
+        if number == 1:
+            commit.append(b"M 100644 :1 pyproject.toml\n")
+        commit.append(b"M 100644 inline src/file%d.txt\n" % (number % 64))
+        commit.append(_data(f"{number}\n"))
+        chunks.extend(commit)
+        if number in tag_marks:
+            name = tag_name(spec, tag_marks[number])
+            chunks.append(f"reset refs/tags/{name}\nfrom :{mark}\n\n".encode())
+        if len(chunks) > 4096:
+            stream.writelines(chunks)
+            chunks.clear()
+    chunks.append(b"done\n")
+    stream.writelines(chunks)
+
+
+def _pyproject(spec: RepoSpec) -> str:
+    version = tag_version(spec.tags - 1) if spec.tags else "0.0.0"
+    *legacy, tag_format = spec.tag_formats
+    return (
+        "[tool.commitizen]\n"
+        f'version = "{version}"\n'
+        f'tag_format = "{tag_format}"\n'
+        f"legacy_tag_formats = {legacy!r}\n"
+        'version_scheme = "semver2"\n'
+    ).replace("'", '"')
+
+
+def _data(content: str) -> bytes:
+    encoded = content.encode()
+    return b"data %d\n%s\n" % (len(encoded), encoded)
+
+
+def _data_command(kind: str, content: str, mark: int) -> bytes:
+    return f"{kind}\nmark :{mark}\n".encode() + _data(content)
+
+
+def iter_tag_names(spec: RepoSpec) -> Iterator[str]:
+    return (tag_name(spec, index) for index in range(spec.tags))
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks.large_repo import (
+    SCENARIOS,
+    Measure,
+    format_report,
+    run_benchmarks,
+    run_cz,
+)
+from tests.benchmarks.repo_generator import (
+    RepoSpec,
+    generate_repo,
+    iter_tag_names,
+    tag_version,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git(repo: Path, *args: str) -> list[str]:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+
+
+@pytest.fixture(scope="module")
+def spec() -> RepoSpec:
+    return RepoSpec(
+        commits=40, tags=4, tag_formats=("$version", "v$version"), untagged_commits=5
+    )
+
+
+@pytest.fixture(scope="module")
+def repo(tmp_path_factory: pytest.TempPathFactory, spec: RepoSpec) -> Path:
+    repo = tmp_path_factory.mktemp("benchmark") / spec.name
+    generate_repo(repo, spec)
+    return repo
+
+
+@pytest.mark.parametrize(
+    ("index", "version"), [(0, "0.0.1"), (8, "0.0.9"), (9, "0.1.0"), (99, "1.0.0")]
+)
+def test_tag_version(index: int, version: str):
+    assert tag_version(index) == version
+
+
+def test_generate_repo(repo: Path, spec: RepoSpec):
+    assert _git(repo, "rev-list", "--count", "HEAD") == ["40"]
+    assert _git(repo, "status", "--porcelain") == []
+    assert sorted(_git(repo, "tag")) == sorted(iter_tag_names(spec))
+    assert sorted(_git(repo, "tag")) == ["0.0.1", "0.0.2", "v0.0.3", "v0.0.4"]
+    # The untagged commits come after the last tag
+    assert _git(repo, "rev-list", "--count", "v0.0.4..HEAD") == ["5"]
+    assert (repo / "pyproject.toml").read_text() == (
+        "[tool.commitizen]\n"
+        'version = "0.0.4"\n'
+        'tag_format = "v$version"\n'
+        'legacy_tag_formats = ["$version"]\n'
+        'version_scheme = "semver2"\n'
+    )
+
+
+def test_generate_repo_is_deterministic(tmp_path: Path, repo: Path, spec: RepoSpec):
+    generate_repo(tmp_path, spec)
+
+    assert _git(tmp_path, "rev-parse", "HEAD") == _git(repo, "rev-parse", "HEAD")
+
+
+def test_run_benchmarks(repo: Path, spec: RepoSpec):
+    head = _git(repo, "rev-parse", "HEAD")
+    tags = _git(repo, "tag")
+    scenarios = [
+        s for s in SCENARIOS if s.name in ("bump --changelog", "check --rev-range")
+    ]
+
+    measures = run_benchmarks(repo, scenarios, repeat=1)
+
+    assert list(measures) == ["check --rev-range", "bump --changelog"]
+    assert measures["check --rev-range"].subprocesses == 1
+    assert measures["bump --changelog"].subprocesses > 1
+    assert all(m.seconds > 0 for m in measures.values())
+    if hasattr(os, "wait4"):
+        assert all(m.max_rss_kib for m in measures.values())
+    # The repository is restored
+    assert _git(repo, "rev-parse", "HEAD") == head
+    assert _git(repo, "tag") == tags
+    assert _git(repo, "status", "--porcelain") == []
+
+    report = format_report(spec, {"version --project": Measure(0.5, 20480, 0)})
+    assert report.splitlines()[-1].split() == [
+        "version",
+        "--project",
+        "0.500",
+        "20.0",
+        "0",
+    ]
+
+
+def test_run_cz_without_wait4(repo: Path, monkeypatch: pytest.MonkeyPatch):
+    # Like on Windows
+    monkeypatch.delattr(os, "wait4", raising=False)
+
+    measure, exit_code = run_cz(repo, ("version", "--project"))
+
+    assert exit_code == 0
+    assert measure.seconds > 0
+    assert measure.max_rss_kib is None
+    report = format_report(RepoSpec(), {"version --project": measure})
+    assert report.splitlines()[-1].split()[-2] == "-"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.benchmarks import micro
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize("name", list(micro.BENCHMARKS))
+def test_benchmark(name: str):
+    # Each benchmark runs on the inputs without failing
+    micro.BENCHMARKS[name]()()
+
+
+def test_inputs():
+    inputs = micro.get_inputs()
+
+    assert len(inputs.commits) == micro.COMMITS
+    assert len(inputs.tags) == micro.COMMITS // micro.TAG_INTERVAL
+    assert all(inputs.rules.is_version_tag(tag) for tag in inputs.tags)
+    assert micro.get_inputs() is inputs
+
+
+def test_baseline_covers_all_benchmarks():
+    baseline = json.loads(micro.BASELINE.read_text())
+
+    assert sorted(baseline["benchmarks"]) == sorted(micro.BENCHMARKS)
+
+
+def test_compare():
+    results = {"calibration": 0.001, "benchmarks": {"a": 2.0, "b": 3.0, "c": 1.0}}
+    baseline = {"calibration": 0.5, "benchmarks": {"a": 1.0, "b": 3.0}}
+
+    comparisons = micro.compare(results, baseline)
+
+    # The baseline is converted to seconds on the current machine
+    assert comparisons == [
+        micro.Comparison("a", 0.001, 0.002),
+        micro.Comparison("b", 0.003, 0.003),
+        micro.Comparison("c", None, 0.001),
+    ]
+    assert [c.change for c in comparisons] == [1.0, 0.0, None]
+    report = micro.format_comparisons(comparisons, threshold=0.25).splitlines()
+    assert report[1].split() == ["a", "1000.0", "2000.0", "+100.0%", "REGRESSION"]
+    assert report[2].split() == ["b", "3000.0", "3000.0", "+0.0%"]
+    assert report[3].split() == ["c", "-", "1000.0", "new"]
+
+
+@pytest.mark.parametrize(("baseline_units", "exit_code"), [(1e9, 0), (1e-9, 1)])
+def test_main_compare(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    baseline_units: float,
+    exit_code: int,
+):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "calibration": 0.001,
+                "benchmarks": {"bump.find_increment": baseline_units},
+            }
+        )
+    )
+    argv = ["--baseline", str(baseline), "--benchmark", "bump.find_increment"]
+
+    assert micro.main([*argv, "--compare", "--repeat", "1"]) == exit_code
+    assert "bump.find_increment" in capsys.readouterr().out
+
+
+def test_main_save(tmp_path: Path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"calibration": 0.001, "benchmarks": {"a": 1.0}}))
+
+    micro.main(
+        [
+            *("--baseline", str(baseline), "--save", "--repeat", "1"),
+            *("--benchmark", "TagRules.is_version_tag"),
+        ]
+    )
+
+    saved = json.loads(baseline.read_text())
+    assert saved["benchmarks"]["a"] == 1.0
+    assert saved["benchmarks"]["TagRules.is_version_tag"] > 0
+    assert saved["calibration"] > 0
+
+
+def test_main_compare_runs_slower_benchmarks_again(
+    tmp_path: Path, mocker: MockerFixture
+):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps({"calibration": 0.001, "benchmarks": {"a": 1.0, "b": 1.0}})
+    )
+    run = mocker.patch.object(
+        micro,
+        "run",
+        side_effect=[
+            {"calibration": 0.001, "benchmarks": {"a": 2.0, "b": 1.0}},
+            # Only slower once, such as when the machine was busy
+            {"calibration": 0.001, "benchmarks": {"a": 1.0}},
+        ],
+    )
+
+    assert micro.main(["--baseline", str(baseline), "--compare"]) == 0
+    assert run.call_args_list[1].args == (["a"], micro.DEFAULT_REPEAT)
@@ -0,0 +1,154 @@
+"""Benchmark the validation of commit messages on a generated corpus.
+
+Compares validating each message with `validate_commit_message` and with a
+reused validator to the implementation of `validate_commit_message` before
+`CommitMessageValidator` existed.
+
+    python -m tests.benchmarks.validation [COUNT]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from commitizen.config import BaseConfig
+from commitizen.cz.base import ValidationResult
+from commitizen.cz.conventional_commits import ConventionalCommitsCz
+from commitizen.exceptions import CommitMessageLengthExceededError
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable, Iterable
+
+CHANGE_TYPES = ["feat", "fix", "docs", "refactor", "perf", "test", "chore", "ci"]
+SCOPES = ["", "(cli)", "(git)", "(changelog)", "(bump)", "(config/toml)"]
+SUBJECTS = [
+    "add support for monorepos",
+    "handle empty commit bodies",
+    "speed up the validation of long ranges",
+    "typo",
+    "a subject long enough to exceed the configured message length limit by far",
+]
+BODIES = [
+    "",
+    "\n\nA short body.",
+    "\n\n" + "A body spreading over many lines.\n" * 40,
+    "\n\nBREAKING CHANGE: the configuration format changed",
+]
+INVALID_MESSAGES = ["wip", "Update README.md", "fixed stuff\n\nfor real this time", ""]
+PREFIXED_MESSAGES = [
+    "Merge pull request #1 from user/branch",
+    "fixup! fix: typo",
+    'Revert "feat: add a feature"',
+]
+
+
+def generate_corpus(count: int, seed: int = 0) -> list[str]:
+    """Generate a mix of valid, invalid and prefixed commit messages."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.1:
+            corpus.append(rng.choice(INVALID_MESSAGES))
+        elif kind < 0.2:
+            corpus.append(rng.choice(PREFIXED_MESSAGES))
+        else:
+            corpus.append(
+                f"{rng.choice(CHANGE_TYPES)}{rng.choice(SCOPES)}: "
+                f"{rng.choice(SUBJECTS)}{rng.choice(BODIES)}"
+            )
+    return corpus
+
+
+def baseline_validate_commit_message(
+    *,
+    commit_msg: str,
+    pattern: re.Pattern[str],
+    allow_abort: bool,
+    allowed_prefixes: list[str],
+    max_msg_length: int | None,
+    commit_hash: str,
+) -> ValidationResult:
+    """`BaseCommitizen.validate_commit_message` before `CommitMessageValidator`."""
+    if not commit_msg:
+        return ValidationResult(
+            allow_abort, [] if allow_abort else ["commit message is empty"]
+        )
+
+    if any(map(commit_msg.startswith, allowed_prefixes)):
+        return ValidationResult(True, [])
+
+    if max_msg_length is not None and max_msg_length > 0:
+        msg_len = len(commit_msg.partition("\n")[0].strip())
+        if msg_len > max_msg_length:
+            raise CommitMessageLengthExceededError(
+                f"commit validation: failed!\n"
+                f"commit message length exceeds the limit.\n"
+                f'commit "{commit_hash}": "{commit_msg}"\n'
+                f"message length limit: {max_msg_length} (actual: {msg_len})"
+            )
+
+    return ValidationResult(
+        bool(pattern.match(commit_msg)),
+        [f"pattern: {pattern.pattern}"],
+    )
+
+
+def _time(validate: Callable[[str], ValidationResult], corpus: Iterable[str]) -> float:
+    start = time.perf_counter()
+    for commit_msg in corpus:
+        try:
+            validate(commit_msg)
+        except CommitMessageLengthExceededError:
+            pass
+    return time.perf_counter() - start
+
+
+def benchmark_validation(count: int = 1_000_000) -> None:
+    """Compare the validation of each message to the baseline implementation."""
+    cz = ConventionalCommitsCz(BaseConfig())
+    allowed_prefixes = ["Merge", "Revert", "Pull request", "fixup!", "squash!"]
+    print(f"Generating {count:,} commit messages...")
+    corpus = generate_corpus(count)
+
+    pattern = cz.compiled_schema_pattern
+    validator = cz.commit_message_validator(
+        allow_abort=False, allowed_prefixes=allowed_prefixes, max_msg_length=72
+    )
+    timings = {
+        "baseline": _time(
+            lambda commit_msg: baseline_validate_commit_message(
+                commit_msg=commit_msg,
+                pattern=pattern,
+                allow_abort=False,
+                allowed_prefixes=allowed_prefixes,
+                max_msg_length=72,
+                commit_hash="",
+            ),
+            corpus,
+        ),
+        "validate_commit_message": _time(
+            lambda commit_msg: cz.validate_commit_message(
+                commit_msg=commit_msg,
+                pattern=pattern,
+                allow_abort=False,
+                allowed_prefixes=allowed_prefixes,
+                max_msg_length=72,
+                commit_hash="",
+            ),
+            corpus,
+        ),
+        "commit_message_validator": _time(validator, corpus),
+    }
+    for name, seconds in timings.items():
+        print(
+            f"{name:<26} {seconds:8.3f}s  {seconds / count * 1_000_000:8.3f} µs/message"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_validation(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
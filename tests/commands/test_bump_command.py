@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import json
 import re
 from pathlib import Path
 from textwrap import dedent
@@ -19,6 +20,7 @@ from commitizen.exceptions import (
     DryRunExit,
     ExitCode,
     ExpectedExit,
+    InvalidConfigurationError,
     InvalidManualVersion,
     NoCommitsFoundError,
     NoneIncrementExit,
@@ -26,6 +28,7 @@ from commitizen.exceptions import (
     NotAGitProjectError,
     NotAllowed,
     NoVersionSpecifiedError,
+    RunHookError,
 )
 
 if TYPE_CHECKING:
@@ -830,6 +833,10 @@ def test_bump_with_pre_bump_hooks(
             call(
                 [pre_bump_hook],
                 _env_prefix="CZ_PRE_",
+                _jobs=None,
+                _timeout=None,
+                _total_timeout=None,
+                _timings=[],
                 is_initial=True,
                 current_version="0.1.0",
                 current_tag_version="0.1.0",
@@ -842,6 +849,10 @@ def test_bump_with_pre_bump_hooks(
             call(
                 [post_bump_hook],
                 _env_prefix="CZ_POST_",
+                _jobs=None,
+                _timeout=None,
+                _total_timeout=None,
+                _timings=[],
                 was_initial=True,
                 previous_version="0.1.0",
                 previous_tag_version="0.1.0",
@@ -877,6 +888,123 @@ def test_bump_with_hooks_and_increment(
     assert git.tag_exist("0.2.0") is True
 
 
+def test_bump_with_hook_groups(
+    mocker: MockFixture, tmp_commitizen_project, util: UtilFixture
+):
+    tmp_commitizen_cfg_file = tmp_commitizen_project / "pyproject.toml"
+    with tmp_commitizen_cfg_file.open("a", encoding="utf-8") as f:
+        f.write(
+            'post_bump_hooks = ["make dist", ["make sbom", "make docs"]]\n'
+            "hook_jobs = 2\n"
+        )
+    run_mock = mocker.patch.object(hooks, "run")
+
+    util.create_file_and_commit("feat: new file")
+    util.run_cli("bump", "--yes")
+
+    [(args, kwargs)] = run_mock.call_args_list
+    assert args == (["make dist", ["make sbom", "make docs"]],)
+    assert kwargs["_jobs"] == 2
+
+
+@pytest.mark.parametrize("hook_jobs", ["0", "-1", '"2"'])
+def test_bump_with_invalid_hook_jobs(
+    tmp_commitizen_project, util: UtilFixture, hook_jobs: str
+):
+    tmp_commitizen_cfg_file = tmp_commitizen_project / "pyproject.toml"
+    with tmp_commitizen_cfg_file.open("a", encoding="utf-8") as f:
+        f.write(f"hook_jobs = {hook_jobs}\n")
+
+    util.create_file_and_commit("feat: new file")
+    with pytest.raises(InvalidConfigurationError, match="hook_jobs"):
+        util.run_cli("bump", "--yes")
+
+
+@pytest.mark.parametrize(
+    ("hook_timeout", "timeouts"),
+    [
+        ("30", (30, None)),
+        ("{ per_hook = 30, total = 90.5 }", (30, 90.5)),
+        ("{ total = 90 }", (None, 90)),
+    ],
+)
+def test_bump_with_hook_timeout(
+    mocker: MockFixture,
+    tmp_commitizen_project,
+    util: UtilFixture,
+    hook_timeout: str,
+    timeouts: tuple[float | None, float | None],
+):
+    tmp_commitizen_cfg_file = tmp_commitizen_project / "pyproject.toml"
+    with tmp_commitizen_cfg_file.open("a", encoding="utf-8") as f:
+        f.write(f'post_bump_hooks = ["make dist"]\nhook_timeout = {hook_timeout}\n')
+    run_mock = mocker.patch.object(hooks, "run")
+
+    util.create_file_and_commit("feat: new file")
+    util.run_cli("bump", "--yes")
+
+    [(_, kwargs)] = run_mock.call_args_list
+    assert (kwargs["_timeout"], kwargs["_total_timeout"]) == timeouts
+
+
+@pytest.mark.parametrize(
+    "hook_timeout", ["0", '"30"', "true", "{ per_hook = -1 }", "{ each = 30 }"]
+)
+def test_bump_with_invalid_hook_timeout(
+    tmp_commitizen_project, util: UtilFixture, hook_timeout: str
+):
+    tmp_commitizen_cfg_file = tmp_commitizen_project / "pyproject.toml"
+    with tmp_commitizen_cfg_file.open("a", encoding="utf-8") as f:
+        f.write(f"hook_timeout = {hook_timeout}\n")
+
+    util.create_file_and_commit("feat: new file")
+    with pytest.raises(InvalidConfigurationError, match="hook_timeout"):
+        util.run_cli("bump", "--yes")
+
+
+def test_bump_reports_hook_timings(
+    capsys: pytest.CaptureFixture[str], tmp_commitizen_project, util: UtilFixture
+):
+    pre_bump_hook = 'python -c "pass"'
+    post_bump_hook = (
+        "python -c \"import os; open('timings.json', 'w')"
+        ".write(os.environ['CZ_POST_HOOK_TIMINGS'])\""
+    )
+    tmp_commitizen_cfg_file = tmp_commitizen_project / "pyproject.toml"
+    with tmp_commitizen_cfg_file.open("a", encoding="utf-8") as f:
+        f.write(
+            f"pre_bump_hooks = [{json.dumps(pre_bump_hook)}]\n"
+            f"post_bump_hooks = [{json.dumps(post_bump_hook)}]\n"
+        )
+
+    util.create_file_and_commit("feat: new file")
+    util.run_cli("bump", "--yes")
+
+    # The post-bump hooks only get the timings of the post-bump hooks run before them
+    assert json.loads((tmp_commitizen_project / "timings.json").read_text()) == []
+    out = capsys.readouterr().out
+    assert f"pre-bump hook timings:\n  {pre_bump_hook}: " in out
+    assert f"post-bump hook timings:\n  {post_bump_hook}: " in out
+
+
+def test_bump_reports_hook_timings_when_a_hook_fails(
+    capsys: pytest.CaptureFixture[str], tmp_commitizen_project, util: UtilFixture
+):
+    pre_bump_hooks = ['python -c "pass"', 'python -c "raise SystemExit(1)"']
+    tmp_commitizen_cfg_file = tmp_commitizen_project / "pyproject.toml"
+    with tmp_commitizen_cfg_file.open("a", encoding="utf-8") as f:
+        f.write(f"pre_bump_hooks = {json.dumps(pre_bump_hooks)}\n")
+
+    util.create_file_and_commit("feat: new file")
+    with pytest.raises(RunHookError):
+        util.run_cli("bump", "--yes")
+
+    out = capsys.readouterr().out
+    assert "pre-bump hook timings:" in out
+    for hook in pre_bump_hooks:
+        assert f"  {hook}: " in out
+
+
 @pytest.mark.usefixtures("tmp_git_project")
 def test_bump_use_version_provider(mocker: MockFixture, util: UtilFixture):
     mock = mocker.MagicMock(name="provider")
@@ -1561,3 +1689,21 @@ def test_bump_allow_no_commit_issue(
     util.run_cli(
         "bump", "--allow-no-commit", "--prerelease", "rc"
     )  # Should not fail when changelog generation runs with no new commits
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_bump_with_paths(util: UtilFixture):
+    Path("api").mkdir()
+    util.create_file_and_commit("fix: api fix", filename="api/main.py")
+    util.create_file_and_commit("feat!: web feature", filename="web.py")
+
+    util.run_cli("bump", "--yes", "--changelog", "--path", "api")
+
+    assert git.tag_exist("0.1.1")
+    changelog = Path("CHANGELOG.md").read_text(encoding="utf-8")
+    assert "api fix" in changelog
+    assert "web feature" not in changelog
+
+    util.create_file_and_commit("feat: web feature", filename="web2.py")
+    with pytest.raises(NoCommitsFoundError):
+        util.run_cli("bump", "--yes", "--path", "api")
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+import pytest
+
+from commitizen import cmd, git, hooks
+from commitizen.exceptions import (
+    DryRunExit,
+    InvalidConfigurationError,
+    NoneIncrementExit,
+    NotAllowed,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockFixture
+
+    from tests.utils import UtilFixture
+
+PACKAGES_CONFIG = """\
+[tool.commitizen]
+
+[[tool.commitizen.packages]]
+name = "api"
+path = "services/api"
+tag_format = "api-v$version"
+version_provider = "pep621"
+
+[[tool.commitizen.packages]]
+name = "web"
+path = "web"
+tag_format = "web-v$version"
+version_provider = "pep621"
+version_files = ["src/version.txt"]
+"""
+
+
+def _read_version(directory: str) -> str:
+    return Path(directory, "pyproject.toml").read_text().split('version = "')[1][:5]
+
+
+def _commit_file(util: UtilFixture, message: str, filename: str) -> None:
+    Path(filename).parent.mkdir(parents=True, exist_ok=True)
+    Path(filename).write_text(message)
+    util.create_file_and_commit(message, filename=filename)
+
+
+@pytest.fixture
+def packages_project(tmp_git_project: Path, util: UtilFixture) -> Path:
+    (tmp_git_project / "pyproject.toml").write_text(PACKAGES_CONFIG)
+    for directory in ("services/api", "web"):
+        (tmp_git_project / directory).mkdir(parents=True)
+        (tmp_git_project / directory / "pyproject.toml").write_text(
+            f'[project]\nname = "{directory}"\nversion = "1.0.0"\n'
+        )
+    (tmp_git_project / "web" / "src").mkdir()
+    (tmp_git_project / "web" / "src" / "version.txt").write_text("1.0.0\n")
+    util.create_file_and_commit("feat: initial commit")
+    cmd.run(["git", "tag", "api-v1.0.0"])
+    cmd.run(["git", "tag", "web-v1.0.0"])
+    return tmp_git_project
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages(util: UtilFixture, capsys: pytest.CaptureFixture):
+    _commit_file(util, "feat: api feature", "services/api/main.py")
+    _commit_file(util, "fix: web fix", "web/src/index.ts")
+    _commit_file(util, "feat!: root change", "README.md")
+
+    util.run_cli("bump", "--yes", "--changelog")
+
+    assert _read_version("services/api") == "1.1.0"
+    assert _read_version("web") == "1.0.1"
+    assert Path("web/src/version.txt").read_text() == "1.0.1\n"
+    assert git.tag_exist("api-v1.1.0")
+    assert git.tag_exist("web-v1.0.1")
+    assert git.get_commits(start="api-v1.0.0", end="api-v1.1.0")[0].message == (
+        "bump: api-v1.1.0, web-v1.0.1\n\n- api: 1.0.0 → 1.1.0\n- web: 1.0.0 → 1.0.1"
+    )
+    assert git.get_tag_names().count("api-v1.1.0") == 1
+    # A single bump commit for all the packages
+    assert len(git.get_commits(start="api-v1.0.0")) == 4
+
+    api_changelog = Path("services/api/CHANGELOG.md").read_text()
+    assert "## api-v1.1.0" in api_changelog
+    assert "api feature" in api_changelog
+    assert "web fix" not in api_changelog
+    assert "root change" not in api_changelog
+    assert "web fix" in Path("web/CHANGELOG.md").read_text()
+
+    output = capsys.readouterr().out
+    assert "api: version 1.0.0 → 1.1.0\ntag to create: api-v1.1.0\n" in output
+    assert "increment detected: PATCH" in output
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_only_changed_ones(util: UtilFixture):
+    _commit_file(util, "feat: web feature", "web/src/index.ts")
+
+    util.run_cli("bump", "--yes")
+
+    assert _read_version("services/api") == "1.0.0"
+    assert _read_version("web") == "1.1.0"
+    assert not git.tag_exist("api-v1.0.1")
+
+    with pytest.raises(NoneIncrementExit):
+        util.run_cli("bump", "--yes")
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_since_their_own_tag(util: UtilFixture):
+    _commit_file(util, "feat: web feature", "web/src/index.ts")
+    util.run_cli("bump", "--yes")
+    _commit_file(util, "fix: api fix", "services/api/main.py")
+
+    util.run_cli("bump", "--yes")
+
+    assert _read_version("services/api") == "1.0.1"
+    assert _read_version("web") == "1.1.0"
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_dry_run(util: UtilFixture, capsys: pytest.CaptureFixture):
+    _commit_file(util, "feat: api feature", "services/api/main.py")
+
+    with pytest.raises(DryRunExit):
+        util.run_cli("bump", "--yes", "--dry-run", "--changelog")
+
+    assert _read_version("services/api") == "1.0.0"
+    assert not git.tag_exist("api-v1.1.0")
+    assert "## api-v1.1.0" in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_manual_version_not_allowed(util: UtilFixture):
+    with pytest.raises(NotAllowed):
+        util.run_cli("bump", "--yes", "2.0.0")
+
+
+@pytest.mark.parametrize(
+    ("package", "error"),
+    [
+        ('name = "x"\npath = "x"\n', "needs a name, a path and a tag_format"),
+        (
+            'name = "x"\npath = "x"\ntag_format = "x$version"\n',
+            "needs a version_provider",
+        ),
+        (
+            'name = "x"\npath = ".."\ntag_format = "x$version"\n'
+            'version_provider = "pep621"\n',
+            "outside of the git project",
+        ),
+        (
+            'name = "x"\npath = "x"\ntag_format = "api-v$version"\n'
+            'version_provider = "pep621"\n',
+            "has the tag_format of another package",
+        ),
+    ],
+)
+def test_bump_packages_invalid_configuration(
+    packages_project: Path, util: UtilFixture, package: str, error: str
+):
+    with (packages_project / "pyproject.toml").open("a") as f:
+        f.write(dedent(f"\n[[tool.commitizen.packages]]\n{package}"))
+
+    with pytest.raises(InvalidConfigurationError, match=error):
+        util.run_cli("bump", "--yes")
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_bump_message(util: UtilFixture):
+    Path("pyproject.toml").write_text(
+        PACKAGES_CONFIG.replace(
+            "[tool.commitizen]\n",
+            '[tool.commitizen]\nbump_message = "release $new_version [skip-ci]"\n',
+        )
+    )
+    _commit_file(util, "feat: api feature", "services/api/main.py")
+    _commit_file(util, "fix: web fix", "web/src/index.ts")
+
+    util.run_cli("bump", "--yes")
+
+    assert cmd.run(["git", "log", "-1", "--format=%B"]).out == (
+        "release 1.1.0 [skip-ci]\nrelease 1.0.1 [skip-ci]\n\n"
+    )
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_encoding(util: UtilFixture):
+    Path("pyproject.toml").write_text(PACKAGES_CONFIG + 'encoding = "latin-1"\n')
+    Path("web/src/version.txt").write_text("# Versión\n1.0.0\n", encoding="latin-1")
+    _commit_file(util, "fix: web fix", "web/src/index.ts")
+
+    util.run_cli("bump", "--yes")
+
+    assert Path("web/src/version.txt").read_text(encoding="latin-1") == (
+        "# Versión\n1.0.1\n"
+    )
+
+
+@pytest.mark.usefixtures("packages_project")
+def test_bump_packages_hooks_share_their_total_timeout(
+    util: UtilFixture, mocker: MockFixture
+):
+    Path("pyproject.toml").write_text(
+        PACKAGES_CONFIG.replace(
+            "[tool.commitizen]\n",
+            "[tool.commitizen]\n"
+            'pre_bump_hooks = ["true"]\n'
+            'post_bump_hooks = ["true"]\n'
+            "hook_timeout = { total = 60 }\n",
+        )
+    )
+    _commit_file(util, "feat: api feature", "services/api/main.py")
+    _commit_file(util, "fix: web fix", "web/src/index.ts")
+    pre_deadline, post_deadline = time.monotonic() + 60, time.monotonic() + 61
+    mocker.patch.object(hooks, "deadline", side_effect=[pre_deadline, post_deadline])
+    run_hooks = mocker.spy(hooks, "run")
+
+    util.run_cli("bump", "--yes")
+
+    assert [call.kwargs["_deadline"] for call in run_hooks.call_args_list] == [
+        pre_deadline,
+        pre_deadline,
+        post_deadline,
+        post_deadline,
+    ]
@@ -8,8 +8,9 @@ from typing import TYPE_CHECKING
 import pytest
 from jinja2 import FileSystemLoader
 
-from commitizen import git
+from commitizen import git, profiling
 from commitizen.commands.changelog import Changelog
+from commitizen.config import read_cfg
 from commitizen.exceptions import (
     DryRunExit,
     InvalidCommandArgumentError,
@@ -18,6 +19,7 @@ from commitizen.exceptions import (
     NotAGitProjectError,
     NotAllowed,
 )
+from tests.benchmarks.repo_generator import RepoSpec, generate_repo
 
 if TYPE_CHECKING:
     from pytest_mock import MockFixture
@@ -1124,7 +1126,7 @@ def test_empty_commit_list(mocker: MockFixture, util: UtilFixture):
     util.create_file_and_commit("feat: a new world")
 
     # test changelog properly handles when no commits are found for the revision
-    mocker.patch("commitizen.git.get_commits", return_value=[])
+    mocker.patch("commitizen.git.get_commit_batch", return_value=[])
     with pytest.raises(NoCommitsFoundError):
         util.run_cli("changelog")
 
@@ -1693,3 +1695,44 @@ def test_changelog_template_incremental_variable(
     util.run_cli("changelog", "--file-name", target, "--incremental")
     out = Path(target).read_text(encoding="utf-8")
     file_regression.check(out, extension=".incremental.md")
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_changelog_with_paths(util: UtilFixture, capsys: pytest.CaptureFixture):
+    Path("api").mkdir()
+    util.create_file_and_commit("feat: api feature", filename="api/main.py")
+    util.create_file_and_commit("feat: web feature", filename="web.py")
+    util.create_file_and_commit("fix: api fix", filename="api/fix.py")
+
+    with pytest.raises(DryRunExit):
+        util.run_cli("changelog", "--dry-run", "--path", "api")
+
+    out = capsys.readouterr().out
+    assert "api feature" in out
+    assert "api fix" in out
+    assert "web feature" not in out
+
+
+# Peak of the memory allocated by `cz changelog`, per commit of the history
+CHANGELOG_MEMORY_BUDGET_PER_COMMIT = 3 * 1024
+
+
+def test_changelog_memory_per_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+):
+    spec = RepoSpec(commits=2000, tags=20, untagged_commits=10)
+    generate_repo(tmp_path, spec)
+    monkeypatch.chdir(tmp_path)
+
+    profiler = profiling.start(memory=True)
+    try:
+        Changelog(read_cfg(), {"unreleased_version": None})()
+    finally:
+        profiling.stop()
+
+    assert profiler.memory_peak is not None
+    assert profiler.memory_peak < spec.commits * CHANGELOG_MEMORY_BUDGET_PER_COMMIT, (
+        profiler.summary()
+    )
+    phases = {event.name for event in profiler.events if event.memory_peak}
+    assert phases >= {"log fetch", "log parse", "tree build", "render", "write"}
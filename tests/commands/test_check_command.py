@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import json
+import re
+import sys
 from io import StringIO
 from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree
 
 import pytest
 
 from commitizen import cmd, commands, git
 from commitizen.cz import registry
-from commitizen.cz.base import BaseCommitizen
+from commitizen.cz.base import (
+    BaseCommitizen,
+    CommitMessageValidator,
+    ValidationResult,
+)
 from commitizen.exceptions import (
     CommitMessageLengthExceededError,
     InvalidCommandArgumentError,
@@ -16,7 +24,7 @@ from commitizen.exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 
     from pytest_mock import MockFixture, MockType
 
@@ -538,3 +546,427 @@ def test_check_command_with_custom_validator_failed(
         util.run_cli(
             "--name", "cz_custom_validator", "check", "--commit-msg-file", "some_file"
         )
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_caches_valid_commits(
+    config: BaseConfig, mocker: MockFixture, util: UtilFixture
+):
+    util.create_file_and_commit("feat: first")
+    util.create_file_and_commit("fix: second")
+    commands.Check(config=config, arguments={"rev_range": "HEAD~1..HEAD"})()
+    validate_spy = mocker.spy(CommitMessageValidator, "__call__")
+
+    commands.Check(config=config, arguments={"rev_range": "HEAD~1..HEAD"})()
+    validate_spy.assert_not_called()
+
+    util.create_file_and_commit("docs: third")
+    commands.Check(config=config, arguments={"rev_range": "HEAD~2..HEAD"})()
+    validate_spy.assert_called_once()
+    assert validate_spy.call_args.args[1] == "docs: third"
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"no_cache": True},
+        {"message_length_limit": 50},
+        {"allowed_prefixes": ["WIP"]},
+    ],
+)
+def test_check_cache_is_not_used(
+    config: BaseConfig, mocker: MockFixture, util: UtilFixture, arguments
+):
+    util.create_file_and_commit("feat: first")
+    util.create_file_and_commit("fix: second")
+    commands.Check(config=config, arguments={"rev_range": "HEAD~1..HEAD"})()
+    validate_spy = mocker.spy(CommitMessageValidator, "__call__")
+
+    commands.Check(
+        config=config, arguments={"rev_range": "HEAD~1..HEAD", **arguments}
+    )()
+
+    validate_spy.assert_called_once()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_cache_is_not_used_after_a_cz_upgrade(
+    config: BaseConfig, mocker: MockFixture, util: UtilFixture, tmp_path
+):
+    util.create_file_and_commit("feat: first")
+    util.create_file_and_commit("fix: second")
+    commands.Check(config=config, arguments={"rev_range": "HEAD~1..HEAD"})()
+    validate_spy = mocker.spy(CommitMessageValidator, "__call__")
+    upgraded_module = tmp_path / "upgraded.py"
+    upgraded_module.write_text("")
+    cz_module = sys.modules[registry["cz_conventional_commits"].__module__]
+    mocker.patch.object(cz_module, "__file__", str(upgraded_module))
+
+    commands.Check(config=config, arguments={"rev_range": "HEAD~1..HEAD"})()
+
+    validate_spy.assert_called_once()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_does_not_cache_invalid_commits(config: BaseConfig, util: UtilFixture):
+    util.create_file_and_commit("feat: first")
+    util.create_file_and_commit("not conventional")
+
+    for _ in range(2):
+        with pytest.raises(InvalidCommitMessageError, match="not conventional"):
+            commands.Check(config=config, arguments={"rev_range": "HEAD~1..HEAD"})()
+
+
+def test_check_in_processes(
+    config: BaseConfig, mocker: MockFixture, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("commitizen.commands.check.PARALLEL_THRESHOLD", 2)
+    mocker.patch(
+        "commitizen.git.get_commits",
+        return_value=_build_fake_git_commits(
+            [*COMMIT_LOG, "First commit does not follow rule", *COMMIT_LOG]
+        ),
+    )
+
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        commands.Check(
+            config=config, arguments={"rev_range": "HEAD~10..master", "jobs": 3}
+        )()
+    assert excinfo.value.message.count('commit "test_rev"') == 1
+    assert "First commit does not follow rule" in excinfo.value.message
+
+
+def test_check_in_processes_fail_fast(
+    config: BaseConfig, mocker: MockFixture, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("commitizen.commands.check.PARALLEL_THRESHOLD", 2)
+    monkeypatch.setattr("commitizen.commands.check.PARALLEL_CHUNK_SIZE", 2)
+    read: list[git.GitCommit] = []
+
+    def iter_commits(*args: object) -> Iterator[git.GitCommit]:
+        for commit in _build_fake_git_commits(
+            ["First commit does not follow rule", *COMMIT_LOG * 20]
+        ):
+            read.append(commit)
+            yield commit
+
+    mocker.patch("commitizen.git.iter_commits", side_effect=iter_commits)
+
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        commands.Check(
+            config=config,
+            arguments={
+                "rev_range": "HEAD~10..master",
+                "jobs": 2,
+                "fail_fast": True,
+                "no_cache": True,
+            },
+        )()
+    assert "validation stopped after 1 invalid commit(s)" in excinfo.value.message
+    # The log is read as the validation goes: at most 2 chunks per process
+    # ahead of the results
+    assert len(read) <= 2 * 2 * 2 + 1
+
+
+def _rev_parse(rev: str) -> str:
+    return cmd.run(["git", "rev-parse", rev]).out.strip()
+
+
+NULL_SHA = "0" * 40
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_ref_updates_grouped_by_ref(mocker: MockFixture, util: UtilFixture):
+    util.create_file_and_commit("feat: base")
+    base = _rev_parse("HEAD")
+    util.create_branch("first")
+    util.create_branch("second")
+    util.switch_branch("first")
+    util.create_file_and_commit("bad first commit")
+    util.create_file_and_commit("fix: good")
+    first = _rev_parse("HEAD")
+    util.switch_branch("second")
+    util.create_file_and_commit("bad second commit")
+    second = _rev_parse("HEAD")
+    mocker.patch(
+        "sys.stdin",
+        StringIO(
+            f"{base} {first} refs/heads/first\n"
+            f"{base} {first} refs/heads/copy\n"
+            f"{base} {second} refs/heads/second\n"
+            f"{base} {NULL_SHA} refs/heads/deleted\n"
+        ),
+    )
+    validate_spy = mocker.spy(CommitMessageValidator, "__call__")
+
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        util.run_cli("check", "--ref-updates", "--no-cache")
+
+    assert validate_spy.call_count == 3
+    message = excinfo.value.message
+    assert message.count("bad first commit") == 2
+    assert message.count("bad second commit") == 1
+    assert "fix: good" not in message
+    assert message.index('ref "refs/heads/first"') < message.index(
+        'ref "refs/heads/second"'
+    )
+    assert "refs/heads/deleted" not in message
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_ref_updates_new_ref(mocker: MockFixture, util: UtilFixture, capsys):
+    util.create_file_and_commit("bad but already known commit")
+    util.switch_branch("--detach")
+    util.create_file_and_commit("feat: new")
+    mocker.patch(
+        "sys.stdin", StringIO(f"{NULL_SHA} {_rev_parse('HEAD')} refs/heads/new\n")
+    )
+
+    util.run_cli("check", "--ref-updates")
+
+    assert "Commit validation: successful!" in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_ref_updates_pre_push(mocker: MockFixture, util: UtilFixture):
+    util.create_file_and_commit("feat: base")
+    base = _rev_parse("HEAD")
+    util.create_file_and_commit("bad pushed commit")
+    mocker.patch(
+        "sys.stdin",
+        StringIO(f"refs/heads/main {_rev_parse('HEAD')} refs/heads/remote {base}\n"),
+    )
+
+    with pytest.raises(
+        InvalidCommitMessageError,
+        match=r'ref "refs/heads/remote":\n[\s\S]*bad pushed commit',
+    ):
+        util.run_cli("check", "--ref-updates")
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_ref_updates_invalid_line(config: BaseConfig, mocker: MockFixture):
+    mocker.patch("sys.stdin", StringIO("invalid-ref-update\n"))
+
+    with pytest.raises(InvalidCommandArgumentError, match="invalid-ref-update"):
+        commands.Check(config=config, arguments={"ref_updates": True})
+
+
+@pytest.fixture
+def commits_to_report(tmp_commitizen_project, util: UtilFixture) -> list[str]:
+    util.create_file_and_commit("feat: valid commit")
+    util.create_file_and_commit("invalid commit")
+    util.create_file_and_commit("fix: a commit too long for the limit")
+    return [_rev_parse(f"HEAD~{i}") for i in range(3)]
+
+
+def test_check_output_json(commits_to_report: list[str], util: UtilFixture, capsys):
+    with pytest.raises(InvalidCommitMessageError, match="2 of 3 commits are invalid"):
+        util.run_cli("check", "--rev-range", "HEAD", "--output", "json", "-l", "20")
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["sha"] for record in records] == commits_to_report
+    assert [record["valid"] for record in records] == [False, False, True]
+    assert "commit message length exceeds the limit" in records[0]["errors"][0]
+    assert records[1]["errors"][0].startswith("pattern: ")
+    assert records[2]["errors"] == []
+    assert all(isinstance(record["elapsed_us"], int) for record in records)
+
+
+def test_check_output_junit(commits_to_report: list[str], util: UtilFixture, capsys):
+    with pytest.raises(InvalidCommitMessageError):
+        util.run_cli("check", "--rev-range", "HEAD", "--output", "junit")
+
+    testsuite = ElementTree.fromstring(capsys.readouterr().out).find("testsuite")
+    assert testsuite is not None
+    testcases = testsuite.findall("testcase")
+    assert [testcase.get("name") for testcase in testcases] == commits_to_report
+    failures = [testcase.find("failure") for testcase in testcases]
+    assert [failure is not None for failure in failures] == [False, True, False]
+    assert "invalid commit" in (getattr(failures[1], "text", None) or "")
+
+
+def test_check_output_sarif(commits_to_report: list[str], util: UtilFixture, capsys):
+    with pytest.raises(InvalidCommitMessageError):
+        util.run_cli("check", "--rev-range", "HEAD", "--output", "sarif")
+
+    sarif = json.loads(capsys.readouterr().out)
+    assert sarif["version"] == "2.1.0"
+    results = sarif["runs"][0]["results"]
+    assert [result["properties"]["sha"] for result in results] == commits_to_report
+    assert [result["kind"] for result in results] == ["pass", "fail", "pass"]
+
+
+def test_check_output_valid_message(util: UtilFixture, capsys):
+    util.run_cli("check", "--message", "feat: valid", "--output", "json")
+
+    out = capsys.readouterr().out
+    assert json.loads(out)["valid"] is True
+    assert "successful" not in out
+
+
+@pytest.fixture
+def invalid_commits(tmp_commitizen_project, util: UtilFixture) -> None:
+    util.create_file_and_commit("feat: valid commit")
+    for i in range(3):
+        util.create_file_and_commit(f"invalid commit {i}")
+
+
+@pytest.mark.usefixtures("invalid_commits")
+def test_check_fail_fast(mocker: MockFixture, util: UtilFixture):
+    validate_spy = mocker.spy(CommitMessageValidator, "__call__")
+    iter_commits_spy = mocker.spy(git, "iter_commits")
+
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        util.run_cli("check", "--rev-range", "HEAD", "--fail-fast")
+
+    message = excinfo.value.message
+    assert "invalid commit 2" in message
+    assert "invalid commit 1" not in message
+    assert "validation stopped after 1 invalid commit(s)" in message
+    validate_spy.assert_called_once()
+    iter_commits_spy.assert_called_once_with(None, "HEAD")
+
+
+@pytest.mark.usefixtures("invalid_commits")
+def test_check_max_errors(util: UtilFixture):
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        util.run_cli("check", "--rev-range", "HEAD", "--max-errors", "2")
+
+    message = excinfo.value.message
+    assert "invalid commit 2" in message
+    assert "invalid commit 1" in message
+    assert "invalid commit 0" not in message
+
+
+@pytest.mark.usefixtures("invalid_commits")
+def test_check_max_errors_not_reached(util: UtilFixture):
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        util.run_cli("check", "--rev-range", "HEAD", "--max-errors", "5")
+
+    assert "invalid commit 0" in excinfo.value.message
+    assert "validation stopped" not in excinfo.value.message
+
+
+@pytest.mark.usefixtures("invalid_commits")
+def test_check_max_errors_reached_by_the_last_commit(util: UtilFixture):
+    with pytest.raises(InvalidCommitMessageError) as excinfo:
+        util.run_cli("check", "--rev-range", "HEAD~3..HEAD", "--max-errors", "3")
+
+    assert "invalid commit 0" in excinfo.value.message
+    assert "validation stopped" not in excinfo.value.message
+
+
+@pytest.mark.usefixtures("invalid_commits")
+def test_check_fail_fast_output(util: UtilFixture, capsys):
+    with pytest.raises(InvalidCommitMessageError, match="1 of 1 commits are invalid"):
+        util.run_cli("check", "--rev-range", "HEAD", "--fail-fast", "--output", "json")
+
+    assert len(capsys.readouterr().out.splitlines()) == 1
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_check_fail_fast_empty_range(config: BaseConfig, util: UtilFixture):
+    util.create_file_and_commit("feat: valid commit")
+
+    with pytest.raises(NoCommitsFoundError):
+        commands.Check(
+            config=config, arguments={"rev_range": "HEAD..HEAD", "fail_fast": True}
+        )()
+
+
+def test_check_max_errors_must_be_positive(config: BaseConfig):
+    with pytest.raises(InvalidCommandArgumentError, match="--max-errors"):
+        commands.Check(
+            config=config, arguments={"message": "feat: valid", "max_errors": 0}
+        )
+
+
+class TicketValidator(CommitMessageValidator):
+    def __call__(self, commit_msg: str, commit_hash: str = "") -> ValidationResult:
+        result = super().__call__(commit_msg, commit_hash)
+        if result.is_valid and "ABC-" not in commit_msg:
+            return ValidationResult(False, ["no ticket"])
+        return result
+
+
+class TicketValidationCz(ValidationCz):
+    def schema_pattern(self) -> str:
+        return r"^\w+: .*"
+
+    def commit_message_validator(self, **kwargs) -> CommitMessageValidator:
+        return TicketValidator(self.compiled_schema_pattern, **kwargs)
+
+
+class LegacyValidationCz(ValidationCz):
+    def validate_commit_message(self, *, commit_msg: str, **kwargs) -> ValidationResult:
+        return ValidationResult("legacy" in commit_msg, ["not legacy"])
+
+
+@pytest.mark.parametrize(
+    ("cz_class", "message", "error"),
+    [
+        (TicketValidationCz, "feat: no ticket here", "no ticket"),
+        (LegacyValidationCz, "ABC-123: valid for ValidationCz", "not legacy"),
+    ],
+)
+def test_check_command_with_overridden_validation(
+    config: BaseConfig, mocker: MockFixture, cz_class, message, error
+):
+    mocker.patch.dict("commitizen.cz.registry", {**registry, "cz_test": cz_class})
+    config.settings["name"] = "cz_test"
+
+    with pytest.raises(InvalidCommitMessageError, match=error):
+        commands.Check(config=config, arguments={"message": message})()
+
+
+def test_commit_message_validator(config: BaseConfig):
+    cz = ValidationCz(config)
+    validator = cz.commit_message_validator(
+        allow_abort=False, allowed_prefixes=["WIP", "fixup!"], max_msg_length=20
+    )
+
+    assert cz.compiled_schema_pattern is cz.compiled_schema_pattern
+    assert validator("ABC-1: short").is_valid
+    # Only the first line is subject to the length limit
+    validator("ABC-1: short\n\n" + "long body " * 10)
+    assert validator("fixup! anything goes").is_valid
+    assert validator("") == ValidationResult(False, ["commit message is empty"])
+    assert validator("not valid") == ValidationResult(
+        False, [f"pattern: {cz.schema_pattern()}"]
+    )
+    with pytest.raises(CommitMessageLengthExceededError, match="actual: 25"):
+        validator("ABC-1: a too long subject  \nbody", "sha")
+
+
+def test_validate_commit_message_reuses_validators(
+    config: BaseConfig, mocker: MockFixture
+):
+    cz = TicketValidationCz(config)
+    validator_spy = mocker.spy(cz, "commit_message_validator")
+    arguments: dict[str, Any] = {
+        "pattern": cz.compiled_schema_pattern,
+        "allow_abort": False,
+        "allowed_prefixes": ["WIP"],
+        "max_msg_length": None,
+        "commit_hash": "",
+    }
+
+    for _ in range(2):
+        assert not cz.validate_commit_message(commit_msg="feat: x", **arguments)[0]
+        assert cz.validate_commit_message(commit_msg="feat: ABC-1", **arguments)[0]
+    validator_spy.assert_called_once()
+
+    arguments["allowed_prefixes"].append("ABC")
+    assert cz.validate_commit_message(commit_msg="ABC-1 x", **arguments).is_valid
+    arguments["allowed_prefixes"].pop()
+    assert not cz.validate_commit_message(commit_msg="ABC-1 x", **arguments).is_valid
+    assert validator_spy.call_count == 2
+
+    other_pattern = re.compile(r"^\w+ .*")
+    result = cz.validate_commit_message(
+        commit_msg="feat x", **{**arguments, "pattern": other_pattern}
+    )
+    assert result == ValidationResult(True, [f"pattern: {other_pattern.pattern}"])
+    assert validator_spy.call_count == 2
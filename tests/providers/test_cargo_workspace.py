@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from commitizen.providers import cargo_workspace
+from commitizen.providers.cargo_workspace import WorkspaceMember
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockFixture
+
+WORKSPACE = {"members": ["crates/*", "tools/cli"], "exclude": ["crates/excluded"]}
+
+
+@pytest.fixture
+def workspace_dir(chdir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(cargo_workspace, "_members_cache", {})
+    for path, version in [
+        ("crates/a", "version.workspace = true"),
+        ("crates/b", 'version = "1.0.0"'),
+        ("crates/excluded", "version.workspace = true"),
+        ("tools/cli", "version = { workspace = true }"),
+    ]:
+        (chdir / path).mkdir(parents=True)
+        (chdir / path / "Cargo.toml").write_text(
+            f'[package]\nname = "{path.rsplit("/", 1)[-1]}"\n{version}\n'
+        )
+    # Not a crate
+    (chdir / "crates" / "README.md").write_text("")
+    return chdir
+
+
+@pytest.mark.usefixtures("workspace_dir")
+def test_get_members():
+    assert sorted(cargo_workspace.get_members(WORKSPACE, "utf-8")) == [
+        WorkspaceMember("a", os.path.join("crates", "a"), True),
+        WorkspaceMember("b", os.path.join("crates", "b"), False),
+        WorkspaceMember("cli", os.path.join("tools", "cli"), True),
+    ]
+
+
+@pytest.mark.usefixtures("workspace_dir")
+def test_get_members_parallel(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cargo_workspace, "PARALLEL_THRESHOLD", 0)
+
+    assert sorted(
+        cargo_workspace.get_members_inheriting_version(WORKSPACE, "utf-8")
+    ) == ["a", "cli"]
+
+
+def test_get_members_is_cached(workspace_dir: Path, mocker: MockFixture):
+    read_manifest = mocker.spy(cargo_workspace, "read_manifest")
+
+    cargo_workspace.get_members_inheriting_version(WORKSPACE, "utf-8")
+    assert read_manifest.call_count == 3
+    read_manifest.reset_mock()
+
+    cargo_workspace.get_members_inheriting_version(WORKSPACE, "utf-8")
+    read_manifest.assert_not_called()
+
+    (workspace_dir / "crates/b/Cargo.toml").write_text(
+        '[package]\nname = "b"\nversion.workspace = true\n'
+    )
+    assert sorted(
+        cargo_workspace.get_members_inheriting_version(WORKSPACE, "utf-8")
+    ) == ["a", "b", "cli"]
+    read_manifest.assert_called_once_with(
+        os.path.join("crates", "b", "Cargo.toml"), "utf-8"
+    )
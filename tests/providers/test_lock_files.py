@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import tomlkit
+from tomlkit.items import AoT
+
+from commitizen.providers.lock_files import set_json_versions, set_toml_package_versions
+from commitizen.providers.npm_provider import LOCK_VERSION_PATHS
+
+CARGO_LOCK = """\
+# This file is automatically @generated by Cargo.
+# It is not intended for manual editing.
+version = 3
+
+[[package]]
+name = "autocfg"
+version = "1.1.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+checksum = "d468802bab17cbc0cc575e9b053f41e72aa36bfa6b7f55e3529ffa43161b97fa"
+
+[[package]]
+name = "whatever"
+version = "0.1.0"
+dependencies = [
+ "autocfg",
+ "member",
+]
+
+[[package]]
+name = "member"
+version = "0.1.0"
+
+[[package]]
+name = "member"
+version = "2.0.0"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+"""
+
+UV_LOCK = """\
+version = 1
+requires-python = ">=3.13"
+
+[[package]]
+name = "commitizen"
+version = "4.2.1"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [
+    { name = "argcomplete" },
+]
+sdist = { url = "https://files.pythonhosted.org/c.tar.gz", size = 50000 }
+
+[[package]]
+name = "test-uv"
+version = "4.2.1"
+source = { virtual = "." }
+dependencies = [
+    { name = "commitizen" },
+]
+
+[package.optional-dependencies]
+dev = [
+    { name = "pytest" },
+]
+
+[package.metadata]
+requires-dist = [{ name = "commitizen", specifier = ">=4.2.1" }]
+"""
+
+NPM_LOCK = {
+    "name": "whatever",
+    "version": "0.1.0",
+    "lockfileVersion": 3,
+    "requires": True,
+    "packages": {
+        "": {
+            "name": "whatever",
+            "version": "0.1.0",
+            "dependencies": {"left-pad": "^1.3.0"},
+        },
+        "node_modules/left-pad": {
+            "version": "0.1.0",
+            "resolved": "https://registry.npmjs.org/left-pad/-/left-pad-1.3.0.tgz",
+            "license": "WTFPL",
+        },
+    },
+}
+
+
+def _set_toml_versions_with_tomlkit(
+    content: str, names: list[str], version: str, first_only: bool
+) -> str:
+    document = tomlkit.parse(content)
+    packages = document["package"]
+    assert isinstance(packages, AoT)
+    for package in packages:
+        if package["name"] in names:
+            package["version"] = version
+            if first_only:
+                break
+    return tomlkit.dumps(document)
+
+
+@pytest.mark.parametrize(
+    ("content", "names", "first_only"),
+    [
+        (CARGO_LOCK, ["whatever"], True),
+        (CARGO_LOCK, ["member"], True),
+        (CARGO_LOCK, ["member", "whatever"], False),
+        (CARGO_LOCK, ["missing"], False),
+        (UV_LOCK, ["test-uv"], True),
+        (UV_LOCK, ["commitizen"], True),
+    ],
+)
+def test_set_toml_package_versions_like_full_parse(
+    content: str, names: list[str], first_only: bool
+):
+    expected = _set_toml_versions_with_tomlkit(content, names, "42.1", first_only)
+
+    assert (
+        set_toml_package_versions(content, names, "42.1", first_only=first_only)
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '[[package]]\nversion = "0.1.0"\n',
+        '[[package]]\nname = "whatever"\n',
+        '[[package]]\nname = "whatever"\nversion = { workspace = true }\n',
+    ],
+)
+def test_set_toml_package_versions_unexpected_layout(content: str):
+    assert set_toml_package_versions(content, ["whatever"], "42.1") is None
+
+
+@pytest.mark.parametrize("indent", [2, 4, None])
+def test_set_json_versions_like_full_parse(indent: int | None):
+    content = json.dumps(NPM_LOCK, indent=indent) + "\n"
+    document = json.loads(content)
+    document["version"] = "42.1"
+    document["packages"][""]["version"] = "42.1"
+
+    assert set_json_versions(content, LOCK_VERSION_PATHS, "42.1") == (
+        json.dumps(document, indent=indent) + "\n"
+    )
+
+
+def test_set_json_versions_keeps_formatting():
+    content = '{"version":"0.1.0" , "packages":{"":{"version" : "0.1.0"}}}'
+
+    assert set_json_versions(content, LOCK_VERSION_PATHS, "42.1") == (
+        '{"version":"42.1" , "packages":{"":{"version" : "42.1"}}}'
+    )
+
+
+def test_set_json_versions_ignores_nested_and_escaped_keys():
+    content = json.dumps(
+        {
+            "name": 'with "version" and \\',
+            "dependencies": {"x": {"version": "0.1.0"}},
+            "list": [{"version": "0.1.0"}],
+            "version": "0.1.0",
+            "packages": {"": {"version": "0.1.0"}},
+        }
+    )
+
+    assert json.loads(set_json_versions(content, LOCK_VERSION_PATHS, "42.1") or "") == {
+        "name": 'with "version" and \\',
+        "dependencies": {"x": {"version": "0.1.0"}},
+        "list": [{"version": "0.1.0"}],
+        "version": "42.1",
+        "packages": {"": {"version": "42.1"}},
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"version": "0.1.0", "lockfileVersion": 1, "dependencies": {}}',
+        '{"version": "0.1.0", "packages": {"": {"version": 1}}}',
+    ],
+)
+def test_set_json_versions_missing_path(content: str):
+    assert set_json_versions(content, LOCK_VERSION_PATHS, "42.1") is None
@@ -156,3 +156,30 @@ def test_npm_provider_respects_configured_encoding_for_all_files(
     assert '"version": "42.1"' in pkg_text
     assert '"version": "42.1"' in pkg_lock_text
     assert '"version": "42.1"' in pkg_shrinkwrap_text
+
+
+def test_npm_provider_lock_file_keeps_formatting(config: BaseConfig, chdir: Path):
+    (chdir / NpmProvider.package_filename).write_text(NPM_PACKAGE_JSON)
+    pkg_lock = chdir / NpmProvider.lock_filename
+    pkg_lock.write_text(NPM_LOCKFILE_JSON.replace("  ", "\t"))
+
+    NpmProvider(config).set_version("42.1")
+
+    assert pkg_lock.read_text() == NPM_LOCKFILE_EXPECTED.replace("  ", "\t")
+
+
+def test_npm_provider_overridden_lock_version(config: BaseConfig, chdir: Path):
+    class CustomNpmProvider(NpmProvider):
+        def set_lock_version(self, document, version):
+            document["packages"]["someotherpackage"]["version"] = version
+            return super().set_lock_version(document, version)
+
+    (chdir / NpmProvider.package_filename).write_text(NPM_PACKAGE_JSON)
+    pkg_lock = chdir / NpmProvider.lock_filename
+    pkg_lock.write_text(NPM_LOCKFILE_JSON)
+
+    CustomNpmProvider(config).set_version("42.1")
+
+    assert pkg_lock.read_text() == NPM_LOCKFILE_EXPECTED.replace(
+        '"version": "0.1.0"', '"version": "42.1"'
+    )
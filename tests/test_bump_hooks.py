@@ -1,5 +1,7 @@
-import os
-from unittest.mock import call
+import json
+import re
+import time
+from unittest.mock import ANY, call
 
 import pytest
 from pytest_mock import MockFixture
@@ -19,8 +21,8 @@ def test_run(mocker: MockFixture):
 
     cmd_run_mock.assert_has_calls(
         [
-            call("pre_bump_hook", env=dict(os.environ)),
-            call("pre_bump_hook_1", env=dict(os.environ)),
+            call("pre_bump_hook", env={"CZ_HOOK_TIMINGS": "[]"}),
+            call("pre_bump_hook_1", env={"CZ_HOOK_TIMINGS": ANY}),
         ]
     )
 
@@ -37,9 +39,8 @@ def test_run_error(mocker: MockFixture):
 
 
 def test_format_env():
-    result = hooks._format_env("TEST_", {"foo": "bar", "bar": "baz"})
-    assert result["TEST_FOO"] == "bar"
-    assert result["TEST_BAR"] == "baz"
+    result = hooks._format_env("TEST_", {"foo": "bar", "bar": "baz", "none": None})
+    assert result == {"TEST_FOO": "bar", "TEST_BAR": "baz", "TEST_NONE": ""}
 
 
 def test_run_integration():
@@ -51,3 +52,129 @@ def test_run_integration_error():
     """Integration test that a failing hook raises RunHookError."""
     with pytest.raises(RunHookError):
         hooks.run('python -c "import sys; sys.exit(1)"')
+
+
+def _python(code: str) -> str:
+    return f'python -c "{code}"'
+
+
+def test_run_group(capfd: pytest.CaptureFixture[str], tmp_path):
+    # Each hook of the group waits for the other one: they must run concurrently
+    wait_for = (
+        "import pathlib, sys, time; pathlib.Path('{own}').touch(); "
+        "[time.sleep(0.05) for _ in range(200) if not pathlib.Path('{other}').exists()]; "
+        "print('{own} done'); sys.exit(not pathlib.Path('{other}').exists())"
+    )
+    a, b = tmp_path / "a", tmp_path / "b"
+
+    hooks.run(
+        [
+            [
+                _python(wait_for.format(own=a, other=b)),
+                _python(wait_for.format(own=b, other=a)),
+            ],
+            _python("import os; print(os.environ['CZ_FOO'])"),
+        ],
+        _jobs=2,
+        foo="bar",
+    )
+
+    lines = capfd.readouterr().out.splitlines()
+    assert f"[{_python(wait_for.format(own=a, other=b))}] {a} done" in lines
+    assert f"[{_python(wait_for.format(own=b, other=a))}] {b} done" in lines
+    # The hooks after a group only run once the whole group is done
+    assert lines[-1] == "bar"
+
+
+def test_run_group_fails_fast(capfd: pytest.CaptureFixture[str], tmp_path):
+    failing = _python("import sys; sys.exit(3)")
+    slow = _python("import time; time.sleep(30)")
+    after = tmp_path / "after"
+
+    start = time.monotonic()
+    with pytest.raises(RunHookError, match=re.escape(failing)):
+        hooks.run(
+            [[slow, failing], _python(f"open('{after}', 'w')")],
+            _jobs=2,
+        )
+
+    assert time.monotonic() - start < 20
+    assert not after.exists()
+
+
+def test_run_group_with_one_job(mocker: MockFixture):
+    executor = mocker.spy(hooks, "ThreadPoolExecutor")
+
+    hooks.run([[_python("pass"), _python("pass")]], _jobs=1)
+
+    executor.assert_called_once_with(max_workers=1)
+
+
+def test_run_timings(capfd: pytest.CaptureFixture[str]):
+    first = _python("pass")
+    second = _python("import os; print(os.environ['CZ_HOOK_TIMINGS'])")
+    timings: list[hooks.HookTiming] = []
+
+    hooks.run([first, [second]], _timings=timings)
+
+    assert [timing.hook for timing in timings] == [first, second]
+    assert all(timing.seconds > 0 for timing in timings)
+    # The hooks get the timings of the hooks run before them
+    output = capfd.readouterr().out
+    [line] = re.findall(f"^{re.escape(f'[{second}] ')}(.*)$", output, re.M)
+    assert json.loads(line) == [
+        {"hook": first, "seconds": round(timings[0].seconds, 3)}
+    ]
+
+
+@pytest.mark.parametrize("group", [False, True])
+def test_run_keeps_stderr_separate(capfd: pytest.CaptureFixture[str], group: bool):
+    # Printing words apart, so that the command itself doesn't contain the output
+    hook = _python(
+        "import sys; print('to', 'out'); print('to', 'err', file=sys.stderr)"
+    )
+
+    # With a timeout, the output of a hook is read instead of inherited
+    hooks.run([[hook]] if group else [hook], _timeout=30)
+
+    captured = capfd.readouterr()
+    assert "to out" in captured.out
+    assert "to err" not in captured.out
+    assert "to err" in captured.err
+
+
+@pytest.mark.parametrize("group", [False, True])
+def test_run_timeout(tmp_path, group: bool):
+    slow = _python("import time; time.sleep(30)")
+    after = tmp_path / "after"
+
+    start = time.monotonic()
+    with pytest.raises(
+        RunHookError, match=re.escape(f"Running hook '{slow}' timed out after 0.5s")
+    ):
+        hooks.run(
+            [[slow] if group else slow, _python(f"open('{after}', 'w')")],
+            _timeout=0.5,
+        )
+
+    assert time.monotonic() - start < 20
+    assert not after.exists()
+
+
+def test_run_total_timeout():
+    quick = _python("pass")
+    slow = _python("import time; time.sleep(30)")
+    timings: list[hooks.HookTiming] = []
+
+    with pytest.raises(
+        RunHookError,
+        match=re.escape(
+            f"Running hook '{slow}' timed out, the hooks exceeding their total"
+            " time limit of 1s"
+        ),
+    ):
+        hooks.run([quick, [slow, slow]], _total_timeout=1, _timings=timings)
+
+    # The hooks share the time limit
+    assert sum(timing.seconds for timing in timings[1:]) < 2 * 20
+    assert timings[0].hook == quick
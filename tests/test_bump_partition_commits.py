@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from commitizen import bump
+from commitizen.git import GitCommit
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("README.md", ""),
+        ("services/api/main.py", "services/api"),
+        ("services/api/plugins/x/setup.py", "services/api/plugins/x"),
+        ("services/api-client/main.py", ""),
+        ("web/src/index.ts", "web/"),
+    ],
+)
+def test_path_trie_finds_deepest_directory(filename: str, expected: str):
+    trie = bump.PathTrie(["", "services/api", "services/api/plugins/x", "web/"])
+
+    assert trie.find(filename) == expected
+
+
+def test_path_trie_without_root():
+    trie = bump.PathTrie(["services/api"])
+
+    assert trie.find("README.md") is None
+    assert trie.find("services/api/main.py") == "services/api"
+
+
+def test_partition_commits():
+    api = GitCommit("1", "feat: api")
+    both = GitCommit("2", "fix: api and web")
+    docs = GitCommit("3", "docs: readme")
+    merge = GitCommit("4", "Merge branch")
+
+    partitions = bump.partition_commits(
+        [
+            (api, ["services/api/a.py", "services/api/b.py"]),
+            (both, ["services/api/a.py", "web/index.ts"]),
+            (docs, ["README.md"]),
+            (merge, []),
+        ],
+        ["services/api", "web"],
+    )
+
+    assert partitions == {"services/api": [api, both], "web": [both]}
@@ -7,7 +7,7 @@ from typing import TypeAlias
 import pytest
 from _pytest.fixtures import FixtureRequest
 
-from commitizen import bump
+from commitizen import bump, cmd
 from commitizen.exceptions import CurrentVersionNotFoundError
 
 MULTIPLE_VERSIONS_INCREASE_STRING = 'version = "1.2.9"\n' * 30
@@ -398,3 +398,224 @@ def test_update_version_in_files_return_value_partial_update(tmp_path):
     # Verify file2 was not changed
     content2 = file2.read_text(encoding="utf-8")
     assert content2 == "some other content\n"
+
+
+def test_replace_version_in_files_single_write_per_file(tmp_path, mocker):
+    version_file = tmp_path / "pyproject.toml"
+    version_file.write_text('version = "1.2.3"\nrelease = "1.2.3"\nother = "1.2.3"\n')
+    smart_open = mocker.spy(bump, "smart_open")
+
+    updates = bump.replace_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        [f"{version_file}:^version", f"{version_file}:^release"],
+        check_consistency=True,
+        encoding="utf-8",
+    )
+
+    assert updates == [bump.VersionFileUpdate(str(version_file), 2, True)]
+    smart_open.assert_called_once()
+    assert version_file.read_text() == (
+        'version = "2.0.0"\nrelease = "2.0.0"\nother = "1.2.3"\n'
+    )
+
+
+def test_replace_version_in_files_skips_unchanged_files(tmp_path, mocker):
+    version_file = tmp_path / "file.txt"
+    version_file.write_text("some other content\n")
+    smart_open = mocker.spy(bump, "smart_open")
+
+    updates = bump.replace_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        [str(version_file)],
+        check_consistency=False,
+        encoding="utf-8",
+    )
+
+    assert updates == [bump.VersionFileUpdate(str(version_file), 0, False)]
+    smart_open.assert_not_called()
+
+
+def test_replace_version_in_files_consistency_checks_every_regex(tmp_path):
+    version_file = tmp_path / "pyproject.toml"
+    version_file.write_text('version = "1.2.3"\n')
+
+    with pytest.raises(CurrentVersionNotFoundError):
+        bump.replace_version_in_files(
+            "1.2.3",
+            "2.0.0",
+            [f"{version_file}:^version", f"{version_file}:^release"],
+            check_consistency=True,
+            encoding="utf-8",
+        )
+    assert version_file.read_text() == 'version = "1.2.3"\n'
+
+
+@pytest.fixture
+def streamed(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(bump, "STREAMING_THRESHOLD", 0)
+
+
+@pytest.mark.usefixtures("streamed")
+def test_replace_version_in_files_streaming(tmp_path: Path):
+    version_file = tmp_path / "api.json"
+    version_file.write_text('{\n  "version": "1.2.3",\n  "lodash": "1.2.3"\n}\n')
+    version_file.chmod(0o640)
+
+    updates = bump.replace_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        [f"{version_file}:version"],
+        check_consistency=True,
+        encoding="utf-8",
+    )
+
+    assert updates == [bump.VersionFileUpdate(str(version_file), 1, True)]
+    assert version_file.read_text() == (
+        '{\n  "version": "2.0.0",\n  "lodash": "1.2.3"\n}\n'
+    )
+    assert version_file.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["api.json"]
+
+
+@pytest.mark.usefixtures("streamed")
+def test_replace_version_in_files_streaming_unchanged(tmp_path: Path):
+    version_file = tmp_path / "file.txt"
+    version_file.write_text("some other content\n")
+    inode = version_file.stat().st_ino
+
+    updates = bump.replace_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        [str(version_file)],
+        check_consistency=False,
+        encoding="utf-8",
+    )
+
+    assert updates == [bump.VersionFileUpdate(str(version_file), 0, False)]
+    assert version_file.stat().st_ino == inode
+    assert [p.name for p in tmp_path.iterdir()] == ["file.txt"]
+
+
+@pytest.mark.usefixtures("streamed")
+def test_replace_version_in_files_streaming_inconsistent(tmp_path: Path):
+    version_file = tmp_path / "pyproject.toml"
+    version_file.write_text('version = "1.2.3"\n')
+
+    with pytest.raises(CurrentVersionNotFoundError):
+        bump.replace_version_in_files(
+            "1.2.3",
+            "2.0.0",
+            [f"{version_file}:^version", f"{version_file}:^release"],
+            check_consistency=True,
+            encoding="utf-8",
+        )
+    assert version_file.read_text() == 'version = "1.2.3"\n'
+    assert [p.name for p in tmp_path.iterdir()] == ["pyproject.toml"]
+
+
+@pytest.mark.usefixtures("streamed")
+def test_replace_version_in_files_streaming_symlink(tmp_path: Path):
+    version_file = tmp_path / "version.txt"
+    version_file.write_text("1.2.3\n")
+    link = tmp_path / "link.txt"
+    link.symlink_to(version_file)
+
+    bump.replace_version_in_files(
+        "1.2.3", "2.0.0", [str(link)], check_consistency=True, encoding="utf-8"
+    )
+
+    assert link.is_symlink()
+    assert version_file.read_text() == "2.0.0\n"
+
+
+@pytest.mark.parametrize(
+    ("include_untracked", "expected"),
+    [
+        (False, ["packages/a/version.txt"]),
+        (True, ["packages/a/version.txt", "packages/b/version.txt"]),
+    ],
+)
+def test_update_version_in_files_globs_git_files(
+    tmp_git_project: Path, include_untracked: bool, expected: list[str]
+):
+    for package in ("a", "b", "ignored"):
+        (tmp_git_project / "packages" / package).mkdir(parents=True)
+        (tmp_git_project / "packages" / package / "version.txt").write_text("1.2.3\n")
+    (tmp_git_project / ".gitignore").write_text("packages/ignored/\n")
+    cmd.run(["git", "add", ".gitignore", "packages/a"])
+
+    updated_files = bump.update_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        ["packages/*/version.txt"],
+        check_consistency=True,
+        encoding="utf-8",
+        include_untracked=include_untracked,
+    )
+
+    assert updated_files == expected
+    assert (tmp_git_project / "packages/ignored/version.txt").read_text() == "1.2.3\n"
+
+
+def test_update_version_in_files_globs_untracked_files_by_default(
+    tmp_git_project: Path,
+):
+    for package in ("a", "b"):
+        (tmp_git_project / "packages" / package).mkdir(parents=True)
+        (tmp_git_project / "packages" / package / "version.txt").write_text("1.2.3\n")
+    cmd.run(["git", "add", "packages/a"])
+
+    updated_files = bump.update_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        ["packages/*/version.txt"],
+        check_consistency=True,
+        encoding="utf-8",
+    )
+
+    assert updated_files == ["packages/a/version.txt", "packages/b/version.txt"]
+
+
+def test_update_version_in_files_skips_deleted_git_files(tmp_git_project: Path):
+    (tmp_git_project / "src").mkdir()
+    for name in ("a.py", "c.py"):
+        (tmp_git_project / "src" / name).write_text('__version__ = "1.2.3"\n')
+    cmd.run(["git", "add", "src"])
+    (tmp_git_project / "src" / "c.py").unlink()
+
+    updated_files = bump.update_version_in_files(
+        "1.2.3", "2.0.0", ["src/*.py"], check_consistency=True, encoding="utf-8"
+    )
+
+    assert updated_files == ["src/a.py"]
+
+
+def test_update_version_in_files_globs_ignored_files(tmp_git_project: Path):
+    (tmp_git_project / ".gitignore").write_text("build/\n")
+    (tmp_git_project / "build").mkdir()
+    (tmp_git_project / "build" / "version.txt").write_text("1.2.3\n")
+    cmd.run(["git", "add", ".gitignore"])
+
+    updated_files = bump.update_version_in_files(
+        "1.2.3", "2.0.0", ["build/*.txt"], check_consistency=True, encoding="utf-8"
+    )
+
+    assert updated_files == ["build/version.txt"]
+    assert (tmp_git_project / "build/version.txt").read_text() == "2.0.0\n"
+
+
+def test_update_version_in_files_globs_outside_git(tmp_path: Path):
+    version_file = tmp_path / "version.txt"
+    version_file.write_text("1.2.3\n")
+
+    updated_files = bump.update_version_in_files(
+        "1.2.3",
+        "2.0.0",
+        [str(tmp_path / "*.txt")],
+        check_consistency=True,
+        encoding="utf-8",
+    )
+
+    assert updated_files == [str(version_file)]
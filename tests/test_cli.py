@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import subprocess
@@ -8,9 +9,10 @@ from functools import partial
 import pytest
 from pytest_mock import MockFixture
 
-from commitizen import cli
+from commitizen import cli, cmd, commands, defaults, profiling, version_schemes
 from commitizen.exceptions import (
     ConfigFileNotFound,
+    DryRunExit,
     ExpectedExit,
     InvalidCommandArgumentError,
     NoCommandFoundError,
@@ -106,6 +108,54 @@ def test_arg_debug(util: UtilFixture):
     assert excepthook.keywords.get("debug") is True
 
 
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_arg_profile(util: UtilFixture, capsys):
+    util.run_cli("--profile", "version", "--project")
+
+    out, err = capsys.readouterr()
+    assert out == "0.1.0\n"
+    assert err.startswith("phase")
+    assert "config load" in err
+    assert not profiling.is_active()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_arg_profile_memory(util: UtilFixture, capsys):
+    util.run_cli("--profile-memory", "version", "--project")
+
+    header = capsys.readouterr().err.splitlines()[0]
+    assert header.endswith("peak memory (KiB)")
+    assert not profiling.is_active()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_profile_trace_from_env(util: UtilFixture, capsys, monkeypatch, tmp_path):
+    trace_file = tmp_path / "trace.json"
+    monkeypatch.setenv("CZ_PROFILE_TRACE", str(trace_file))
+
+    util.run_cli("version", "--project")
+
+    assert "config load" in capsys.readouterr().err
+    trace = json.loads(trace_file.read_text())
+    assert "config load" in {event["name"] for event in trace["traceEvents"]}
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_trace_commands_from_env(util: UtilFixture, monkeypatch, tmp_path):
+    trace_file = tmp_path / "commands.jsonl"
+    trace_file.write_text('{"argv": "from a previous run"}\n')
+    util.create_file_and_commit("feat: traced")
+    monkeypatch.setenv("CZ_TRACE_COMMANDS", str(trace_file))
+
+    with pytest.raises(DryRunExit):
+        util.run_cli("changelog", "--dry-run")
+
+    records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert records[0] == {"argv": "from a previous run"}
+    assert {record["argv"][1] for record in records[1:]} >= {"tag", "-c"}
+    assert not cmd._tracers
+
+
 def test_commitizen_excepthook():
     with pytest.raises(SystemExit) as excinfo:
         cli.commitizen_excepthook(NotAGitProjectError, NotAGitProjectError(), "")
@@ -251,3 +301,85 @@ def test_commitizen_excepthook_non_commitizen_exception_with_invalid_traceback(
 
     # Verify sys.__excepthook__ was called with None as traceback
     mock_original_excepthook.assert_called_once_with(ValueError, test_exception, None)
+
+
+CHECK_IMPORT_BUDGET_SCRIPT = """
+import sys
+
+from commitizen import cli
+
+sys.argv = ["cz", "check", "--message", "feat: lazy imports"]
+cli.main()
+sys.stderr.write("\\n".join(sys.modules))
+"""
+
+
+def test_check_import_budget(tmp_commitizen_project):
+    """`cz check` runs in the commit-msg hook: it must not import the dependencies of other commands."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_IMPORT_BUDGET_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = set(result.stderr.splitlines())
+
+    assert "Commit validation: successful!" in result.stdout
+    assert imported_modules.isdisjoint(
+        {
+            "questionary",
+            "prompt_toolkit",
+            "charset_normalizer",
+            "deprecated",
+            "tomlkit",
+            "jinja2",
+            "packaging",
+            "commitizen.changelog",
+            "commitizen.commands.bump",
+            "commitizen.commands.commit",
+            "commitizen.commands.init",
+            "commitizen.providers",
+        }
+    )
+
+
+def test_lazy_command(config):
+    command = cli.LazyCommand("Version")(config, {"commitizen": True})
+
+    assert repr(cli.LazyCommand("Version")) == "LazyCommand('Version')"
+    assert isinstance(command, commands.Version)
+
+
+def test_known_schemes():
+    assert version_schemes.KNOWN_SCHEMES is defaults.KNOWN_SCHEMES
+    assert {"pep440", "semver", "semver2"} <= set(defaults.KNOWN_SCHEMES)
+
+
+IMPORT_SCRIPT = """
+import logging
+import sys
+import time
+
+start = time.process_time()
+import commitizen.cli
+print(time.process_time() - start)
+print("colorama" in sys.modules)
+print(logging.getLogger("commitizen").handlers)
+"""
+
+
+def test_import_budget():
+    """Importing commitizen configures nothing and stays fast enough for the git hooks."""
+    runs = [
+        subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        for _ in range(3)
+    ]
+
+    # CPU time rather than wall time, not to depend on the load of the machine
+    assert min(float(seconds) for seconds, *_ in runs) < 0.5
+    assert runs[0][1:] == ["False", "[]"]
@@ -1,3 +1,10 @@
+import io
+import json
+import os
+import signal
+import sys
+import time
+
 import pytest
 
 from commitizen import cmd
@@ -215,3 +222,172 @@ class TestRunInteractiveShell:
             env={"CZ_ITEST_EXTRA": "extra"},
         )
         assert return_code == 0
+
+
+class TestStream:
+    def test_yields_records_and_returns_command(self):
+        records = cmd.stream(
+            [
+                sys.executable,
+                "-c",
+                "import sys; print('a|b|c', end=''); sys.stderr.write('oops'); sys.exit(2)",
+            ],
+            separator="|",
+        )
+
+        assert next(records) == "a"
+        assert next(records) == "b"
+        assert next(records) == "c"
+        with pytest.raises(StopIteration) as excinfo:
+            next(records)
+        assert excinfo.value.value.err == "oops"
+        assert excinfo.value.value.return_code == 2
+
+    def test_close_terminates_command(self, mocker):
+        popen_spy = mocker.spy(cmd.subprocess, "Popen")
+        records = cmd.stream(
+            [sys.executable, "-c", "while True: print('y', flush=True)"]
+        )
+
+        assert next(records) == "y"
+        records.close()
+
+        process = popen_spy.spy_return
+        assert process.returncode is not None
+        assert process.stdout.closed
+
+
+@pytest.fixture
+def traces():
+    traces: list[cmd.CommandTrace] = []
+    cmd.add_tracer(traces.append)
+    yield traces
+    cmd.remove_tracer(traces.append)
+
+
+def test_trace_run(traces: list[cmd.CommandTrace], monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("INHERITED", "1")
+    script = "import sys; print('out'); sys.stderr.write('e'); sys.exit(3)"
+
+    c = cmd.run([sys.executable, "-c", script], env={"INHERITED": "1", "OVERRIDE": "2"})
+
+    assert c.return_code == 3
+    [trace] = traces
+    assert trace.cmd == [sys.executable, "-c", script]
+    assert trace.shell is False
+    assert trace.env == {"OVERRIDE": "2"}
+    assert trace.return_code == 3
+    assert trace.stdout_size == len(c.stdout)
+    assert trace.stderr_size == 1
+    assert trace.duration_ns > 0
+
+
+def test_trace_stream(traces: list[cmd.CommandTrace]):
+    log = cmd.stream(
+        [sys.executable, "-c", "print('a'); print('b'); print('c')"], separator="\n"
+    )
+    assert next(log) == "a"
+    assert not traces
+
+    log.close()
+
+    [trace] = traces
+    assert trace.stdout_size is not None
+    assert trace.stdout_size >= 2
+    assert trace.stderr_size == 0
+
+
+def test_trace_run_interactive(traces: list[cmd.CommandTrace]):
+    cmd.run_interactive_shell("exit 2")
+
+    [trace] = traces
+    assert trace.cmd == "exit 2"
+    assert trace.shell is True
+    assert trace.return_code == 2
+    assert trace.stdout_size is None
+    assert trace.stderr_size is None
+
+
+def test_remove_tracer(traces: list[cmd.CommandTrace]):
+    cmd.remove_tracer(traces.append)
+    cmd.run([sys.executable, "--version"])
+    cmd.add_tracer(traces.append)
+
+    assert not traces
+
+
+def test_json_lines_tracer():
+    stream = io.StringIO()
+    tracer = cmd.JsonLinesTracer(stream)
+
+    tracer(cmd.CommandTrace(["git", "log"], False, {"A": "1"}, 0, 1_500_000, 0, 3, 0))
+    tracer(cmd.CommandTrace("./hook.sh", True, {}, 0, 0, 1, None, None))
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records[0] == {
+        "pid": os.getpid(),
+        "argv": ["git", "log"],
+        "shell": False,
+        "env": {"A": "1"},
+        "duration_ms": 1.5,
+        "return_code": 0,
+        "stdout_bytes": 3,
+        "stderr_bytes": 0,
+    }
+    assert records[1]["argv"] == "./hook.sh"
+    assert records[1]["stdout_bytes"] is None
+
+
+class TestShellProcess:
+    def test_lines(self, traces: list[cmd.CommandTrace]):
+        process = cmd.ShellProcess(
+            "python -c \"import os, sys; print('out'); print(os.environ['CZ_TEST_VAR'], file=sys.stderr); sys.exit(3)\"",
+            env={"CZ_TEST_VAR": "err"},
+        )
+
+        assert sorted(process.lines()) == [
+            cmd.OutputLine("err", stderr=True),
+            cmd.OutputLine("out", stderr=False),
+        ]
+        assert process.wait() == 3
+        [trace] = traces
+        assert trace.shell is True
+        assert trace.return_code == 3
+        assert trace.env == {"CZ_TEST_VAR": "err"}
+        assert trace.stdout_size == len(f"out{os.linesep}")
+        assert trace.stderr_size == len(f"err{os.linesep}")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="no process groups")
+    def test_terminate_stops_the_commands_of_the_shell(self):
+        process = cmd.ShellProcess(
+            "python -c \"import time; print('started', flush=True); time.sleep(30)\"; echo never"
+        )
+        lines = process.lines()
+        assert next(lines) == cmd.OutputLine("started", stderr=False)
+
+        process.terminate()
+
+        # The shell itself is stopped, before echoing anything
+        assert process.wait() == -signal.SIGTERM
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="no process groups")
+    def test_timeout_kills_the_commands_ignoring_termination(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(cmd, "KILL_DELAY", 0.5)
+        process = cmd.ShellProcess(
+            "trap '' TERM; python -c \"import signal, time; "
+            'signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(30)"',
+            timeout=0.5,
+        )
+
+        start = time.monotonic()
+        assert process.wait() == -signal.SIGKILL
+        assert time.monotonic() - start < 20
+        assert process.timed_out
+
+    def test_no_timeout(self):
+        process = cmd.ShellProcess('python -c "pass"', timeout=30)
+
+        assert process.wait() == 0
+        assert not process.timed_out
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import time
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,7 @@ import pytest
 import yaml
 
 from commitizen import cmd, config, defaults, git
+from commitizen.config import settings_cache
 from commitizen.config.json_config import JsonConfig
 from commitizen.config.toml_config import TomlConfig
 from commitizen.config.yaml_config import YAMLConfig
@@ -95,6 +97,7 @@ _settings: dict[str, Any] = {
         "amend!",
     ],
     "version_files": ["commitizen/__version__.py", "pyproject.toml"],
+    "version_files_include_untracked": True,
     "style": [["pointer", "reverse"], ["question", "underline"]],
     "changelog_file": "CHANGELOG.md",
     "changelog_format": None,
@@ -135,6 +138,7 @@ _new_settings: dict[str, Any] = {
         "amend!",
     ],
     "version_files": ["commitizen/__version__.py", "pyproject.toml"],
+    "version_files_include_untracked": True,
     "style": [["pointer", "reverse"], ["question", "underline"]],
     "changelog_file": "CHANGELOG.md",
     "changelog_format": None,
@@ -188,6 +192,44 @@ def test_set_key(config_files_manager):
     assert cfg.settings == _new_settings
 
 
+@pytest.mark.parametrize(
+    ("config_file", "data"),
+    [
+        ("pyproject.toml", PYPROJECT),
+        (".cz.json", JSON_STR),
+        (".cz.yaml", YAML_STR),
+    ],
+)
+def test_config_file_is_parsed_once(tmp_path, mocker, config_file, data):
+    path = tmp_path / config_file
+    path.write_text(data)
+    read_bytes = mocker.spy(Path, "read_bytes")
+    open_ = mocker.spy(Path, "open")
+
+    conf = config.read_cfg(str(path))
+
+    assert conf.contains_commitizen_section()
+    assert conf.settings["name"] == "cz_jira"
+    assert read_bytes.call_count == 1
+    # read_bytes() opens the file once itself
+    assert open_.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("config_class", "path", "data"),
+    [
+        (TomlConfig, "pyproject.toml", "[tool.black]\nline-length = 88\n"),
+        (JsonConfig, ".cz.json", '{"other": {}}'),
+        (YAMLConfig, ".cz.yaml", "other: {}"),
+        (YAMLConfig, ".cz.yaml", ""),
+    ],
+)
+def test_contains_commitizen_section_without_section(config_class, path, data):
+    conf = config_class(data=data, path=Path(path))
+
+    assert not conf.contains_commitizen_section()
+
+
 class TestReadCfg:
     @pytest.mark.parametrize(
         "config_files_manager", defaults.CONFIG_FILES, indirect=True
@@ -403,6 +445,91 @@ class TestWarnMultipleConfigFiles:
         assert cfg.path == Path(".cz.toml")
 
 
+def _write_old_file(path: Path, content: str, age: int = 60) -> None:
+    path.write_text(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.usefixtures("tmp_git_project")
+class TestSettingsCache:
+    def test_cached_settings_are_reused(self, tmp_git_project, mocker):
+        _write_old_file(tmp_git_project / "pyproject.toml", PYPROJECT)
+        cfg = config.read_cfg()
+        assert (tmp_git_project / ".git" / settings_cache.CACHE_FILENAME).is_file()
+
+        create_config = mocker.spy(config, "_create_config_from_path")
+        cached_cfg = config.read_cfg()
+
+        create_config.assert_not_called()
+        assert isinstance(cached_cfg, TomlConfig)
+        assert cached_cfg.path == cfg.path
+        assert cached_cfg.settings == cfg.settings == _settings
+        assert cached_cfg.contains_commitizen_section()
+
+    def test_cache_entries_are_bounded(self, tmp_git_project, mocker, monkeypatch):
+        mocker.patch.object(settings_cache, "MAX_ENTRIES", 2)
+        _write_old_file(tmp_git_project / "pyproject.toml", PYPROJECT)
+        for name in ("a", "b", "c"):
+            (tmp_git_project / name).mkdir()
+            monkeypatch.chdir(tmp_git_project / name)
+            config.read_cfg()
+
+        cache_path = tmp_git_project / ".git" / settings_cache.CACHE_FILENAME
+        entries = json.loads(cache_path.read_text())["entries"]
+        assert list(entries) == [
+            str((tmp_git_project / name).resolve()) for name in ("b", "c")
+        ]
+
+    def test_changed_file_invalidates_cache(self, tmp_git_project):
+        _write_old_file(tmp_git_project / "pyproject.toml", PYPROJECT)
+        config.read_cfg()
+        _write_old_file(
+            tmp_git_project / "pyproject.toml",
+            PYPROJECT.replace("cz_jira", "cz_customize"),
+            age=30,
+        )
+
+        assert config.read_cfg().settings["name"] == "cz_customize"
+
+    def test_new_candidate_invalidates_cache(self, tmp_git_project, capsys):
+        _write_old_file(tmp_git_project / "pyproject.toml", PYPROJECT)
+        config.read_cfg()
+        _write_old_file(tmp_git_project / ".cz.json", JSON_STR)
+        config.read_cfg()
+        capsys.readouterr()
+
+        cfg = config.read_cfg()
+
+        assert isinstance(cfg, JsonConfig)
+        assert "Multiple config files detected" in capsys.readouterr().err
+
+    def test_recently_modified_files_are_not_cached(self, tmp_git_project):
+        (tmp_git_project / "pyproject.toml").write_text(PYPROJECT)
+        config.read_cfg()
+
+        assert not (tmp_git_project / ".git" / settings_cache.CACHE_FILENAME).exists()
+
+    def test_other_commitizen_version_invalidates_cache(self, tmp_git_project, mocker):
+        _write_old_file(tmp_git_project / "pyproject.toml", PYPROJECT)
+        config.read_cfg()
+        mocker.patch.object(settings_cache, "__version__", "0.0.0")
+
+        create_config = mocker.spy(config, "_create_config_from_path")
+        config.read_cfg()
+
+        create_config.assert_called_once()
+
+    def test_no_config_is_cached(self, tmp_git_project):
+        _write_old_file(tmp_git_project / "pyproject.toml", "[tool.black]\n")
+        config.read_cfg()
+
+        cfg = config.read_cfg()
+
+        assert type(cfg) is config.BaseConfig
+        assert cfg.path is None
+
+
 @pytest.mark.parametrize(
     "config_file",
     [
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from commitizen import client, cmd, daemon, git, serve_protocol
+from commitizen.commands.serve import Serve
+from commitizen.exceptions import ExitCode, ServeError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytest_mock import MockFixture
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix domain sockets are required"
+)
+
+
+@pytest.fixture
+def socket_dir(monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    # Keep socket paths short enough for AF_UNIX
+    runtime_dir = Path(tempfile.mkdtemp(dir="/tmp"))
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    yield runtime_dir / "commitizen"
+    shutil.rmtree(runtime_dir)
+
+
+@pytest.fixture
+def server(
+    tmp_commitizen_project: Path, socket_dir
+) -> Iterator[daemon.CommitizenServer]:
+    path = serve_protocol.socket_path()
+    server = daemon.CommitizenServer(path, idle_timeout=5)
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+    yield server
+    server.idle = True
+    # Wake the server up so it notices it has to stop
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+    thread.join()
+    server.server_close()
+    path.unlink(missing_ok=True)
+
+
+def test_socket_path_is_dedicated_to_the_directory(tmp_path: Path):
+    assert serve_protocol.socket_path(tmp_path) == serve_protocol.socket_path(tmp_path)
+    assert serve_protocol.socket_path(tmp_path) != serve_protocol.socket_path(
+        tmp_path / "other"
+    )
+
+
+def test_socket_dir(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert serve_protocol.socket_dir() == Path("/run/user/1000/commitizen")
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: "/tmp")
+    assert serve_protocol.socket_dir() == Path(f"/tmp/cz-serve-{os.getuid()}")
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project", "socket_dir")
+def test_request_without_server():
+    assert serve_protocol.request(["version", "--project"]) is None
+
+
+@pytest.mark.usefixtures("server")
+def test_request_ignores_a_socket_dir_others_can_access(socket_dir: Path):
+    socket_dir.chmod(0o755)
+
+    assert serve_protocol.request(["version", "--project"]) is None
+
+
+@pytest.mark.usefixtures("server")
+def test_request_ignores_the_sockets_of_other_users(monkeypatch: pytest.MonkeyPatch):
+    uid = os.getuid()
+    monkeypatch.setattr(serve_protocol.os, "getuid", lambda: uid + 1)
+
+    assert serve_protocol.request(["version", "--project"]) is None
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_request_ignores_a_file_which_is_not_a_socket(socket_dir: Path):
+    daemon.make_socket_dir(socket_dir)
+    serve_protocol.socket_path().write_text("")
+
+    assert serve_protocol.request(["version", "--project"]) is None
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_server_refuses_a_socket_dir_others_can_access(socket_dir: Path, config):
+    socket_dir.mkdir()
+    socket_dir.chmod(0o777)
+
+    with pytest.raises(ServeError, match="Refusing to serve"):
+        daemon.CommitizenServer(serve_protocol.socket_path())
+    with pytest.raises(ServeError, match="Refusing to serve"):
+        Serve(config, {"idle_timeout": 0.01})()
+
+
+@pytest.mark.usefixtures("server")
+def test_request_check():
+    response = serve_protocol.request(["check", "--message", "feat: served"])
+
+    assert response == {
+        "exit_code": ExitCode.EXPECTED_EXIT,
+        "stdout": "Commit validation: successful!\n",
+        "stderr": "",
+    }
+
+
+@pytest.mark.usefixtures("server")
+def test_request_check_invalid_message():
+    response = serve_protocol.request(["check", "--message", "bad message"])
+
+    assert response is not None
+    assert response["exit_code"] == ExitCode.INVALID_COMMIT_MSG
+    assert "commit validation: failed!" in response["stderr"]
+
+
+@pytest.mark.usefixtures("server")
+def test_request_check_no_raise():
+    response = serve_protocol.request(
+        ["-nr", "INVALID_COMMIT_MSG", "check", "--message", "bad message"]
+    )
+
+    assert response is not None
+    assert response["exit_code"] == ExitCode.EXPECTED_EXIT
+
+
+@pytest.mark.usefixtures("server")
+def test_request_check_from_stdin():
+    response = serve_protocol.request(["check"], stdin="fix: from stdin")
+
+    assert response is not None
+    assert response["exit_code"] == ExitCode.EXPECTED_EXIT
+
+
+@pytest.mark.usefixtures("server")
+def test_request_not_served_command():
+    response = serve_protocol.request(["bump", "--yes"])
+
+    assert response is not None
+    assert response["exit_code"] == ExitCode.NO_COMMAND_FOUND
+
+
+@pytest.mark.usefixtures("server")
+def test_request_version_reloads_changed_config(pyproject: Path):
+    response = serve_protocol.request(["version", "--project"])
+    assert response is not None
+    assert response["stdout"] == "0.1.0\n"
+
+    pyproject.write_text('[tool.commitizen]\nversion="0.10.0"\n')
+    response = serve_protocol.request(["version", "--project"])
+
+    assert response is not None
+    assert response["stdout"] == "0.10.0\n"
+
+
+def _git(*args: str) -> None:
+    c = cmd.run(["git", "-c", "user.name=cz", "-c", "user.email=cz@example.com", *args])
+    assert c.return_code == 0, c.err
+
+
+@pytest.mark.usefixtures("server")
+def test_request_runs_with_the_git_env_of_the_client(
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    # Such as a pre-receive hook, where the pushed commits are only in the
+    # quarantine directory given in the environment
+    other = tmp_path_factory.mktemp("other")
+    _git("init", str(other))
+    _git("-C", str(other), "commit", "--allow-empty", "-m", "bad message")
+    env = {"GIT_DIR": str(other / ".git"), "GIT_WORK_TREE": str(other)}
+
+    response = serve_protocol.request(["check", "--rev-range", "HEAD"], env=env)
+
+    assert response is not None
+    assert response["exit_code"] == ExitCode.INVALID_COMMIT_MSG
+    assert "bad message" in response["stderr"]
+    assert "GIT_DIR" not in os.environ
+
+
+def test_dispatch_restores_the_git_env_of_the_server(
+    server: daemon.CommitizenServer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "0")
+
+    server.dispatch(["version", "--project"], None, {"GIT_DIR": "/nowhere"})
+
+    assert os.environ["GIT_CONFIG_COUNT"] == "0"
+    assert "GIT_DIR" not in os.environ
+
+
+def test_forwarded_env():
+    env = {"GIT_DIR": ".git", "GIT_QUARANTINE_PATH": "objects/q", "PATH": "/bin"}
+
+    assert serve_protocol.forwarded_env(env) == {
+        "GIT_DIR": ".git",
+        "GIT_QUARANTINE_PATH": "objects/q",
+    }
+
+
+def test_tag_index(tmp_commitizen_project: Path, mocker: MockFixture):
+    _git("commit", "--allow-empty", "-m", "feat: first")
+    _git("tag", "v0.1.0")
+    get_tags = mocker.Mock(wraps=git.get_tags)
+    index = daemon.TagIndex(get_tags)
+
+    assert [tag.name for tag in index()] == ["v0.1.0"]
+    assert [tag.name for tag in index()] == ["v0.1.0"]
+    assert get_tags.call_count == 1
+
+    _git("tag", "v0.2.0")
+    assert {tag.name for tag in index()} == {"v0.1.0", "v0.2.0"}
+    assert get_tags.call_count == 2
+
+    index(reachable_only=True)
+    index(reachable_only=True)
+    assert get_tags.call_count == 3
+    # The tags reachable from HEAD change with it
+    _git("commit", "--allow-empty", "-m", "feat: second")
+    index(reachable_only=True)
+    assert get_tags.call_count == 4
+
+    _git("pack-refs", "--all")
+    assert {tag.name for tag in index()} == {"v0.1.0", "v0.2.0"}
+    _git("tag", "-d", "v0.1.0")
+    assert [tag.name for tag in index()] == ["v0.2.0"]
+
+
+def test_request_version_uses_the_tag_index(
+    server: daemon.CommitizenServer, pyproject: Path, mocker: MockFixture
+):
+    pyproject.write_text('[tool.commitizen]\nversion_provider = "scm"\n')
+    _git("commit", "--allow-empty", "-m", "feat: first")
+    _git("tag", "0.3.0")
+    get_tags = mocker.patch.object(
+        server.tag_index, "get_tags", wraps=server.tag_index.get_tags
+    )
+
+    for _ in range(2):
+        response = serve_protocol.request(["version", "--project"])
+        assert response is not None
+        assert response["stdout"] == "0.3.0\n"
+    get_tags.assert_called_once()
+
+
+def test_client_only_imports_the_standard_library():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, commitizen.client; print(*sorted(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set(result.stdout.split())
+
+    assert {name for name in modules if name.startswith("commitizen")} == {
+        "commitizen",
+        "commitizen.client",
+        "commitizen.serve_protocol",
+    }
+    assert modules.isdisjoint({"colorama", "decli", "argcomplete", "logging"})
+
+
+def test_read_cfg_is_cached(server: daemon.CommitizenServer, mocker: MockFixture):
+    first = server.read_cfg()
+    read_cfg_mock = mocker.patch("commitizen.config.read_cfg")
+    second = server.read_cfg()
+
+    read_cfg_mock.assert_not_called()
+    assert first is not second
+    assert first.settings == second.settings
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project", "socket_dir")
+def test_server_shuts_down_when_idle():
+    path = serve_protocol.socket_path()
+    server = daemon.CommitizenServer(path, idle_timeout=0.01)
+    server.serve_until_idle()
+    server.server_close()
+    path.unlink()
+
+    assert server.idle
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project", "socket_dir")
+def test_serve_command_removes_its_socket(config):
+    Serve(config, {"idle_timeout": 0.01})()
+
+    assert not serve_protocol.socket_path().exists()
+
+
+@pytest.mark.usefixtures("server")
+def test_serve_command_already_running(config):
+    with pytest.raises(ServeError, match="already running"):
+        Serve(config, {"idle_timeout": 0.01})()
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["check"], "check"),
+        (["--config", "cz.toml", "-n", "cz_jira", "version", "-p"], "version"),
+        (["-nr", "3", "--debug", "bump"], "bump"),
+        (["--debug"], None),
+    ],
+)
+def test_client_get_subcommand(argv, expected):
+    assert client._get_subcommand(argv) == expected
+
+
+@pytest.mark.usefixtures("server")
+def test_client_uses_server(mocker: MockFixture, capsys):
+    mocker.patch.object(sys, "argv", ["cz-client", "version", "--project"])
+    cli_main = mocker.patch("commitizen.cli.main")
+
+    with pytest.raises(SystemExit) as excinfo:
+        client.main()
+
+    assert excinfo.value.code == ExitCode.EXPECTED_EXIT
+    assert capsys.readouterr().out == "0.1.0\n"
+    cli_main.assert_not_called()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project", "socket_dir")
+def test_client_falls_back_to_cli(mocker: MockFixture):
+    mocker.patch.object(sys, "argv", ["cz-client", "version", "--project"])
+    cli_main = mocker.patch("commitizen.cli.main")
+
+    client.main()
+
+    cli_main.assert_called_once_with()
@@ -102,13 +102,13 @@ def test_git_message_with_empty_body():
 
 
 @pytest.mark.usefixtures("tmp_commitizen_project")
-def test_get_log_as_str_list_empty():
+def test_get_log_batch_empty():
     """
     Ensure an exception is raised or empty list in an empty project.
     The behavior is different depending on the version of git.
     """
     try:
-        gitlog = git._get_log_as_str_list(start=None, end="HEAD", args=[])
+        gitlog = git._get_log_batch(start=None, end="HEAD", args=[])
     except GitCommandError:
         return
     assert len(gitlog) == 0, "list should be empty if no assert"
@@ -467,6 +467,115 @@ def test_git_commit_from_rev_and_commit(linebreak):
     assert commit.parents == []
 
 
+def test_git_commit_message_is_cached():
+    commit = git.GitCommit("abc123", "feat: title", body="body")
+
+    assert commit.message is commit.message
+
+    commit.title = "fix: title"
+    commit.body = "other body"
+    assert commit.message == "fix: title\n\nother body"
+
+
+def test_git_objects_accept_new_attributes():
+    commit = git.GitCommit("abc123", "feat: title")
+    tag = git.GitTag("v1.0.0", "abc123", "2024-01-01")
+
+    # As set by changelog_message_builder_hook and changelog_release_hook
+    commit.issue = "ABC-1"
+    tag.url = "https://example.com/v1.0.0"
+
+    assert vars(commit) == {"issue": "ABC-1"}
+    assert vars(tag) == {"url": "https://example.com/v1.0.0"}
+
+
+@pytest.mark.parametrize(
+    "linebreak", ["\n", "\r\n"], ids=["line_feed", "carriage_return"]
+)
+def test_commit_batch(linebreak: str):
+    delimiter = "----------commit-delimiter----------"
+    entries = [
+        linebreak.join(
+            [
+                "abc123",
+                "def456 ghi789",
+                "feat: add new feature",
+                "John Doe",
+                "john@example.com",
+                "This is a detailed description",
+                "",
+                "of the new feature",
+            ]
+        ),
+        linebreak.join(
+            ["def456", "", "fix: minimal commit", "Jane Doe", "jane@x.com", ""]
+        ),
+    ]
+    log = "".join(f"{entry}{delimiter}\n" for entry in entries)
+
+    batch = git.CommitBatch.from_log(log, delimiter)
+
+    assert len(batch) == 2
+    for commit, entry in zip(batch, entries):
+        expected = git.GitCommit.from_rev_and_commit(entry)
+        assert (commit.rev, commit.title, commit.body, commit.parents) == (
+            expected.rev,
+            expected.title,
+            expected.body,
+            expected.parents,
+        )
+        assert (commit.author, commit.author_email) == (
+            expected.author,
+            expected.author_email,
+        )
+    assert batch[-1].rev == "def456"
+    assert [commit.rev for commit in batch[1:]] == ["def456"]
+    assert [commit.rev for commit in batch[::-1]] == ["def456", "abc123"]
+    assert list(batch.revs()) == ["abc123", "def456"]
+    with pytest.raises(IndexError):
+        batch[2]
+
+
+def test_commit_batch_reuses_the_commits_in_use():
+    batch = git.CommitBatch.from_log(
+        "abc123\n\nfeat: first\na\na@x.com\n---\ndef456\n\nfix: second\nb\nb@x.com\n---\n",
+        "---",
+    )
+
+    commit = batch[0]
+    commit.issue = "ABC-1"
+    assert batch[0] is commit
+    assert next(iter(batch)) is commit
+    assert batch[:1][0] is commit
+    assert batch[1] is not commit
+
+    message = commit.message
+    del commit
+    assert batch[0].message == message
+
+
+def test_commit_batch_invalid_entry():
+    batch = git.CommitBatch.from_log("abc123\ntitle only\n---\n", "---")
+
+    assert len(batch) == 1
+    with pytest.raises(ValueError, match="Invalid git log entry"):
+        batch[0]
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_get_commit_batch(util: UtilFixture):
+    util.create_file_and_commit("feat(users): add username")
+    util.create_file_and_commit("fix: username exception")
+
+    batch = git.get_commit_batch()
+
+    assert [commit.title for commit in batch] == [
+        commit.title for commit in git.get_commits()
+    ]
+    assert len(batch) == 2
+    assert list(batch.revs()) == [commit.rev for commit in git.get_commits()]
+
+
 @pytest.mark.parametrize(
     "committer_date",
     [
@@ -516,3 +625,175 @@ def test_get_default_branch_error(util: UtilFixture):
     )
     with pytest.raises(GitCommandError):
         git.get_default_branch()
+
+
+def test_find_git_location_from_subdirectory(
+    tmp_commitizen_project: Path, monkeypatch: pytest.MonkeyPatch, util: UtilFixture
+):
+    run_mock = util.mock_cmd()
+    subdirectory = tmp_commitizen_project / "a" / "b"
+    subdirectory.mkdir(parents=True)
+    monkeypatch.chdir(subdirectory)
+
+    assert git.find_git_location() == git.GitLocation(
+        Path(tmp_commitizen_project), Path(tmp_commitizen_project) / ".git"
+    )
+    assert git.is_git_project()
+    run_mock.assert_not_called()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_find_git_location_in_worktree(
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+    util: UtilFixture,
+):
+    util.create_file_and_commit("feat: initial")
+    worktree = tmp_path_factory.mktemp("worktrees") / "worktree"
+    cmd.run(["git", "worktree", "add", str(worktree)])
+    monkeypatch.chdir(worktree)
+    expected = cmd.run(["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"])
+
+    location = git.find_git_location()
+
+    assert location is not None
+    assert [str(location.work_tree), str(location.git_dir)] == expected.out.split()
+
+
+def test_find_git_location_inside_git_dir(
+    tmp_commitizen_project: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_commitizen_project / ".git")
+
+    assert git.find_git_location() is None
+    assert not git.is_git_project()
+
+
+def test_find_git_location_stops_at_ceiling_directories(
+    tmp_commitizen_project: Path, monkeypatch: pytest.MonkeyPatch
+):
+    subdirectory = tmp_commitizen_project / "sub"
+    subdirectory.mkdir()
+    monkeypatch.chdir(subdirectory)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_commitizen_project))
+
+    assert git.find_git_project_root() is None
+    assert not git.is_git_project()
+
+
+def test_find_git_location_from_environment(
+    tmp_commitizen_project: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.chdir(tmp_path_factory.mktemp("outside"))
+    monkeypatch.setenv("GIT_DIR", str(tmp_commitizen_project / ".git"))
+    monkeypatch.setenv("GIT_WORK_TREE", str(tmp_commitizen_project))
+
+    assert git.find_git_project_root() == Path(tmp_commitizen_project).resolve()
+    assert not git.is_git_project()
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_find_git_location_falls_back_to_git(
+    monkeypatch: pytest.MonkeyPatch, util: UtilFixture
+):
+    monkeypatch.setenv("GIT_DIR", "/some/repo/.git")
+    run_mock = util.mock_cmd(out="/some/repo\n/some/repo/.git\n")
+
+    assert git.find_git_location() == git.GitLocation(
+        Path("/some/repo"), Path("/some/repo/.git")
+    )
+    run_mock.assert_called_once_with(
+        ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"]
+    )
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_find_git_location_falls_back_to_git_with_core_worktree(util: UtilFixture):
+    cmd.run(["git", "config", "core.worktree", "."])
+    run_mock = util.mock_cmd(out="false\n")
+
+    assert not git.is_git_project()
+    run_mock.assert_called_once_with(["git", "rev-parse", "--is-inside-work-tree"])
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_iter_commits(util: UtilFixture):
+    util.create_file_and_commit("feat(users): add username")
+    util.create_file_and_commit("fix: username exception\n\nwith a body")
+
+    assert [
+        (commit.rev, commit.message, commit.parents) for commit in git.iter_commits()
+    ] == [(commit.rev, commit.message, commit.parents) for commit in git.get_commits()]
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_iter_commits_error():
+    with pytest.raises(GitCommandError):
+        list(git.iter_commits("unknown-rev"))
+
+
+def test_get_tracked_files(
+    tmp_commitizen_project: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (tmp_commitizen_project / "sub").mkdir()
+    (tmp_commitizen_project / "sub" / "tracked.txt").touch()
+    cmd.run(["git", "add", "."])
+    (tmp_commitizen_project / "untracked.txt").touch()
+    monkeypatch.chdir(tmp_commitizen_project / "sub")
+
+    assert git.get_tracked_files() == ["pyproject.toml", "sub/tracked.txt"]
+    assert sorted(git.get_tracked_files(include_untracked=True)) == [
+        "pyproject.toml",
+        "sub/tracked.txt",
+        "untracked.txt",
+    ]
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_get_commits_with_filenames(util: UtilFixture):
+    Path("packages/a").mkdir(parents=True)
+    util.create_file_and_commit("feat: add a", filename="packages/a/file with space")
+    util.create_file_and_commit("fix: fix root", filename="README.md")
+
+    commits = git.get_commits_with_filenames()
+
+    assert [(commit.title, filenames) for commit, filenames in commits] == [
+        ("fix: fix root", ["README.md"]),
+        ("feat: add a", ["packages/a/file with space", "pyproject.toml"]),
+    ]
+    assert commits[0][0].parents == [commits[1][0].rev]
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_get_commits_with_paths(util: UtilFixture):
+    Path("packages/a").mkdir(parents=True)
+    util.create_file_and_commit("feat: add a", filename="packages/a/a.py")
+    util.create_file_and_commit("fix: fix root", filename="README.md")
+    util.create_file_and_commit("fix: fix a", filename="packages/a/b.py")
+
+    assert [commit.title for commit in git.get_commits(paths=["packages/a"])] == [
+        "fix: fix a",
+        "feat: add a",
+    ]
+    assert [
+        commit.title for commit in git.iter_commits(paths=["README.md", "packages"])
+    ] == ["fix: fix a", "fix: fix root", "feat: add a"]
+    assert [
+        (commit.title, filenames)
+        for commit, filenames in git.get_commits_with_filenames(paths=["README.md"])
+    ] == [("fix: fix root", ["README.md"])]
+
+
+@pytest.mark.usefixtures("tmp_commitizen_project")
+def test_get_merge_base(util: UtilFixture):
+    util.create_file_and_commit("feat: first")
+    first = git.get_commits()[0].rev
+    util.create_branch("other")
+    util.create_file_and_commit("feat: on master")
+    util.switch_branch("other")
+    util.create_file_and_commit("feat: on other")
+
+    assert git.get_merge_base("master", "other") == first
+    assert git.get_merge_base("master", "not-a-rev") is None
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from commitizen import cmd, profiling
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def profiler() -> Generator[profiling.Profiler, None, None]:
+    yield profiling.start()
+    profiling.stop()
+
+
+def test_phase_without_profiler():
+    assert not profiling.is_active()
+
+    with profiling.phase("log fetch"):
+        cmd.run(["git", "--version"])
+
+
+def test_phases_and_subprocesses(profiler: profiling.Profiler):
+    with profiling.phase("tag fetch"):
+        cmd.run(["git", "--version"])
+        with profiling.phase("nested"):
+            cmd.run(["git", "-c", "a.b=c", "--version"])
+    with profiling.phase("tag fetch"):
+        pass
+    cmd.run(["git", "--version"])
+
+    assert [(event.name, event.category) for event in profiler.events] == [
+        ("git", "subprocess"),
+        ("git", "subprocess"),
+        ("nested", "phase"),
+        ("tag fetch", "phase"),
+        ("tag fetch", "phase"),
+        ("git", "subprocess"),
+    ]
+    assert profiler.subprocess_counts == {"tag fetch": 1, "nested": 1}
+
+    rows = [row.split() for row in profiler.summary().splitlines()]
+    assert rows[0] == ["phase", "calls", "time", "(ms)", "subprocesses"]
+    assert [row[:2] for row in rows[1:-1]] == [
+        ["tag", "fetch"],
+        ["nested", "1"],
+        ["$", "git"],
+    ]
+    assert rows[1][2] == "2"
+    assert rows[-1][0] == "total"
+    assert rows[-1][-1] == "3"
+
+
+def test_write_chrome_trace(profiler: profiling.Profiler, tmp_path: Path):
+    with profiling.phase("render"):
+        pass
+    trace_file = tmp_path / "trace.json"
+
+    profiler.write_chrome_trace(str(trace_file))
+
+    [event] = json.loads(trace_file.read_text())["traceEvents"]
+    assert event["name"] == "render"
+    assert event["cat"] == "phase"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert "args" not in event
+
+
+def test_memory_peaks():
+    profiler = profiling.start(memory=True)
+    try:
+        with profiling.phase("outer"):
+            outer = bytearray(1_000_000)
+            with profiling.phase("inner"):
+                inner = bytearray(2_000_000)
+                del inner
+            del outer
+        with profiling.phase("render"):
+            pass
+        summary = profiler.summary()
+    finally:
+        profiling.stop()
+
+    peaks = {event.name: event.memory_peak or 0 for event in profiler.events}
+    assert 2_000_000 <= peaks["inner"] < 3_000_000
+    # The peak of a phase includes the peaks of the phases it contains
+    assert peaks["outer"] >= 3_000_000
+    assert peaks["render"] < 1_000_000
+    assert profiler.memory_peak is not None
+    assert profiler.memory_peak >= 3_000_000
+    assert not tracemalloc.is_tracing()
+    rows = [row.split() for row in summary.splitlines()]
+    assert rows[0][-3:] == ["peak", "memory", "(KiB)"]
+    assert int(rows[1][-1].replace(",", "")) >= 2_900
+
+
+def test_memory_not_traced(profiler: profiling.Profiler):
+    with profiling.phase("render"):
+        pass
+
+    assert profiler.events[0].memory_peak is None
+    assert "memory" not in profiler.summary()
+
+
+@pytest.mark.parametrize(
+    ("command", "name"),
+    [
+        (["git", "log", "--pretty=%H"], "git log"),
+        (["git", "-c", "log.showSignature=False", "log"], "git log"),
+        (["/usr/bin/git", "-C", "repo", "--no-pager", "tag"], "git tag"),
+        (["git", "--version"], "git"),
+        ("./scripts/hook.sh --flag", "hook.sh"),
+        ([], ""),
+    ],
+)
+def test_subprocess_name(command: str | list[str], name: str):
+    assert profiling._get_subprocess_name(command) == name
+
+
+@pytest.mark.parametrize(
+    ("value", "enabled"),
+    [("", False), ("0", False), ("false", False), ("1", True), ("yes", True)],
+)
+def test_is_enabled_by_env(monkeypatch: pytest.MonkeyPatch, value: str, enabled: bool):
+    monkeypatch.setenv("CZ_PROFILE", value)
+
+    assert profiling.is_enabled_by_env() is enabled
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+from glob import glob
+from typing import TYPE_CHECKING
+
+import pytest
+
+from commitizen import cmd
+from commitizen.tracked_files import TrackedFiles
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FILES = [
+    ".hidden/pyproject.toml",
+    "package.json",
+    "packages/a/.version",
+    "packages/a/pyproject.toml",
+    "packages/b/pyproject.toml",
+    "packages/b/nested/pyproject.toml",
+    "packages/c[1]/pyproject.toml",
+    "src/__version__.py",
+]
+
+
+@pytest.fixture
+def work_tree(tmp_git_project: Path) -> Path:
+    for file in FILES:
+        path = tmp_git_project / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    cmd.run(["git", "add", "."])
+    return tmp_git_project
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*.json",
+        "*",
+        ".*/*.toml",
+        "packages/*/pyproject.toml",
+        "packages/**/pyproject.toml",
+        "packages/*/.*",
+        "packages/*/*",
+        "packages/[ab]/pyproject.toml",
+        "packages/[!a]/pyproject.toml",
+        "packages/c[[]1]/pyproject.toml",
+        "packages/?/pyproject.toml",
+        "src/__version__.py",
+        "src/missing.py",
+        "./src/*.py",
+    ],
+)
+def test_glob_like_iglob(work_tree: Path, pattern: str):
+    tracked_files = TrackedFiles.from_git(work_tree)
+
+    expected = sorted(path for path in glob(pattern) if os.path.isfile(path))
+    assert sorted(tracked_files.glob(pattern) or []) == expected
+
+
+def test_glob_from_subdirectory(work_tree: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(work_tree / "packages")
+    tracked_files = TrackedFiles.from_git(work_tree)
+
+    assert sorted(tracked_files.glob("*/pyproject.toml") or []) == [
+        "a/pyproject.toml",
+        "b/pyproject.toml",
+        "c[1]/pyproject.toml",
+    ]
+    assert tracked_files.glob("../*.json") == ["../package.json"]
+
+
+def test_glob_absolute_pattern(work_tree: Path):
+    tracked_files = TrackedFiles.from_git(work_tree)
+
+    assert tracked_files.glob(f"{work_tree}/src/*.py") == [
+        os.path.join(work_tree, "src", "__version__.py")
+    ]
+
+
+def test_glob_outside_work_tree(work_tree: Path):
+    tracked_files = TrackedFiles.from_git(work_tree)
+
+    assert tracked_files.glob(f"{work_tree.parent}/*/package.json") is None
+
+
+def test_glob_ignores_untracked_files(work_tree: Path):
+    (work_tree / "packages" / "d").mkdir()
+    (work_tree / "packages" / "d" / "pyproject.toml").touch()
+    (work_tree / ".gitignore").write_text("ignored/\n")
+    (work_tree / "ignored").mkdir()
+    (work_tree / "ignored" / "package.json").touch()
+
+    tracked = TrackedFiles.from_git(work_tree)
+    untracked = TrackedFiles.from_git(work_tree, include_untracked=True)
+
+    assert "packages/d/pyproject.toml" not in (
+        tracked.glob("packages/*/pyproject.toml") or []
+    )
+    assert "packages/d/pyproject.toml" in (
+        untracked.glob("packages/*/pyproject.toml") or []
+    )
+    assert untracked.glob("*/package.json") == []
+
+
+def test_glob_skips_deleted_files(work_tree: Path):
+    (work_tree / "packages" / "b" / "pyproject.toml").unlink()
+    tracked_files = TrackedFiles.from_git(work_tree)
+
+    assert tracked_files.glob("packages/*/pyproject.toml") == [
+        "packages/a/pyproject.toml",
+        "packages/c[1]/pyproject.toml",
+    ]